@@ -0,0 +1,57 @@
+// SPDX-License-Identifier: MIT
+
+pragma solidity >0.6.0;
+
+import "@openzeppelin/contracts/GSN/Context.sol";
+
+/**
+ * @notice Ownable with the owner set by an initializer instead of the constructor,
+ * so it can be used by minimal proxy clones which don't run constructors
+ * @dev Same interface as OpenZeppelin Ownable
+ */
+contract InitializableOwnable is Context {
+    address private _owner;
+
+    event OwnershipTransferred(address indexed previousOwner, address indexed newOwner);
+
+    /**
+     * @dev Setting the first owner, can be called only once
+     * @param _newOwner Address of the owner
+     */
+    function _initOwner(address _newOwner) internal {
+        require(_owner == address(0), "Ownable: owner is already set");
+        require(_newOwner != address(0), "Ownable: new owner is the zero address");
+        _owner = _newOwner;
+        emit OwnershipTransferred(address(0), _newOwner);
+    }
+
+    /**
+     * @notice Get the address of the current owner
+     */
+    function owner() public view returns (address) {
+        return _owner;
+    }
+
+    modifier onlyOwner() {
+        require(_owner == _msgSender(), "Ownable: caller is not the owner");
+        _;
+    }
+
+    /**
+     * @notice Leaves the contract without owner, it will not be possible to call onlyOwner functions anymore
+     */
+    function renounceOwnership() public virtual onlyOwner {
+        emit OwnershipTransferred(_owner, address(0));
+        _owner = address(0);
+    }
+
+    /**
+     * @notice Transfers ownership of the contract to a new account
+     * @param newOwner Address of the new owner
+     */
+    function transferOwnership(address newOwner) public virtual onlyOwner {
+        require(newOwner != address(0), "Ownable: new owner is the zero address");
+        emit OwnershipTransferred(_owner, newOwner);
+        _owner = newOwner;
+    }
+}
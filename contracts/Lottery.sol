@@ -4,46 +4,58 @@ pragma solidity >0.6.0;
 
 import "@openzeppelin/contracts/token/ERC20/IERC20.sol";
 import "@openzeppelin/contracts/math/SafeMath.sol";
-import "@openzeppelin/contracts/access/Ownable.sol";
+import "./InitializableOwnable.sol";
 
-contract Lottery is IERC20, Ownable {
+contract Lottery is IERC20, InitializableOwnable {
     using SafeMath for uint256;
 
     /// @notice EIP-20 token name for buying lottery tickets: 1 TLC = 0.01 ETH
-    string public name = "TrueLotteryCoin";
+    string public constant name = "TrueLotteryCoin";
 
     /// @notice EIP-20 token symbol for this token
-    string public symbol = "TLC";
+    string public constant symbol = "TLC";
 
     /// @notice EIP-20 token decimals for this token
-    uint8 public decimals = 18;
+    uint8 public constant decimals = 18;
+
+    /// @notice The EIP-712 typehash for the contract's domain
+    bytes32 public constant DOMAIN_TYPEHASH = keccak256("EIP712Domain(string name,string version,uint256 chainId,address verifyingContract)");
+
+    /// @notice The EIP-712 typehash for the permit struct used by the contract
+    bytes32 public constant PERMIT_TYPEHASH = keccak256("Permit(address owner,address spender,uint256 value,uint256 nonce,uint256 deadline)");
 
     /// @notice Total balances of tokens among the players
-    uint256 public override totalSupply = 0;
+    uint256 public override totalSupply;
+
+    /// @dev Whether the owner and the default pool are set, clones are initialized by LotteryFactory
+    bool private initialized;
 
     /// @notice One token ETH price
-    uint256 public tokenPrice = 100;  // 1 Ether = 100 Tokens
+    uint256 public constant tokenPrice = 100;  // 1 Ether = 100 Tokens
 
-    /// @notice Purchase tickets stage in seconds (after this time only one purchasing is allowed)
-    uint256 public lotteryPurchaseStage = 3600;              // 1 hour
+    /// @notice Purchase tickets stage of the default pool in seconds (after this time purchasing is allowed only while less than 2 tickets were bought)
+    uint256 public constant lotteryPurchaseStage = 3600;     // 1 hour
+
+    /// @notice Id of the pool created on deployment, it is used by the functions without a pool id
+    uint256 public constant defaultPoolId = 0;
 
     /// @notice Allowed number of tickets purchased at a time
-    uint256 public maxTicketsAmountPerTime = 200;
+    uint256 public constant maxTicketsAmountPerTime = 10000;
 
-    /// @dev Counter for lottery IDs 
+    /// @dev Counter for lottery IDs, shared by all pools
     uint256 private lotteryIdCounter = 0;
 
-    /// @dev Counter for lottery tickets
-    uint256 private ticketsCounter = 0;
-
 
-    /// @dev Owners of TrueLotteryCoin
+    /// @dev Registered owners of TrueLotteryCoin: depositors and accounts registered with registerOwner
     address[] public owners;
     mapping (address => bool) public isOwner;
  
     /// @dev Allowance amounts on behalf of others
     mapping(address => mapping(address => uint256)) internal allowances;
 
+    /// @notice A record of states for signing / validating permit signatures
+    mapping(address => uint256) public nonces;
+
     /// @dev Owners' balances of TrueLotteryCoin
     mapping(address => uint256) internal balances;
 
@@ -55,18 +67,36 @@ contract Lottery is IERC20, Ownable {
         Completed               // The lottery has been closed and the numbers drawn
     }
 
-    /// @notice Info about lottery
+    /// @notice Info about lottery, packed in two storage slots
     struct LotteryInfo {
-        uint256 lotteryID;                                    // ID for lotto
-        Status lotteryStatus;                                 // Current status of lottery
-        uint256 startingTimestamp;                            // Block timestamp for start of purchase stage
-        uint256 closingTimestamp;                             // Block timestamp for end of purchase stage
-        uint256 prizePoolInTokens;                            // The amount of TLC for prize money
+        Status lotteryStatus;                                 // Stored status of lottery, the Closed status is derived from the timestamps until it is stored
         address winner;                                       // Winner of lottery
+        uint64 startingTimestamp;                             // Block timestamp for start of purchase stage
+        uint16 poolId;                                        // Pool of lottery
+        uint64 closingTimestamp;                              // Block timestamp for end of purchase stage
+        uint96 prizePoolInTokens;                             // The amount of TLC for prize money, equals the number of purchased tickets multiplied by the ticket price
+        uint96 winningTicket;                                 // Number of winning ticket, drawn on completing of lottery
+    }
+
+    /// @notice Settings and current round of a lottery pool, packed in one storage slot
+    struct PoolInfo {
+        uint32 purchaseStage;                                 // Purchase tickets stage in seconds
+        uint96 ticketPrice;                                   // Price of one ticket in TLC
+        uint64 currentLotteryId;                              // Last started lottery of the pool
+        uint64 previousLotteryId;                             // Lottery of the pool started before the current one
     }
 
-    /// @dev Purcased tickets among all players
-    mapping(uint256 => address) private tickets;
+    /// @notice Lottery pools, every pool runs its own rounds independently of the others
+    PoolInfo[] public pools;
+
+    /// @notice One purchase in the ticket ledger, it covers tickets from the previous purchase's upper bound up to its own
+    struct TicketsPurchase {
+        address player;                                       // Owner of the purchased tickets
+        uint96 upperBound;                                    // Total number of tickets in lottery after this purchase (exclusive bound)
+    }
+
+    /// @dev LotteryID => Ticket ledger, one entry per purchase in order of purchasing
+    mapping(uint256 => TicketsPurchase[]) private lotteryIdPurchases;
 
     /// @dev LotteryID => Player address => Amount of tickets
     mapping(uint256 => mapping(address => uint256)) internal lotteryIdPlayerTicketAmount;
@@ -77,42 +107,74 @@ contract Lottery is IERC20, Ownable {
     /// @notice Lottery ID's to info about all loterries
     mapping(uint256 => LotteryInfo) public allLotteries;
 
+    /// @notice Lifetime statistics of a player in all pools, a purchase updates only the first storage slot
+    struct PlayerStats {
+        uint64 totalTickets;                                  // Tickets purchased in all lotteries
+        uint32 roundsPlayed;                                  // Lotteries with purchased tickets
+        uint32 wins;                                          // Won lotteries
+        uint64 lastLotteryId;                                 // Last lottery with purchased tickets
+        uint96 totalWinnings;                                 // TLC won in all lotteries without the commission
+    }
+
+    /// @dev Player address => Lifetime statistics
+    mapping(address => PlayerStats) private playerStats;
+
+    /// @notice Order to buy the same tickets in the next rounds of a pool, paid in advance, packed in one storage slot
+    struct StandingOrder {
+        uint32 ticketsPerRound;                               // Tickets bought in every round
+        uint32 roundsLeft;                                    // Rounds the order still has to enter
+        uint64 lastLotteryId;                                 // Last lottery entered by the order
+        uint96 escrow;                                        // TLC paid for the rounds left
+    }
+
+    /// @dev PoolID => Player address => Standing order
+    mapping(uint256 => mapping(address => StandingOrder)) private standingOrders;
+
 
     /// @notice The standard EIP-20 transfer event
     event Transfer(address indexed from, address indexed to, uint256 amount);
 
     /// @notice An event thats emitted when someone deposits ether
-    event Deposit(address owner, uint256 value);
+    event Deposit(address indexed owner, uint256 value);
 
     /// @notice The standard EIP-20 approval event
     event Approval(address indexed owner, address indexed spender, uint256 amount);
 
     /// @notice An event thats emitted when owner receives tokens
-    event MintTokens(address receiver, uint256 value);
+    event MintTokens(address indexed receiver, uint256 value);
 
     /// @notice An event thats emitted when owner loses tokens
-    event BurnTokens(address owner, uint256 value);
+    event BurnTokens(address indexed owner, uint256 value);
 
     /// @notice An event of adding the new owner of tokens
-    event NewOwner(address new_owner);
+    event NewOwner(address indexed new_owner);
 
     /// @notice An event of purchasing playing tickets by some owner of tokens
-    event PurchasingTickets(address player, uint256 value);
+    event PurchasingTickets(address indexed player, uint256 indexed lotteryId, uint256 indexed poolId, uint256 value);
 
     /// @notice An event of some player's victory
-    event Winning(address winner, uint256 value);
+    event Winning(address indexed winner, uint256 indexed lotteryId, uint256 value);
+
+    /// @notice An event of creating new lottery pool
+    event CreatingPool(uint256 indexed poolId, uint256 purchaseStage, uint256 ticketPrice);
 
     /// @notice An event of opening new lottery
-    event OpeningLottery(uint256 lotteryId);
+    event OpeningLottery(uint256 indexed lotteryId, uint256 indexed poolId);
 
     /// @notice An event of closing of purchase stage
-    event ClosingLottery(uint256 lotteryId);
+    event ClosingLottery(uint256 indexed lotteryId, uint256 indexed poolId);
 
     /// @notice An event of completing lottery
-    event CompletingLottery(uint256 lotteryId);
+    event CompletingLottery(uint256 indexed lotteryId, uint256 indexed poolId);
 
     /// @notice An event of withdrawing ETH
-    event Withdraw(uint256 amount);
+    event Withdraw(address indexed owner, uint256 amount);
+
+    /// @notice An event of placing a standing order to buy tickets in the next rounds
+    event PlacingStandingOrder(address indexed player, uint256 indexed poolId, uint256 ticketsPerRound, uint256 rounds);
+
+    /// @notice An event of canceling a standing order, the TLC paid for the rounds left are returned
+    event CancelingStandingOrder(address indexed player, uint256 indexed poolId, uint256 refund);
 
 
     //-------------------------------------------------------------------------
@@ -149,6 +211,40 @@ contract Lottery is IERC20, Ownable {
         emit Approval(owner, spender, amount);
     }
 
+    /**
+     * @notice Approve `spender` to transfer up to `value` from `owner` by the owner's signature instead of a transaction (EIP-2612)
+     * @dev Anyone can submit the signature, e.g. the spender in the same transaction as transferFrom
+     * @param owner The address of the account holding the funds
+     * @param spender The address of the account which may transfer tokens
+     * @param value The number of tokens that are approved
+     * @param deadline The time at which the signature expires
+     * @param v The recovery byte of the signature
+     * @param r Half of the ECDSA signature pair
+     * @param s Half of the ECDSA signature pair
+     */
+    function permit(address owner, address spender, uint256 value, uint256 deadline, uint8 v, bytes32 r, bytes32 s) external {
+        require(block.timestamp <= deadline, "Lottery::permit: signature expired");
+        // signatures with the upper half 's' are rejected, otherwise every signature would have a second valid form
+        require(uint256(s) <= 0x7FFFFFFFFFFFFFFFFFFFFFFFFFFFFFFF5D576E7357A4501DDFE92F46681B20A0, "Lottery::permit: invalid signature");
+
+        bytes32 structHash = keccak256(abi.encode(PERMIT_TYPEHASH, owner, spender, value, nonces[owner]++, deadline));
+        bytes32 digest = keccak256(abi.encodePacked("\x19\x01", DOMAIN_SEPARATOR(), structHash));
+        address signatory = ecrecover(digest, v, r, s);
+        require(signatory != address(0) && signatory == owner, "Lottery::permit: invalid signature");
+
+        _approve(owner, spender, value);
+    }
+
+    /**
+     * @notice The EIP-712 domain separator of the token
+     * @dev Computed on every call, because every clone has its own address and the chain id changes after a fork
+     */
+    function DOMAIN_SEPARATOR() public view returns (bytes32) {
+        uint256 chainId;
+        assembly { chainId := chainid() }
+        return keccak256(abi.encode(DOMAIN_TYPEHASH, keccak256(bytes(name)), keccak256(bytes("1")), chainId, address(this)));
+    }
+
     /**
      * @notice Get the number of tokens held by the `account`
      * @param account The address of the account to get the balance of
@@ -165,7 +261,6 @@ contract Lottery is IERC20, Ownable {
      * @return Whether or not the transfer succeeded
      */
     function transfer(address recipient, uint256 amount) public virtual override returns (bool) {
-        require(isOwner[msg.sender]);
         _transfer(_msgSender(), recipient, amount);
         return true;
     }
@@ -191,11 +286,6 @@ contract Lottery is IERC20, Ownable {
         require(sender != address(0), "ERC20: transfer from the zero address");
         require(recipient != address(0), "ERC20: transfer to the zero address");
 
-        if (!isOwner[recipient]) {
-            isOwner[recipient] = true;
-            owners.push(recipient);
-            emit NewOwner(recipient);
-        }
         uint256 senderBalance = balances[sender];
         require(senderBalance >= amount, "ERC20: transfer amount exceeds balance");
         balances[sender] = senderBalance - amount;
@@ -204,16 +294,86 @@ contract Lottery is IERC20, Ownable {
         emit Transfer(sender, recipient, amount);
     }
 
+    /**
+     * @notice Transfer `amounts` tokens from `msg.sender` to every account of `recipients`
+     * @param recipients The addresses of the destination accounts
+     * @param amounts The numbers of tokens to transfer to every account
+     * @return Whether or not the transfers succeeded
+     */
+    function batchTransfer(address[] calldata recipients, uint256[] calldata amounts) external returns (bool) {
+        _batchTransfer(_msgSender(), recipients, amounts);
+        return true;
+    }
+
+    /**
+     * @notice Transfer `amounts` tokens from `src` to every account of `recipients`
+     * @param sender The address of the source account
+     * @param recipients The addresses of the destination accounts
+     * @param amounts The numbers of tokens to transfer to every account
+     * @return Whether or not the transfers succeeded
+     */
+    function batchTransferFrom(address sender, address[] calldata recipients, uint256[] calldata amounts) external returns (bool) {
+        uint256 total = _batchTransfer(sender, recipients, amounts);
+
+        uint256 currentAllowance = allowances[sender][_msgSender()];
+        require(currentAllowance >= total, "ERC20: transfer amount exceeds allowance");
+        _approve(sender, _msgSender(), currentAllowance - total);
+
+        return true;
+    }
+
+    /**
+     * @dev Debits the sender's balance once for the total of all transfers
+     * @return total The number of transferred tokens
+     */
+    function _batchTransfer(address sender, address[] calldata recipients, uint256[] calldata amounts) internal returns (uint256 total) {
+        require(sender != address(0), "ERC20: transfer from the zero address");
+        require(recipients.length == amounts.length, "Lottery::batchTransfer: recipients and amounts have different lengths");
+
+        uint256 senderBalance = balances[sender];
+        // transfers to the sender itself don't change its balance
+        uint256 selfTransfers = 0;
+        for (uint256 i = 0; i < recipients.length; i++) {
+            address recipient = recipients[i];
+            uint256 amount = amounts[i];
+            require(recipient != address(0), "ERC20: transfer to the zero address");
+
+            total = total.add(amount);
+            if (recipient == sender) {
+                selfTransfers += amount;
+            }
+            else {
+                balances[recipient] += amount;
+            }
+            emit Transfer(sender, recipient, amount);
+        }
+
+        require(senderBalance >= total, "ERC20: transfer amount exceeds balance");
+        balances[sender] = senderBalance - (total - selfTransfers);
+    }
+
     //-------------------------------------------------------------------------
     // STATE MODIFYING FUNCTIONS
     //-------------------------------------------------------------------------
 
     /**
-     * @dev Initializing owner of the contract for accumulations of commissions
+     * @dev Initializing the lottery deployed without a factory, it also locks the implementation of clones
      */
     constructor() public {
-        isOwner[msg.sender] = true;
-        owners.push(msg.sender);
+        initialize(msg.sender);
+    }
+
+    /**
+     * @notice Initializing owner of the contract for accumulations of commissions and the default pool
+     * @dev Replaces the constructor for minimal proxy clones, can be called only once
+     * @param _lotteryOwner Owner of the contract
+     */
+    function initialize(address _lotteryOwner) public {
+        require(!initialized, "Lottery::initialize: lottery is already initialized");
+        initialized = true;
+        _initOwner(_lotteryOwner);
+        _registerOwner(_lotteryOwner);
+        _createPool(lotteryPurchaseStage, 1);
     }
 
     /**
@@ -224,95 +384,284 @@ contract Lottery is IERC20, Ownable {
         uint256 new_tokens = msg.value.mul(tokenPrice).div(1 ether);
         require(new_tokens > 0, "Lottery::deposit: you don't have enough ether to buy at least 1 TLC, 1 TLC = 0.01 ETH");
         if (!isOwner[msg.sender]) {
-            isOwner[msg.sender] = true;
-            owners.push(msg.sender);
-            balances[msg.sender] = 0;
-            emit NewOwner(msg.sender);
+            _registerOwner(msg.sender);
         }
         _mint(msg.sender, new_tokens);
         emit Deposit(msg.sender, msg.value);
+        _applyStandingOrder(defaultPoolId, msg.sender);
+    }
+
+    /**
+     * @notice Adding an account with TLC to the list of owners, so it can be found with getOwnersPage
+     * @dev Accounts which received TLC only by transfers are not registered automatically
+     * @param _account Owner's account of the TrueLotteryCoin
+     */
+    function registerOwner(address _account) external {
+        require(!isOwner[_account], "Lottery::registerOwner: account is already registered");
+        require(balances[_account] > 0, "Lottery::registerOwner: account doesn't have TLC");
+        _registerOwner(_account);
     }
 
     /**
-     * @notice Starting a new lottery by the owner of the contract
-     * @dev Initializing new alllotteries[lotteryIdCounter]
+     * @notice Creating a new lottery pool by the owner of the contract
+     * @param _purchaseStage Purchase tickets stage in seconds
+     * @param _ticketPrice Price of one ticket in TLC
+     * @return Id of the new pool
      */
-    function startLottery() external onlyOwner() {
-        if (lotteryIdCounter != 0) {
-            require(allLotteries[lotteryIdCounter].lotteryStatus == Status.Completed, "Lottery::startLottery: wait until this lottery is closed");
+    function createPool(uint256 _purchaseStage, uint256 _ticketPrice) external onlyOwner() returns (uint256) {
+        return _createPool(_purchaseStage, _ticketPrice);
+    }
+
+    /**
+     * @notice Starting a new lottery in the default pool by the owner of the contract
+     */
+    function startLottery() external {
+        startLotteryInPool(defaultPoolId);
+    }
+
+    /**
+     * @notice Starting a new lottery in the '_poolId' pool by the owner of the contract
+     * @dev Initializing new allLotteries[lotteryIdCounter] for the pool
+     * @param _poolId Id of the pool
+     */
+    function startLotteryInPool(uint256 _poolId) public onlyOwner() {
+        PoolInfo storage pool = _getPool(_poolId);
+        uint256 currentLotteryId = pool.currentLotteryId;
+        if (currentLotteryId != 0) {
+            require(allLotteries[currentLotteryId].lotteryStatus == Status.Completed, "Lottery::startLottery: wait until this lottery is closed");
         }
-        // Incrementing lottery ID 
-        lotteryIdCounter = lotteryIdCounter.add(1);
-        ticketsCounter = 0;
-        uint256 lotteryId = lotteryIdCounter;
-        Status lotteryStatus = Status.PurchaseTickets;
-        uint256 startingTimestamp = block.timestamp;
-        uint256 closingTimestamp = 0;
-        uint256 prizePoolInTokens = 0;
-        address winner = address(0);
-        LotteryInfo memory newLottery = LotteryInfo(
-            lotteryId,
-            lotteryStatus,
-            startingTimestamp,
-            closingTimestamp,
-            prizePoolInTokens,
-            winner
+        // Incrementing lottery ID
+        uint256 lotteryId = lotteryIdCounter.add(1);
+        lotteryIdCounter = lotteryId;
+        pool.previousLotteryId = uint64(currentLotteryId);
+        pool.currentLotteryId = uint64(lotteryId);
+        allLotteries[lotteryId] = LotteryInfo(
+            Status.PurchaseTickets,
+            address(0),
+            uint64(block.timestamp),
+            uint16(_poolId),
+            0,
+            0,
+            0
         );
-        allLotteries[lotteryId] = newLottery;
-        emit OpeningLottery(lotteryId);
+        emit OpeningLottery(lotteryId, _poolId);
     }
 
     /**
-     * @notice Purchasing lottery tickets for TLC: 1 TLC = 1 Lottery Ticket, not more than 200 tickets per one time
-     * @dev Adding '_amount' tickets to msg.sender
+     * @notice Purchasing lottery tickets of the default pool for TLC: 1 TLC = 1 Lottery Ticket, not more than 10000 tickets per one time
      * @param _amount Amount of purchasing tickets by the owner
      */
     function buyTickets(uint256 _amount) external {
-        require(isOwner[msg.sender], "Lottery::buyTickets: you need to purchase TLC for buying tickets, 1 TLC = 0.01 Ether");
-        require(balanceOf(msg.sender) >= _amount, "Lottery::buyTickets: you don't have enough TLC on your balance");
-        require(lotteryIdCounter != 0, "Lottery::buyTickets: Lottery hasn't started yet");
-        require(allLotteries[lotteryIdCounter].lotteryStatus == Status.PurchaseTickets, "Lottery::buyTickets: Purchase stage of lottery is closed, wait for next lottery");
-        require(_amount <= maxTicketsAmountPerTime, "Lottery::buyTickers: it is not possible to buy more than 200 tickets per one time");
+        buyTicketsInPool(defaultPoolId, _amount);
+    }
 
-        uint256 initial_value = ticketsCounter;
-        ticketsCounter = ticketsCounter.add(_amount);
+    /**
+     * @notice Purchasing lottery tickets of the '_poolId' pool for TLC at the pool's ticket price, not more than 10000 tickets per one time
+     * @dev Adding '_amount' tickets to msg.sender
+     * @param _poolId Id of the pool
+     * @param _amount Amount of purchasing tickets by the owner
+     */
+    function buyTicketsInPool(uint256 _poolId, uint256 _amount) public {
+        _applyStandingOrder(_poolId, msg.sender);
+        uint256 cost = _purchaseTickets(_poolId, msg.sender, _amount);
+        require(balances[msg.sender] >= cost, "Lottery::buyTickets: you don't have enough TLC on your balance");
+        _burn(msg.sender, cost);
+    }
+
+    /**
+     * @notice Purchasing lottery tickets of the default pool for ether in one transaction: 1 Lottery Ticket = 0.01 ETH, not more than 10000 tickets per one time
+     * @param _amount Amount of purchasing tickets
+     */
+    function depositAndBuyTickets(uint256 _amount) external payable {
+        depositAndBuyTicketsInPool(defaultPoolId, _amount);
+    }
 
-        for (uint i=initial_value; i<ticketsCounter; i++) {
-            tickets[i] = msg.sender;
+    /**
+     * @notice Purchasing lottery tickets of the '_poolId' pool for ether in one transaction, not more than 10000 tickets per one time
+     * @dev Tickets are paid directly with ether without minting and burning TLC, the rest of ether is credited in TLC
+     * @param _poolId Id of the pool
+     * @param _amount Amount of purchasing tickets
+     */
+    function depositAndBuyTicketsInPool(uint256 _poolId, uint256 _amount) public payable {
+        _applyStandingOrder(_poolId, msg.sender);
+        uint256 new_tokens = msg.value.mul(tokenPrice).div(1 ether);
+        uint256 cost = _purchaseTickets(_poolId, msg.sender, _amount);
+        require(new_tokens >= cost, "Lottery::depositAndBuyTickets: you don't have enough ether to buy this amount of tickets");
+
+        uint256 change = new_tokens - cost;
+        if (change > 0) {
+            if (!isOwner[msg.sender]) {
+                _registerOwner(msg.sender);
+            }
+            _mint(msg.sender, change);
         }
-        if (lotteryIdPlayerTicketAmount[lotteryIdCounter][msg.sender] == 0) {
-            lotteryIdPlayers[lotteryIdCounter].push(msg.sender);
+        emit Deposit(msg.sender, msg.value);
+    }
+
+    /**
+     * @notice Buying '_ticketsPerRound' tickets of the default pool in each of the next '_rounds' rounds, including the current one
+     * @param _ticketsPerRound Amount of tickets bought in every round
+     * @param _rounds Number of rounds
+     */
+    function placeStandingOrder(uint256 _ticketsPerRound, uint256 _rounds) external {
+        placeStandingOrderInPool(defaultPoolId, _ticketsPerRound, _rounds);
+    }
+
+    /**
+     * @notice Buying '_ticketsPerRound' tickets of the '_poolId' pool in each of the next '_rounds' rounds, including the current one
+     * @dev All rounds are paid from the TLC balance at once, the active order of the pool is replaced and its rest is returned.
+     * The order enters a round when the player buys tickets or deposits, or when anyone calls executeStandingOrders
+     * @param _poolId Id of the pool
+     * @param _ticketsPerRound Amount of tickets bought in every round
+     * @param _rounds Number of rounds
+     */
+    function placeStandingOrderInPool(uint256 _poolId, uint256 _ticketsPerRound, uint256 _rounds) public {
+        PoolInfo storage pool = _getPool(_poolId);
+        require(_ticketsPerRound > 0 && _ticketsPerRound <= maxTicketsAmountPerTime, "Lottery::placeStandingOrder: invalid amount of tickets per round");
+        require(_rounds > 0 && _rounds < 2**32, "Lottery::placeStandingOrder: invalid number of rounds");
+        uint256 cost = _ticketsPerRound.mul(_rounds).mul(pool.ticketPrice);
+
+        StandingOrder storage order = standingOrders[_poolId][msg.sender];
+        uint256 refund = order.escrow;
+        if (refund > 0) {
+            _mint(msg.sender, refund);
+            emit CancelingStandingOrder(msg.sender, _poolId, refund);
         }
-        lotteryIdPlayerTicketAmount[lotteryIdCounter][msg.sender] = lotteryIdPlayerTicketAmount[lotteryIdCounter][msg.sender].add(_amount);
+        require(balances[msg.sender] >= cost, "Lottery::placeStandingOrder: you don't have enough TLC on your balance");
+        _burn(msg.sender, cost);
+
+        // the last entered lottery is kept, so a replaced order doesn't enter the same round twice
+        order.ticketsPerRound = uint32(_ticketsPerRound);
+        order.roundsLeft = uint32(_rounds);
+        order.escrow = _toUint96(cost);
+        emit PlacingStandingOrder(msg.sender, _poolId, _ticketsPerRound, _rounds);
+        _applyStandingOrder(_poolId, msg.sender);
+    }
 
-        _burn(msg.sender, _amount);
-        allLotteries[lotteryIdCounter].prizePoolInTokens = allLotteries[lotteryIdCounter].prizePoolInTokens.add(_amount);
+    /**
+     * @notice Canceling the standing order of the default pool, TLC paid for the rounds left are returned
+     */
+    function cancelStandingOrder() external {
+        cancelStandingOrderInPool(defaultPoolId);
+    }
+
+    /**
+     * @notice Canceling the standing order of the '_poolId' pool, TLC paid for the rounds left are returned
+     * @param _poolId Id of the pool
+     */
+    function cancelStandingOrderInPool(uint256 _poolId) public {
+        StandingOrder storage order = standingOrders[_poolId][msg.sender];
+        uint256 refund = order.escrow;
+        require(refund > 0, "Lottery::cancelStandingOrder: there is no active standing order");
+        order.roundsLeft = 0;
+        order.escrow = 0;
+        _mint(msg.sender, refund);
+        emit CancelingStandingOrder(msg.sender, _poolId, refund);
+    }
+
+    /**
+     * @notice Entering the current lottery of the '_poolId' pool with the standing orders of '_players', anyone can call it
+     * @dev Players without an order or already entered by their order are skipped, the caller bounds the loop by the list
+     * @param _poolId Id of the pool
+     * @param _players Players with standing orders, e.g. taken from PlacingStandingOrder events
+     * @return Number of executed orders
+     */
+    function executeStandingOrders(uint256 _poolId, address[] calldata _players) external returns (uint256) {
+        PoolInfo storage pool = _getPool(_poolId);
+        require(_lotteryStatus(allLotteries[pool.currentLotteryId]) == Status.PurchaseTickets, "Lottery::executeStandingOrders: lottery is not in the purchase stage");
+        uint256 executed = 0;
+        for (uint256 i = 0; i < _players.length; i++) {
+            if (_applyStandingOrder(_poolId, _players[i])) {
+                executed++;
+            }
+        }
+        return executed;
+    }
+
+    /**
+     * @notice Closing the lottery of the default pool by the owner of the contract
+     */
+    function closePurchaseStage() external {
+        closePurchaseStageInPool(defaultPoolId);
+    }
 
-        emit PurchasingTickets(msg.sender, _amount);
+    /**
+     * @notice Closing the lottery of the '_poolId' pool by the owner of the contract if the purchase stage has passed and at least 2 tickets were bought
+     * @dev Optional, the lottery is closed by time anyway, this only stores allLotteries[currentLotteryId].lotteryStatus
+     * @param _poolId Id of the pool
+     */
+    function closePurchaseStageInPool(uint256 _poolId) public onlyOwner() {
+        uint256 lotteryId = _getPool(_poolId).currentLotteryId;
+        LotteryInfo storage lottery = allLotteries[lotteryId];
+        require(lottery.lotteryStatus == Status.PurchaseTickets && _lotteryStatus(lottery) == Status.Closed,
+                "purchase stage hasn't passed yet or less than 2 tickets were bought");
+        lottery.lotteryStatus = Status.Closed;
+        emit ClosingLottery(lotteryId, _poolId);
     }
 
     /**
-     * @notice Closing a lottery by the owner of the contract if more than an hour has passed and no transactions have been made after that
-     * @dev Changing allLotteries[lotteryIdCounter].lotteryStatus
+     * @notice Complete the lottery of the default pool by the owner of the contract and pay out the win
      */
-    function closePurchaseStage() external onlyOwner() {
-        require(block.timestamp.sub(allLotteries[lotteryIdCounter].startingTimestamp) > lotteryPurchaseStage
-                && allLotteries[lotteryIdCounter].prizePoolInTokens > 1, "1 hour hasn't passed yet or less than 1 ticket was bought");
-        allLotteries[lotteryIdCounter].lotteryStatus = Status.Closed;
-        emit ClosingLottery(lotteryIdCounter);
+    function completeLottery() external {
+        completeLotteryInPool(defaultPoolId);
     }
 
     /**
-     * @notice Complete a lottery by the owner of the contract when the lottery is closed and pay out the win
+     * @notice Complete the lottery of the '_poolId' pool by the owner of the contract when the lottery is closed and pay out the win
      * @dev Generating random number and transfer prizePoolInTokens to the winner
+     * @param _poolId Id of the pool
      */
-    function completeLottery() external onlyOwner() {
-        require(allLotteries[lotteryIdCounter].lotteryStatus == Status.Closed, "Lottery::buyTickets: it is not possible to close lottery right now");
-        allLotteries[lotteryIdCounter].closingTimestamp = block.timestamp;
-        uint256 winningTicket = _drawWinningNumber();
-        _determiningWinnerAndPayout(winningTicket);
-        allLotteries[lotteryIdCounter].lotteryStatus = Status.Completed;
-        emit CompletingLottery(lotteryIdCounter);
+    function completeLotteryInPool(uint256 _poolId) public onlyOwner() {
+        uint256 lotteryId = _getPool(_poolId).currentLotteryId;
+        LotteryInfo storage lottery = allLotteries[lotteryId];
+        require(_lotteryStatus(lottery) == Status.Closed, "Lottery::buyTickets: it is not possible to close lottery right now");
+        if (lottery.lotteryStatus == Status.PurchaseTickets) {
+            // the purchase stage was closed by time without closePurchaseStage
+            emit ClosingLottery(lotteryId, _poolId);
+        }
+        lottery.closingTimestamp = uint64(block.timestamp);
+        uint256 winningTicket = _drawWinningNumber(_ticketsAmount(lottery));
+        lottery.winningTicket = uint96(winningTicket);
+        _determiningWinnerAndPayout(lotteryId, winningTicket);
+        lottery.lotteryStatus = Status.Completed;
+        emit CompletingLottery(lotteryId, _poolId);
+    }
+
+    /**
+     * @notice Complete the lottery of the default pool by the owner of the contract without paying out the win
+     */
+    function drawLottery() external {
+        drawLotteryInPool(defaultPoolId);
+    }
+
+    /**
+     * @notice Complete the lottery of the '_poolId' pool by the owner of the contract when the lottery is closed without paying out the win
+     * @dev Only the winning ticket is saved, the winner is found and paid in claimPrize
+     * @param _poolId Id of the pool
+     */
+    function drawLotteryInPool(uint256 _poolId) public onlyOwner() {
+        uint256 lotteryId = _getPool(_poolId).currentLotteryId;
+        LotteryInfo storage lottery = allLotteries[lotteryId];
+        require(_lotteryStatus(lottery) == Status.Closed, "Lottery::drawLottery: it is not possible to close lottery right now");
+        if (lottery.lotteryStatus == Status.PurchaseTickets) {
+            // the purchase stage was closed by time without closePurchaseStage
+            emit ClosingLottery(lotteryId, _poolId);
+        }
+        lottery.closingTimestamp = uint64(block.timestamp);
+        lottery.winningTicket = uint96(_drawWinningNumber(_ticketsAmount(lottery)));
+        lottery.lotteryStatus = Status.Completed;
+        emit CompletingLottery(lotteryId, _poolId);
+    }
+
+    /**
+     * @notice Paying out the win of the '_lotteryId' lottery completed by drawLottery, anyone can claim it for the winner
+     * @dev Finding the owner of the winning ticket and transfer prizePoolInTokens to the winner
+     * @param _lotteryId Id of the lottery
+     */
+    function claimPrize(uint256 _lotteryId) external {
+        LotteryInfo storage lottery = allLotteries[_lotteryId];
+        require(lottery.lotteryStatus == Status.Completed && lottery.winner == address(0), "Lottery::claimPrize: there is no unclaimed prize in this lottery");
+        _determiningWinnerAndPayout(_lotteryId, lottery.winningTicket);
     }
 
     /**
@@ -325,7 +674,7 @@ contract Lottery is IERC20, Ownable {
         
         uint256 etherWithdraw = _amount.mul(1 ether).div(tokenPrice);
         msg.sender.transfer(etherWithdraw);
-        emit Withdraw(etherWithdraw);
+        emit Withdraw(msg.sender, etherWithdraw);
         _burn(msg.sender, _amount);
     }
 
@@ -335,26 +684,227 @@ contract Lottery is IERC20, Ownable {
 
     /**
      * @dev Generating random number of winner ticket
+     * @param _ticketsAmount Total number of tickets in lottery
      * @return The number of winner ticket
      */
-    function _drawWinningNumber() internal onlyOwner() returns(uint256) {
-        uint256 winningNumber = uint256(keccak256(abi.encodePacked(block.difficulty, now))) % ticketsCounter;
+    function _drawWinningNumber(uint256 _ticketsAmount) internal view returns(uint256) {
+        uint256 winningNumber = uint256(keccak256(abi.encodePacked(block.difficulty, now))) % _ticketsAmount;
         return winningNumber;
     }
 
     /**
      * @dev Saving the winner and payout of winnings
+     * @param _lotteryId Id of the lottery
      * @param _winningNumber Number of winning ticket in lottery
      */
-    function _determiningWinnerAndPayout(uint256 _winningNumber) internal onlyOwner() {
-        address lotteryWinner = tickets[_winningNumber];
-        allLotteries[lotteryIdCounter].winner = lotteryWinner;
+    function _determiningWinnerAndPayout(uint256 _lotteryId, uint256 _winningNumber) internal {
+        LotteryInfo storage lottery = allLotteries[_lotteryId];
+        address lotteryWinner = _findTicketOwner(_lotteryId, _winningNumber);
+        lottery.winner = lotteryWinner;
+        uint256 prizePool = lottery.prizePoolInTokens;
 
         // commission 1 token to the owner of the contract
-        _mint(lotteryWinner, allLotteries[lotteryIdCounter].prizePoolInTokens.sub(1));
+        _mint(lotteryWinner, prizePool.sub(1));
         _mint(owner(), 1);
 
-        emit Winning(lotteryWinner, allLotteries[lotteryIdCounter].prizePoolInTokens);
+        PlayerStats storage stats = playerStats[lotteryWinner];
+        stats.wins = _toUint32(uint256(stats.wins).add(1));
+        stats.totalWinnings = _toUint96(uint256(stats.totalWinnings).add(prizePool.sub(1)));
+
+        emit Winning(lotteryWinner, _lotteryId, prizePool);
+    }
+
+    /**
+     * @dev Adding '_amount' tickets of the current lottery of the '_poolId' pool to '_player', the tickets must be paid by the caller
+     * @param _poolId Id of the pool
+     * @param _player Address of player
+     * @param _amount Amount of purchasing tickets
+     * @return Price of the tickets in TLC
+     */
+    function _purchaseTickets(uint256 _poolId, address _player, uint256 _amount) internal returns (uint256) {
+        PoolInfo storage pool = _getPool(_poolId);
+        uint256 lotteryId = pool.currentLotteryId;
+        require(lotteryId != 0, "Lottery::buyTickets: Lottery hasn't started yet");
+        LotteryInfo storage lottery = allLotteries[lotteryId];
+        require(_lotteryStatus(lottery) == Status.PurchaseTickets, "Lottery::buyTickets: Purchase stage of lottery is closed, wait for next lottery");
+        require(_amount <= maxTicketsAmountPerTime, "Lottery::buyTickers: it is not possible to buy more than 10000 tickets per one time");
+
+        // every purchased ticket adds the ticket price to the prize pool, so the prize pool divided by the price is the tickets counter
+        uint256 ticketPrice = pool.ticketPrice;
+        uint256 cost = _amount.mul(ticketPrice);
+        uint96 prizePool = _toUint96(uint256(lottery.prizePoolInTokens).add(cost));
+        lottery.prizePoolInTokens = prizePool;
+        lotteryIdPurchases[lotteryId].push(TicketsPurchase(_player, uint96(prizePool / ticketPrice)));
+
+        uint256 playerTickets = lotteryIdPlayerTicketAmount[lotteryId][_player];
+        if (playerTickets == 0) {
+            lotteryIdPlayers[lotteryId].push(_player);
+        }
+        lotteryIdPlayerTicketAmount[lotteryId][_player] = playerTickets.add(_amount);
+
+        // the purchase fields share one slot, so updating the statistics costs one more storage write per purchase
+        PlayerStats storage stats = playerStats[_player];
+        if (playerTickets == 0 && _amount != 0) {
+            stats.roundsPlayed = _toUint32(uint256(stats.roundsPlayed).add(1));
+            stats.lastLotteryId = uint64(lotteryId);
+        }
+        stats.totalTickets = _toUint64(uint256(stats.totalTickets).add(_amount));
+
+        emit PurchasingTickets(_player, lotteryId, _poolId, _amount);
+        return cost;
+    }
+
+    /**
+     * @dev Entering the current lottery of the '_poolId' pool with the standing order of '_player' if the order
+     * hasn't entered it yet and the purchase stage is running, the tickets are paid from the order's escrow
+     * @param _poolId Id of the pool
+     * @param _player Address of player
+     * @return Whether the order entered the lottery
+     */
+    function _applyStandingOrder(uint256 _poolId, address _player) internal returns (bool) {
+        StandingOrder storage order = standingOrders[_poolId][_player];
+        if (order.roundsLeft == 0) {
+            return false;
+        }
+        uint256 lotteryId = pools[_poolId].currentLotteryId;
+        if (lotteryId == 0 || lotteryId == order.lastLotteryId || _lotteryStatus(allLotteries[lotteryId]) != Status.PurchaseTickets) {
+            return false;
+        }
+        uint256 cost = _purchaseTickets(_poolId, _player, order.ticketsPerRound);
+        order.roundsLeft -= 1;
+        order.lastLotteryId = uint64(lotteryId);
+        order.escrow = uint96(uint256(order.escrow).sub(cost));
+        return true;
+    }
+
+    /**
+     * @dev Status of the lottery at the current block: the purchase stage is closed once the pool's purchase stage
+     * has passed and at least 2 tickets were bought, even if the Closed status isn't stored yet
+     * @param _lottery Info about the lottery
+     * @return Status of the lottery
+     */
+    function _lotteryStatus(LotteryInfo storage _lottery) internal view returns (Status) {
+        Status status = _lottery.lotteryStatus;
+        if (status == Status.PurchaseTickets) {
+            PoolInfo storage pool = pools[_lottery.poolId];
+            if (block.timestamp.sub(_lottery.startingTimestamp) > pool.purchaseStage
+                && _lottery.prizePoolInTokens > pool.ticketPrice) {
+                return Status.Closed;
+            }
+        }
+        return status;
+    }
+
+    /**
+     * @dev Number of purchased tickets in the lottery
+     * @param _lottery Info about the lottery
+     * @return Total number of tickets in lottery
+     */
+    function _ticketsAmount(LotteryInfo storage _lottery) internal view returns (uint256) {
+        return uint256(_lottery.prizePoolInTokens).div(pools[_lottery.poolId].ticketPrice);
+    }
+
+    /**
+     * @dev Adding a new pool to the list of pools
+     * @param _purchaseStage Purchase tickets stage in seconds
+     * @param _ticketPrice Price of one ticket in TLC
+     * @return Id of the new pool
+     */
+    function _createPool(uint256 _purchaseStage, uint256 _ticketPrice) internal returns (uint256) {
+        require(_purchaseStage > 0 && _purchaseStage < 2**32, "Lottery::createPool: invalid purchase stage");
+        require(_ticketPrice > 0, "Lottery::createPool: ticket price must be positive");
+        uint256 poolId = pools.length;
+        require(poolId < 2**16, "Lottery::createPool: too many pools");
+        pools.push(PoolInfo(uint32(_purchaseStage), _toUint96(_ticketPrice), 0, 0));
+        emit CreatingPool(poolId, _purchaseStage, _ticketPrice);
+        return poolId;
+    }
+
+    /**
+     * @dev Getting the '_poolId' pool with existence check
+     * @param _poolId Id of the pool
+     * @return The pool
+     */
+    function _getPool(uint256 _poolId) internal view returns (PoolInfo storage) {
+        require(_poolId < pools.length, "Lottery: pool doesn't exist");
+        return pools[_poolId];
+    }
+
+    /**
+     * @dev Binary search of the purchase containing '_ticket' in the ticket ledger of the '_lotteryId' lottery
+     * @param _lotteryId Id of the lottery
+     * @param _ticket Number of the ticket, less than the total number of tickets in lottery
+     * @return The address of the ticket owner
+     */
+    function _findTicketOwner(uint256 _lotteryId, uint256 _ticket) internal view returns (address) {
+        TicketsPurchase[] storage purchases = lotteryIdPurchases[_lotteryId];
+        uint256 low = 0;
+        uint256 high = purchases.length - 1;
+        while (low < high) {
+            uint256 mid = (low + high) / 2;
+            if (purchases[mid].upperBound > _ticket) {
+                high = mid;
+            }
+            else {
+                low = mid + 1;
+            }
+        }
+        return purchases[low].player;
+    }
+
+    /**
+     * @dev Adding '_account' to the list of owners
+     * @param _account Owner's account of the TrueLotteryCoin
+     */
+    function _registerOwner(address _account) internal {
+        isOwner[_account] = true;
+        owners.push(_account);
+        emit NewOwner(_account);
+    }
+
+    /**
+     * @dev Downcasting '_value' to uint32 with overflow check
+     * @param _value Value to downcast
+     * @return The same value as uint32
+     */
+    function _toUint32(uint256 _value) internal pure returns (uint32) {
+        require(_value < 2**32, "Lottery::_toUint32: value doesn't fit in 32 bits");
+        return uint32(_value);
+    }
+
+    /**
+     * @dev Downcasting '_value' to uint64 with overflow check
+     * @param _value Value to downcast
+     * @return The same value as uint64
+     */
+    function _toUint64(uint256 _value) internal pure returns (uint64) {
+        require(_value < 2**64, "Lottery::_toUint64: value doesn't fit in 64 bits");
+        return uint64(_value);
+    }
+
+    /**
+     * @dev Downcasting '_value' to uint96 with overflow check
+     * @param _value Value to downcast
+     * @return The same value as uint96
+     */
+    function _toUint96(uint256 _value) internal pure returns (uint96) {
+        require(_value < 2**96, "Lottery::_toUint96: value doesn't fit in 96 bits");
+        return uint96(_value);
+    }
+
+    /**
+     * @dev Number of items in the page of a list
+     * @param _total Length of the list
+     * @param _offset Index of the first item in the page
+     * @param _limit Maximum number of items in the page
+     * @return Number of items in the page
+     */
+    function _pageSize(uint256 _total, uint256 _offset, uint256 _limit) internal pure returns (uint256) {
+        if (_offset >= _total) {
+            return 0;
+        }
+        uint256 left = _total - _offset;
+        return left < _limit ? left : _limit;
     }
 
     /**
@@ -363,8 +913,6 @@ contract Lottery is IERC20, Ownable {
      * @param _tokens Value of tokens
      */
     function _mint(address _account, uint256 _tokens) internal {
-        require(isOwner[_account], "Lottery::_mint: mint to non-owner");
-
         totalSupply = totalSupply.add(_tokens);
         balances[_account] = balances[_account].add(_tokens);
         emit MintTokens(_account, _tokens);
@@ -376,8 +924,6 @@ contract Lottery is IERC20, Ownable {
      * @param _tokens Value of tokens
      */
     function _burn(address _account, uint256 _tokens) internal {
-        require(isOwner[_account], "Lottery::_burn: burn from non-owner");
-
         totalSupply = totalSupply.sub(_tokens);
         balances[_account] = balances[_account].sub(_tokens);
         emit BurnTokens(_account, _tokens);
@@ -392,7 +938,7 @@ contract Lottery is IERC20, Ownable {
      * @return List of players
      */
     function getAllTicketOwners() public view returns (address[] memory) {
-        return lotteryIdPlayers[lotteryIdCounter];
+        return lotteryIdPlayers[pools[defaultPoolId].currentLotteryId];
     }
 
     /**
@@ -404,13 +950,69 @@ contract Lottery is IERC20, Ownable {
         return lotteryIdPlayers[_lotteryId];
     }
 
+    /**
+     * @notice Get a page of players of the current lottery with their amounts of purchased tickets
+     * @param _offset Index of the first player in the page
+     * @param _limit Maximum number of players in the page
+     * @return players List of players
+     * @return ticketAmounts Amounts of purchased tickets by the players
+     * @return total Number of all players in the lottery
+     */
+    function getTicketOwnersPage(uint256 _offset, uint256 _limit) external view returns (address[] memory players, uint256[] memory ticketAmounts, uint256 total) {
+        return getTicketOwnersPageInLotteryId(pools[defaultPoolId].currentLotteryId, _offset, _limit);
+    }
+
+    /**
+     * @notice Get a page of players of the '_lotteryId' lottery with their amounts of purchased tickets
+     * @param _lotteryId Id of the lottery
+     * @param _offset Index of the first player in the page
+     * @param _limit Maximum number of players in the page
+     * @return players List of players
+     * @return ticketAmounts Amounts of purchased tickets by the players
+     * @return total Number of all players in the lottery
+     */
+    function getTicketOwnersPageInLotteryId(uint256 _lotteryId, uint256 _offset, uint256 _limit) public view returns (address[] memory players, uint256[] memory ticketAmounts, uint256 total) {
+        address[] storage allPlayers = lotteryIdPlayers[_lotteryId];
+        total = allPlayers.length;
+        uint256 size = _pageSize(total, _offset, _limit);
+
+        players = new address[](size);
+        ticketAmounts = new uint256[](size);
+        for (uint256 i = 0; i < size; i++) {
+            address player = allPlayers[_offset + i];
+            players[i] = player;
+            ticketAmounts[i] = lotteryIdPlayerTicketAmount[_lotteryId][player];
+        }
+    }
+
+    /**
+     * @notice Get a page of registered owners of TrueLotteryCoin with their balances
+     * @param _offset Index of the first owner in the page
+     * @param _limit Maximum number of owners in the page
+     * @return accounts List of owners
+     * @return ownerBalances Balances of the owners
+     * @return total Number of all owners
+     */
+    function getOwnersPage(uint256 _offset, uint256 _limit) external view returns (address[] memory accounts, uint256[] memory ownerBalances, uint256 total) {
+        total = owners.length;
+        uint256 size = _pageSize(total, _offset, _limit);
+
+        accounts = new address[](size);
+        ownerBalances = new uint256[](size);
+        for (uint256 i = 0; i < size; i++) {
+            address account = owners[_offset + i];
+            accounts[i] = account;
+            ownerBalances[i] = balances[account];
+        }
+    }
+
     /**
      * @notice Get the number of purchased tickets by '_player' address in the current lottery
      * @param _player Owner's address
      * @return Amount of purchased tickets
      */
     function getAmountOfTickets(address _player) public view returns (uint256) {
-        return lotteryIdPlayerTicketAmount[lotteryIdCounter][_player];
+        return lotteryIdPlayerTicketAmount[pools[defaultPoolId].currentLotteryId][_player];
     }
 
     /**
@@ -424,20 +1026,59 @@ contract Lottery is IERC20, Ownable {
     }
 
     /**
-     * @notice Get the number of total purchased tickets in the current lottery (prize pool in tokens)
+     * @notice Get the standing order of the '_player' address in the '_poolId' pool
+     * @param _player Address of player
+     * @param _poolId Id of the pool
+     * @return ticketsPerRound Tickets bought in every round
+     * @return roundsLeft Rounds the order still has to enter, 0 if there is no active order
+     * @return lastLotteryId Last lottery entered by the order
+     * @return escrow TLC paid for the rounds left
+     */
+    function getStandingOrder(address _player, uint256 _poolId) external view returns (uint256 ticketsPerRound, uint256 roundsLeft, uint256 lastLotteryId, uint256 escrow) {
+        StandingOrder storage order = standingOrders[_poolId][_player];
+        return (order.ticketsPerRound, order.roundsLeft, order.lastLotteryId, order.escrow);
+    }
+
+    /**
+     * @notice Get the lifetime statistics of the '_player' address in all pools
+     * @param _player Address of player
+     * @return totalTickets Tickets purchased in all lotteries
+     * @return roundsPlayed Number of lotteries with purchased tickets
+     * @return wins Number of won lotteries
+     * @return totalWinnings TLC won in all lotteries without the commission
+     * @return lastLotteryId Last lottery with purchased tickets, 0 if the player has never purchased tickets
+     */
+    function getPlayerStats(address _player) external view returns (uint256 totalTickets, uint256 roundsPlayed, uint256 wins, uint256 totalWinnings, uint256 lastLotteryId) {
+        PlayerStats storage stats = playerStats[_player];
+        return (stats.totalTickets, stats.roundsPlayed, stats.wins, stats.totalWinnings, stats.lastLotteryId);
+    }
+
+    /**
+     * @notice Get the number of total purchased tickets in the current lottery
      * @return Amount of total purchased tickets
      */
     function getCurrentTotalPurchasedTickets() public view returns (uint256) {
-        return allLotteries[lotteryIdCounter].prizePoolInTokens;
+        return _ticketsAmount(allLotteries[pools[defaultPoolId].currentLotteryId]);
     }
 
     /**
-     * @notice Get the number of total purchased tickets in the '_lotteryId' lottery (prize pool in tokens)
+     * @notice Get the number of total purchased tickets in the '_lotteryId' lottery
+     * @dev The prize pool divided by the ticket price of the lottery's pool
      * @param _lotteryId Id of the lottery
      * @return Amount of total purchased tickets
      */
     function getTotalPurchasedTicketsInLotteryId(uint256 _lotteryId) public view returns (uint256) {
-        return allLotteries[_lotteryId].prizePoolInTokens;
+        return _ticketsAmount(allLotteries[_lotteryId]);
+    }
+
+    /**
+     * @notice Get the number of purchased tickets by '_player' address in the current lottery of the '_poolId' pool
+     * @param _player Owner's address
+     * @param _poolId Id of the pool
+     * @return Amount of purchased tickets
+     */
+    function getAmountOfTicketsInPool(address _player, uint256 _poolId) public view returns (uint256) {
+        return lotteryIdPlayerTicketAmount[_getPool(_poolId).currentLotteryId][_player];
     }
 
     /**
@@ -446,25 +1087,51 @@ contract Lottery is IERC20, Ownable {
      * @return Chance of winning in percents if more than 0.99
      */
     function getChanceOfWinning(address _player) external view returns (uint256) {
-        uint256 playerTickets = getAmountOfTickets(_player);
+        return getChanceOfWinningInPool(_player, defaultPoolId);
+    }
+
+    /**
+     * @notice Get the chance of winning by the '_player' address in the current lottery of the '_poolId' pool in percents (round down)
+     * @param _player Address of player
+     * @param _poolId Id of the pool
+     * @return Chance of winning in percents if more than 0.99
+     */
+    function getChanceOfWinningInPool(address _player, uint256 _poolId) public view returns (uint256) {
+        uint256 playerTickets = getAmountOfTicketsInPool(_player, _poolId);
         require(playerTickets != 0, "You haven't purchased tickets yet");
-        uint256 totalTickets = getCurrentTotalPurchasedTickets();
+        uint256 totalTickets = _ticketsAmount(allLotteries[pools[_poolId].currentLotteryId]);
         require(totalTickets != 0, "Nobody has purchased tickets yet");
         return playerTickets.mul(100).div(totalTickets);
     }
 
     /**
-     * @notice Get the id of the current lottery
+     * @notice Get the id of the current lottery of the default pool
      */
     function getCurrentLotteryId() public view returns (uint256) {
-        return lotteryIdCounter;
+        return pools[defaultPoolId].currentLotteryId;
+    }
+
+    /**
+     * @notice Get the id of the current lottery of the '_poolId' pool
+     * @param _poolId Id of the pool
+     */
+    function getCurrentLotteryIdInPool(uint256 _poolId) public view returns (uint256) {
+        return _getPool(_poolId).currentLotteryId;
     }
 
     /**
-     * @notice Get the status of the current lottery
+     * @notice Get the status of the current lottery of the default pool
      */
     function getCurrentLotteryStatus() external view returns (string memory) {
-        uint256 curStatus = uint256(allLotteries[lotteryIdCounter].lotteryStatus);
+        return getCurrentLotteryStatusInPool(defaultPoolId);
+    }
+
+    /**
+     * @notice Get the status of the current lottery of the '_poolId' pool
+     * @param _poolId Id of the pool
+     */
+    function getCurrentLotteryStatusInPool(uint256 _poolId) public view returns (string memory) {
+        uint256 curStatus = uint256(_lotteryStatus(allLotteries[getCurrentLotteryIdInPool(_poolId)]));
         if (curStatus == 0) {
             return "NotStarted";
         }
@@ -484,29 +1151,67 @@ contract Lottery is IERC20, Ownable {
      * @param _lotteryId Id of the lottery
      */
     function getLotteryStatus(uint256 _lotteryId) public view returns (Status) {
-        return allLotteries[_lotteryId].lotteryStatus;
+        return _lotteryStatus(allLotteries[_lotteryId]);
     }
 
     /**
-     * @notice Get the winner of the last lottery
+     * @notice Get the winner of the last lottery of the default pool
      * @return The address of previous winner
      */
     function getWinnerOfLottery() public view returns (address) {
-        require(lotteryIdCounter != 0, "It is first lottery");
-        if (allLotteries[lotteryIdCounter].lotteryStatus == Status.Completed) {
-            return allLotteries[lotteryIdCounter].winner;
+        return getWinnerOfLotteryInPool(defaultPoolId);
+    }
+
+    /**
+     * @notice Get the winner of the last completed lottery of the '_poolId' pool
+     * @param _poolId Id of the pool
+     * @return The address of previous winner
+     */
+    function getWinnerOfLotteryInPool(uint256 _poolId) public view returns (address) {
+        PoolInfo storage pool = _getPool(_poolId);
+        uint256 lotteryId = pool.currentLotteryId;
+        require(lotteryId != 0, "It is first lottery");
+        if (allLotteries[lotteryId].lotteryStatus == Status.Completed) {
+            return getWinnerOfLotteryId(lotteryId);
         }
         else {
-            return allLotteries[lotteryIdCounter.sub(1)].winner;
+            return getWinnerOfLotteryId(pool.previousLotteryId);
         }
     }
 
     /**
-     * @notice Get the winner of the '_lotteryId' lottery
+     * @notice Get the winner of the '_lotteryId' lottery, including the winner who hasn't claimed the prize yet
      * @param _lotteryId Id of the lottery
      * @return The address of winner
      */
     function getWinnerOfLotteryId(uint256 _lotteryId) public view returns (address) {
-        return allLotteries[_lotteryId].winner;
+        LotteryInfo storage lottery = allLotteries[_lotteryId];
+        if (lottery.winner == address(0) && lottery.lotteryStatus == Status.Completed) {
+            return _findTicketOwner(_lotteryId, lottery.winningTicket);
+        }
+        return lottery.winner;
+    }
+
+    /**
+     * @notice Check if the prize of the completed '_lotteryId' lottery is paid out
+     * @param _lotteryId Id of the lottery
+     */
+    function isPrizeClaimed(uint256 _lotteryId) external view returns (bool) {
+        return allLotteries[_lotteryId].winner != address(0);
+    }
+
+    /**
+     * @notice Get the pool of the '_lotteryId' lottery
+     * @param _lotteryId Id of the lottery
+     */
+    function getPoolOfLotteryId(uint256 _lotteryId) external view returns (uint256) {
+        return allLotteries[_lotteryId].poolId;
+    }
+
+    /**
+     * @notice Get the number of created pools
+     */
+    function getPoolsCount() external view returns (uint256) {
+        return pools.length;
     }
 }
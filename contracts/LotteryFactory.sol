@@ -0,0 +1,80 @@
+// SPDX-License-Identifier: MIT
+
+pragma solidity >0.6.0;
+
+import "./Lottery.sol";
+
+/**
+ * @notice Deploys new lotteries as EIP-1167 minimal proxies of one implementation,
+ * a clone costs a small fixed amount of gas instead of the whole Lottery bytecode
+ */
+contract LotteryFactory {
+
+    /// @notice Lottery which code is used by all clones
+    Lottery public implementation;
+
+    /// @notice All lotteries created by this factory
+    address[] public lotteries;
+
+    /// @notice An event of creating new lottery
+    event LotteryCreated(address lottery, address owner);
+
+    constructor(Lottery _implementation) public {
+        implementation = _implementation;
+    }
+
+    /**
+     * @notice Creating a new lottery owned by msg.sender
+     * @return The address of the new lottery
+     */
+    function createLottery() external returns (address) {
+        return _createLottery(msg.sender);
+    }
+
+    /**
+     * @notice Creating '_amount' new lotteries owned by msg.sender
+     * @param _amount Number of lotteries
+     * @return instances The addresses of the new lotteries
+     */
+    function createLotteries(uint256 _amount) external returns (address[] memory instances) {
+        instances = new address[](_amount);
+        for (uint256 i = 0; i < _amount; i++) {
+            instances[i] = _createLottery(msg.sender);
+        }
+    }
+
+    /**
+     * @notice Get the number of created lotteries
+     */
+    function getLotteriesCount() external view returns (uint256) {
+        return lotteries.length;
+    }
+
+    /**
+     * @dev Cloning the implementation and initializing the clone in the same transaction
+     * @param _lotteryOwner Owner of the new lottery
+     * @return instance The address of the new lottery
+     */
+    function _createLottery(address _lotteryOwner) internal returns (address instance) {
+        instance = _clone(address(implementation));
+        Lottery(payable(instance)).initialize(_lotteryOwner);
+        lotteries.push(instance);
+        emit LotteryCreated(instance, _lotteryOwner);
+    }
+
+    /**
+     * @dev Deploying the EIP-1167 minimal proxy which delegates all calls to '_target'
+     * @param _target Address of the implementation
+     * @return instance The address of the proxy
+     */
+    function _clone(address _target) internal returns (address instance) {
+        assembly {
+            let ptr := mload(0x40)
+            mstore(ptr, 0x3d602d80600a3d3981f3363d3d373d3d3d363d73000000000000000000000000)
+            mstore(add(ptr, 0x14), shl(0x60, _target))
+            mstore(add(ptr, 0x28), 0x5af43d82803e903d91602b57fd5bf30000000000000000000000000000000000)
+            instance := create(0, ptr, 0x37)
+        }
+        require(instance != address(0), "LotteryFactory::_clone: failed to create the lottery");
+    }
+}
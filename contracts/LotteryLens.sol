@@ -0,0 +1,143 @@
+// SPDX-License-Identifier: MIT
+
+pragma solidity >0.6.0;
+pragma experimental ABIEncoderV2;
+
+import "./Lottery.sol";
+
+/**
+ * @notice Read-only aggregation of the Lottery views, so a whole lottery page can be loaded in one eth_call
+ */
+contract LotteryLens {
+
+    /// @notice Full state of one lottery
+    struct LotterySnapshot {
+        uint256 lotteryId;                                    // ID for lotto
+        uint256 poolId;                                       // Pool of lottery
+        Lottery.Status lotteryStatus;                         // Status of lottery
+        address winner;                                       // Winner of lottery
+        uint256 startingTimestamp;                            // Block timestamp for start of purchase stage
+        uint256 closingTimestamp;                             // Block timestamp for end of purchase stage
+        uint256 prizePoolInTokens;                            // The amount of TLC for prize money
+        bool prizeClaimed;                                    // Whether the prize is paid out to the winner
+        uint256 totalPlayers;                                 // Number of all players in lottery
+        address[] players;                                    // Page of players
+        uint256[] ticketAmounts;                              // Amounts of purchased tickets by the players from the page
+    }
+
+    /// @notice Denominator of the chances of winning returned by getChancesOfWinning
+    uint256 public constant basisPoints = 10000;
+
+    /// @notice The lottery read by this lens
+    Lottery public lottery;
+
+    constructor(Lottery _lottery) public {
+        lottery = _lottery;
+    }
+
+    /**
+     * @notice Get the state of the current lottery
+     * @param _playersOffset Index of the first player in the page of players
+     * @param _playersLimit Maximum number of players in the page of players
+     * @return Snapshot of the lottery
+     */
+    function getCurrentLotterySnapshot(uint256 _playersOffset, uint256 _playersLimit) external view returns (LotterySnapshot memory) {
+        return _snapshot(lottery.getCurrentLotteryId(), _playersOffset, _playersLimit);
+    }
+
+    /**
+     * @notice Get the state of the current lottery of the '_poolId' pool
+     * @param _poolId Id of the pool
+     * @param _playersOffset Index of the first player in the page of players
+     * @param _playersLimit Maximum number of players in the page of players
+     * @return Snapshot of the lottery
+     */
+    function getCurrentLotterySnapshotInPool(uint256 _poolId, uint256 _playersOffset, uint256 _playersLimit) external view returns (LotterySnapshot memory) {
+        return _snapshot(lottery.getCurrentLotteryIdInPool(_poolId), _playersOffset, _playersLimit);
+    }
+
+    /**
+     * @notice Get the state of the '_lotteryId' lottery
+     * @param _lotteryId Id of the lottery
+     * @param _playersOffset Index of the first player in the page of players
+     * @param _playersLimit Maximum number of players in the page of players
+     * @return Snapshot of the lottery
+     */
+    function getLotterySnapshot(uint256 _lotteryId, uint256 _playersOffset, uint256 _playersLimit) external view returns (LotterySnapshot memory) {
+        return _snapshot(_lotteryId, _playersOffset, _playersLimit);
+    }
+
+    /**
+     * @notice Get the states of lotteries from '_fromLotteryId' to '_toLotteryId' inclusive
+     * @param _fromLotteryId Id of the first lottery
+     * @param _toLotteryId Id of the last lottery
+     * @param _playersLimit Maximum number of players returned for every lottery
+     * @return snapshots Snapshots of the lotteries
+     */
+    function getLotterySnapshots(uint256 _fromLotteryId, uint256 _toLotteryId, uint256 _playersLimit) external view returns (LotterySnapshot[] memory snapshots) {
+        require(_fromLotteryId <= _toLotteryId, "LotteryLens::getLotterySnapshots: invalid range of lotteries");
+
+        snapshots = new LotterySnapshot[](_toLotteryId - _fromLotteryId + 1);
+        for (uint256 i = 0; i < snapshots.length; i++) {
+            snapshots[i] = _snapshot(_fromLotteryId + i, 0, _playersLimit);
+        }
+    }
+
+    /**
+     * @notice Get the tickets and the chances of winning of '_players' in the current lottery
+     * @param _players Addresses of players
+     * @return ticketAmounts Amounts of purchased tickets by the players
+     * @return chances Chances of winning in basis points (1/100 of percent), rounded down
+     * @return totalTickets Total number of tickets in lottery
+     */
+    function getCurrentChancesOfWinning(address[] memory _players) external view returns (uint256[] memory ticketAmounts, uint256[] memory chances, uint256 totalTickets) {
+        return _chances(_players, lottery.getCurrentLotteryId());
+    }
+
+    /**
+     * @notice Get the tickets and the chances of winning of '_players' in the '_lotteryId' lottery
+     * @dev Players without tickets get zeros instead of a revert, the exact chance is ticketAmounts[i] / totalTickets
+     * @param _players Addresses of players
+     * @param _lotteryId Id of the lottery
+     * @return ticketAmounts Amounts of purchased tickets by the players
+     * @return chances Chances of winning in basis points (1/100 of percent), rounded down
+     * @return totalTickets Total number of tickets in lottery
+     */
+    function getChancesOfWinning(address[] memory _players, uint256 _lotteryId) external view returns (uint256[] memory ticketAmounts, uint256[] memory chances, uint256 totalTickets) {
+        return _chances(_players, _lotteryId);
+    }
+
+    function _chances(address[] memory _players, uint256 _lotteryId) internal view returns (uint256[] memory ticketAmounts, uint256[] memory chances, uint256 totalTickets) {
+        totalTickets = lottery.getTotalPurchasedTicketsInLotteryId(_lotteryId);
+
+        ticketAmounts = new uint256[](_players.length);
+        chances = new uint256[](_players.length);
+        for (uint256 i = 0; i < _players.length; i++) {
+            uint256 tickets = lottery.getAmountOfTicketsInLotteryId(_players[i], _lotteryId);
+            ticketAmounts[i] = tickets;
+            if (tickets != 0) {
+                chances[i] = tickets * basisPoints / totalTickets;
+            }
+        }
+    }
+
+    function _snapshot(uint256 _lotteryId, uint256 _playersOffset, uint256 _playersLimit) internal view returns (LotterySnapshot memory snapshot) {
+        snapshot.lotteryId = _lotteryId;
+        (
+            ,
+            ,
+            snapshot.startingTimestamp,
+            snapshot.poolId,
+            snapshot.closingTimestamp,
+            snapshot.prizePoolInTokens,
+        ) = lottery.allLotteries(_lotteryId);
+        snapshot.lotteryStatus = lottery.getLotteryStatus(_lotteryId);
+        snapshot.winner = lottery.getWinnerOfLotteryId(_lotteryId);
+        snapshot.prizeClaimed = lottery.isPrizeClaimed(_lotteryId);
+        (
+            snapshot.players,
+            snapshot.ticketAmounts,
+            snapshot.totalPlayers
+        ) = lottery.getTicketOwnersPageInLotteryId(_lotteryId, _playersOffset, _playersLimit);
+    }
+}
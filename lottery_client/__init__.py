@@ -0,0 +1,7 @@
+#!/usr/bin/python3
+
+from lottery_client.cache import DiskCache, LRUCache
+from lottery_client.client import LotteryClient
+from lottery_client.rpc import BatchRPC, RPCError
+
+__all__ = ["BatchRPC", "DiskCache", "LRUCache", "LotteryClient", "RPCError"]
@@ -0,0 +1,149 @@
+#!/usr/bin/python3
+
+from eth_utils import is_address, to_checksum_address
+
+from lottery_client.cache import DiskCache, LRUCache
+from lottery_client.rpc import BatchRPC
+
+# Status.Completed of the contract, nothing of the lottery changes after it
+COMPLETED = 3
+
+# name => (signature, argument types, return types) of the Lottery functions read by the client
+FUNCTIONS = {
+    "status": ("getLotteryStatus(uint256)", ["uint256"], ["uint8"]),
+    "winner": ("getWinnerOfLotteryId(uint256)", ["uint256"], ["address"]),
+    "total_tickets": ("getTotalPurchasedTicketsInLotteryId(uint256)", ["uint256"], ["uint256"]),
+    "tickets": ("getAmountOfTicketsInLotteryId(address,uint256)", ["address", "uint256"], ["uint256"]),
+    "players": ("getAllTicketOwnersInLotteryId(uint256)", ["uint256"], ["address[]"]),
+    "current_lottery_id": ("getCurrentLotteryId()", [], ["uint256"]),
+}
+
+
+class LotteryClient:
+    """
+    Read-only client of a deployed Lottery contract
+
+    Results of completed lotteries (winner, prize pool, players and their tickets) never change, they are kept
+    in a bounded LRU cache and, if `disk_cache` is a path, in a SQLite file shared by restarts. Everything
+    else is read from the node on every call. All calls missing from the cache are sent in one JSON-RPC batch
+    pinned to the latest block, together with the status calls which tell whether the results may be cached.
+    """
+
+    def __init__(self, address, url, cache_size=10000, disk_cache=None, max_batch_size=500):
+        self.address = address
+        self.rpc = BatchRPC(url, max_batch_size=max_batch_size)
+        self.cache = LRUCache(cache_size)
+        self.disk_cache = DiskCache(disk_cache) if disk_cache is not None else None
+        self._prefix = None
+
+    def close(self):
+        self.rpc.close()
+        if self.disk_cache is not None:
+            self.disk_cache.close()
+
+    #-------------------------------------------------------------------------
+    # READS
+    #-------------------------------------------------------------------------
+
+    def status(self, lottery_id):
+        return self.read([("status", lottery_id)])[0]
+
+    def winner(self, lottery_id):
+        return self.read([("winner", lottery_id)])[0]
+
+    def total_tickets(self, lottery_id):
+        return self.read([("total_tickets", lottery_id)])[0]
+
+    def tickets(self, player, lottery_id):
+        return self.read([("tickets", player, lottery_id)])[0]
+
+    def players(self, lottery_id):
+        return self.read([("players", lottery_id)])[0]
+
+    def current_lottery_id(self):
+        return self.read([("current_lottery_id",)])[0]
+
+    def winners(self, lottery_ids):
+        """Winners of many lotteries, one batch for all lotteries missing from the cache"""
+        return self.read([("winner", lottery_id) for lottery_id in lottery_ids])
+
+    def tickets_of(self, player, lottery_ids):
+        """Tickets of `player` in many lotteries, one batch for all lotteries missing from the cache"""
+        return self.read([("tickets", player, lottery_id) for lottery_id in lottery_ids])
+
+    def read(self, calls):
+        """
+        Results of `calls` in the same order, a call is (name of FUNCTIONS, *arguments),
+        the lottery id is always the last argument
+        """
+        results = [None] * len(calls)
+        missing = []
+        for i, call in enumerate(calls):
+            value = self._cached(call)
+            if value is None:
+                missing.append(i)
+            else:
+                results[i] = value
+        if not missing:
+            return results
+
+        # the status of every lottery not known to be completed is read together with its data, all calls
+        # at the same block, so data read with the Completed status is final
+        unknown = sorted({
+            calls[i][-1] for i in missing
+            if calls[i][0] != "current_lottery_id" and self._cached(("status", calls[i][-1])) != COMPLETED
+        })
+        requests = [("status", lottery_id) for lottery_id in unknown] + [calls[i] for i in missing]
+        block = self.rpc.request("eth_blockNumber", [])
+        answers = self.rpc.call([self._encode(call) for call in requests], block=block)
+
+        completed = {lottery_id for lottery_id, status in zip(unknown, answers) if status == COMPLETED}
+        for lottery_id in completed:
+            self._store(("status", lottery_id), COMPLETED)
+        for i, value in zip(missing, answers[len(unknown):]):
+            call = calls[i]
+            results[i] = value = _normalize(value)
+            if call[0] != "current_lottery_id" and (call[-1] in completed or self._cached(("status", call[-1])) == COMPLETED):
+                self._store(call, value)
+        return results
+
+    def _encode(self, call):
+        name, *args = call
+        signature, types, return_types = FUNCTIONS[name]
+        return self.address, signature, types, args, return_types
+
+    #-------------------------------------------------------------------------
+    # CACHE
+    #-------------------------------------------------------------------------
+
+    def _key(self, call):
+        if self._prefix is None:
+            # the same address on another chain is another contract; a restarted ganache keeps the chain id
+            # and deploys to the same addresses, but its genesis block has another timestamp and hash
+            genesis = self.rpc.request("eth_getBlockByNumber", ["0x0", False])["hash"]
+            self._prefix = f"{self.rpc.request('eth_chainId', [])}:{genesis}:{self.address.lower()}"
+        return ":".join([self._prefix] + [str(item).lower() for item in call])
+
+    def _cached(self, call):
+        key = self._key(call)
+        value = self.cache.get(key)
+        if value is None and self.disk_cache is not None:
+            value = self.disk_cache.get(key)
+            if value is not None:
+                self.cache.set(key, value)
+        return value
+
+    def _store(self, call, value):
+        key = self._key(call)
+        self.cache.set(key, value)
+        if self.disk_cache is not None:
+            self.disk_cache.set(key, value)
+
+
+def _normalize(value):
+    """Checksum addresses and lists instead of tuples, the same values the disk cache returns"""
+    if isinstance(value, tuple):
+        return [_normalize(item) for item in value]
+    if isinstance(value, str) and is_address(value):
+        return to_checksum_address(value)
+    return value
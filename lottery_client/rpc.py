@@ -0,0 +1,84 @@
+#!/usr/bin/python3
+
+import itertools
+import threading
+
+import requests
+from eth_abi import decode, encode
+from eth_utils import function_signature_to_4byte_selector
+
+
+class RPCError(Exception):
+    """The node answered a request of the batch with an error (a reverted call or a wrong request)"""
+
+
+class BatchRPC:
+    """
+    eth_call requests sent to the node in JSON-RPC batches, one HTTP round trip for many calls
+
+    A call is (address, signature, argument types, arguments, return types), arguments and results
+    are encoded with eth_abi. Requests of a batch are answered in the order they are sent.
+    """
+
+    def __init__(self, url, max_batch_size=500, timeout=30):
+        self.url = url
+        self.max_batch_size = max_batch_size
+        self.timeout = timeout
+        self.requests = 0
+        self.batches = 0
+        self._ids = itertools.count()
+        self._session = requests.Session()
+        self._lock = threading.Lock()
+
+    def close(self):
+        self._session.close()
+
+    def request(self, method, params):
+        """Result of a single JSON-RPC request"""
+        payload = {"jsonrpc": "2.0", "id": next(self._ids), "method": method, "params": params}
+        response = self._session.post(self.url, json=payload, timeout=self.timeout)
+        response.raise_for_status()
+        answer = response.json()
+        if "error" in answer:
+            raise RPCError(f"{method}: {answer['error'].get('message')}")
+        return answer["result"]
+
+    def call(self, calls, block="latest"):
+        """Results of `calls` in the same order, RPCError if any call fails"""
+        results = []
+        for start in range(0, len(calls), self.max_batch_size):
+            results += self._batch(calls[start:start + self.max_batch_size], block)
+        return results
+
+    def _batch(self, calls, block):
+        if not calls:
+            return []
+        with self._lock:
+            ids = [next(self._ids) for _ in calls]
+        payload = [
+            {
+                "jsonrpc": "2.0",
+                "id": request_id,
+                "method": "eth_call",
+                "params": [{"to": address, "data": _encode_call(signature, types, args)}, block],
+            }
+            for request_id, (address, signature, types, args, _) in zip(ids, calls)
+        ]
+        response = self._session.post(self.url, json=payload, timeout=self.timeout)
+        response.raise_for_status()
+        answers = {answer["id"]: answer for answer in response.json()}
+        self.requests += len(calls)
+        self.batches += 1
+
+        results = []
+        for request_id, (_, signature, _, _, return_types) in zip(ids, calls):
+            answer = answers[request_id]
+            if "error" in answer:
+                raise RPCError(f"{signature}: {answer['error'].get('message')}")
+            values = decode(return_types, bytes.fromhex(answer["result"][2:]))
+            results.append(values[0] if len(values) == 1 else values)
+        return results
+
+
+def _encode_call(signature, types, args):
+    return "0x" + (function_signature_to_4byte_selector(signature) + encode(types, args)).hex()
@@ -1,7 +1,32 @@
 #!/usr/bin/python3
 
-from brownie import Lottery, accounts
+from brownie import Lottery, LotteryFactory, LotteryLens, accounts
+
+# number of lotteries created by deploy_clones
+CLONES_AMOUNT = 10
 
 
 def main():
-    return Lottery.deploy({'from': accounts[0]})
+    lottery = Lottery.deploy({'from': accounts[0]})
+    LotteryLens.deploy(lottery, {'from': accounts[0]})
+    return lottery
+
+
+def deploy_clones(amount=CLONES_AMOUNT):
+    """
+    Deploy the implementation and the factory, then create `amount` lotteries as clones
+    Prints the deployment gas of one clone compared with a full Lottery.deploy
+    """
+    implementation = Lottery.deploy({'from': accounts[0]})
+    factory = LotteryFactory.deploy(implementation, {'from': accounts[0]})
+    full_deploy_gas = implementation.tx.gas_used
+
+    tx = factory.createLotteries(amount, {'from': accounts[0]})
+    lotteries = [Lottery.at(address) for address in tx.return_value]
+    clone_gas = tx.gas_used // amount
+
+    print(f"Full deploy:     {full_deploy_gas} gas")
+    print(f"Factory deploy:  {factory.tx.gas_used} gas (once)")
+    print(f"Clone deploy:    {clone_gas} gas per lottery, {amount} lotteries in one transaction")
+    print(f"Saved:           {100 - clone_gas * 100 // full_deploy_gas}% per lottery")
+    return lotteries
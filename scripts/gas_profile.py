@@ -0,0 +1,147 @@
+#!/usr/bin/python3
+
+from collections import Counter
+from pathlib import Path
+
+from brownie import Lottery, accounts, chain
+
+# directory for the collapsed stacks written by main()
+OUTPUT_DIR = "reports/gas-profile"
+
+STORAGE_OPS = ("SLOAD", "SSTORE")
+
+# intrinsic gas of a transaction (Istanbul): the base cost and the cost of every calldata byte
+TX_BASE_GAS = 21000
+TX_DATA_ZERO_GAS = 4
+TX_DATA_NONZERO_GAS = 16
+
+
+def intrinsic_gas(data):
+    """Gas charged before the first opcode for the calldata `data` (hex string or bytes)"""
+    if isinstance(data, str):
+        data = bytes.fromhex(data[2:] if data.startswith("0x") else data)
+    zeros = data.count(0)
+    return TX_BASE_GAS + zeros * TX_DATA_ZERO_GAS + (len(data) - zeros) * TX_DATA_NONZERO_GAS
+
+
+class GasProfile:
+    """
+    Gas of one transaction broken down by internal function, by source line and by storage access,
+    built from the brownie trace of the transaction (debug_traceTransaction)
+
+    Every step is charged to the stack of functions it runs in, the gas forwarded by a call is charged
+    to the steps of the callee. The intrinsic cost of the transaction (21000 and calldata) is a separate
+    root frame, refunds are not subtracted, so the total can be above gas_used.
+    """
+
+    def __init__(self, tx):
+        self.tx = tx
+        self.stacks = Counter()
+        self.by_function = Counter()
+        self.by_line = Counter()
+        self.storage_ops = Counter()
+        self.storage_gas = Counter()
+        self._sources = {}
+        self._build()
+
+    @property
+    def total(self):
+        return sum(self.stacks.values())
+
+    def _build(self):
+        trace = self.tx.trace
+        self.stacks["intrinsic"] = intrinsic_gas(self.tx.input)
+        # (depth, jumpDepth, fn) of the functions the current step runs in
+        frames = []
+
+        for i, step in enumerate(trace):
+            depth, jump_depth, fn = step["depth"], step["jumpDepth"], step["fn"]
+            while frames and frames[-1][:2] > (depth, jump_depth):
+                frames.pop()
+            if frames and frames[-1][:2] == (depth, jump_depth):
+                frames[-1] = (depth, jump_depth, fn)
+            else:
+                frames.append((depth, jump_depth, fn))
+
+            cost = step["gasCost"]
+            if i + 1 < len(trace) and trace[i + 1]["depth"] > depth:
+                # the cost of a call includes the gas forwarded to the callee
+                cost = max(cost - trace[i + 1]["gas"], 0)
+
+            stack = [frame[2] for frame in frames]
+            op = step["op"]
+            if op in STORAGE_OPS:
+                stack.append(op)
+                self.storage_ops[(fn, op)] += 1
+                self.storage_gas[(fn, op)] += cost
+            self.stacks[";".join(stack)] += cost
+            self.by_function[fn] += cost
+
+            line = self._line(step["source"])
+            if line is not None:
+                self.by_line[line] += cost
+
+    def _line(self, source):
+        if not source:
+            return None
+        filename = source["filename"]
+        if filename not in self._sources:
+            path = Path(filename)
+            self._sources[filename] = path.read_text() if path.exists() else None
+        text = self._sources[filename]
+        if text is None:
+            return None
+        return f"{filename}:{text.count(chr(10), 0, source['offset'][0]) + 1}"
+
+    def collapsed(self):
+        """Lines of the collapsed stack format read by flamegraph.pl, inferno and speedscope"""
+        return [f"{stack} {gas}" for stack, gas in sorted(self.stacks.items()) if gas > 0]
+
+    def write(self, path):
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("\n".join(self.collapsed()) + "\n")
+
+    def print(self, top=10):
+        print(f"{self.tx.fn_name}: {self.tx.gas_used} gas used, {self.total} gas traced")
+        print("  by function:")
+        for fn, gas in self.by_function.most_common(top):
+            print(f"    {gas:>8}  {fn}")
+        print("  by line:")
+        for line, gas in self.by_line.most_common(top):
+            print(f"    {gas:>8}  {line}")
+        print("  storage:")
+        for (fn, op), count in sorted(self.storage_ops.items()):
+            print(f"    {count:>4} x {op:<6} {self.storage_gas[(fn, op)]:>8} gas  {fn}")
+
+
+def profile(tx, output=None):
+    """Profile a transaction receipt or hash, write the collapsed stacks to `output` if given"""
+    if isinstance(tx, str):
+        tx = chain.get_transaction(tx)
+    result = GasProfile(tx)
+    if output is not None:
+        result.write(output)
+    return result
+
+
+def main():
+    owner = accounts[0]
+    players = accounts[1:4]
+    lottery = Lottery.deploy({'from': owner})
+
+    txs = {}
+    lottery.startLottery({'from': owner})
+    txs["fallback"] = players[0].transfer(lottery, 5 * 10**18)
+    players[1].transfer(lottery, 5 * 10**18)
+    txs["buyTickets"] = lottery.buyTickets(200, {'from': players[0]})
+    lottery.buyTickets(100, {'from': players[1]})
+    txs["depositAndBuyTickets"] = lottery.depositAndBuyTickets(50, {'from': players[2], 'value': 10**18})
+    txs["transfer"] = lottery.transfer(players[1], 10, {'from': players[0]})
+    chain.sleep(lottery.lotteryPurchaseStage() + 1)
+    txs["completeLottery"] = lottery.completeLottery({'from': owner})
+    txs["withdraw"] = lottery.withdraw(10, {'from': players[0]})
+
+    for name, tx in txs.items():
+        profile(tx, Path(OUTPUT_DIR) / f"{name}.folded").print()
+    print(f"Collapsed stacks are saved in {OUTPUT_DIR}, e.g. flamegraph.pl {OUTPUT_DIR}/completeLottery.folded > completeLottery.svg")
@@ -0,0 +1,242 @@
+#!/usr/bin/python3
+
+import json
+import sqlite3
+import time
+
+from brownie import Lottery, web3
+from eth_event import decode_log, get_topic_map
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS checkpoints (
+    contract TEXT PRIMARY KEY,
+    block_number INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS events (
+    contract TEXT NOT NULL,
+    block_number INTEGER NOT NULL,
+    log_index INTEGER NOT NULL,
+    tx_hash TEXT NOT NULL,
+    name TEXT NOT NULL,
+    args TEXT NOT NULL,
+    PRIMARY KEY (contract, block_number, log_index)
+);
+CREATE TABLE IF NOT EXISTS balances (
+    contract TEXT NOT NULL,
+    account TEXT NOT NULL,
+    balance INTEGER NOT NULL,
+    PRIMARY KEY (contract, account)
+);
+CREATE TABLE IF NOT EXISTS owners (
+    contract TEXT NOT NULL,
+    account TEXT NOT NULL,
+    block_number INTEGER NOT NULL,
+    PRIMARY KEY (contract, account)
+);
+CREATE TABLE IF NOT EXISTS lotteries (
+    contract TEXT NOT NULL,
+    lottery_id INTEGER NOT NULL,
+    pool_id INTEGER,
+    opened_block INTEGER,
+    closed_block INTEGER,
+    completed_block INTEGER,
+    winner TEXT,
+    prize INTEGER,
+    PRIMARY KEY (contract, lottery_id)
+);
+CREATE TABLE IF NOT EXISTS tickets (
+    contract TEXT NOT NULL,
+    lottery_id INTEGER NOT NULL,
+    player TEXT NOT NULL,
+    amount INTEGER NOT NULL,
+    PRIMARY KEY (contract, lottery_id, player)
+);
+"""
+
+
+class LotteryIndexer:
+    """
+    Incrementally copies the Lottery event logs into a SQLite database
+
+    Logs are fetched in block ranges, the range grows while the node answers and shrinks
+    when a request fails. Every range is stored in one SQLite transaction together with
+    the checkpoint, so the indexer resumes from the last stored block after a restart.
+    """
+
+    def __init__(self, lottery, db_path="lottery-index.sqlite", start_block=0, confirmations=0,
+                 chunk_size=1000, min_chunk_size=1, max_chunk_size=100000):
+        self.address = lottery.address
+        self.topic_map = get_topic_map(lottery.abi)
+        self.start_block = start_block
+        self.confirmations = confirmations
+        self.chunk_size = chunk_size
+        self.min_chunk_size = min_chunk_size
+        self.max_chunk_size = max_chunk_size
+
+        self.db = sqlite3.connect(db_path)
+        self.db.executescript(SCHEMA)
+
+    def close(self):
+        self.db.close()
+
+    #-------------------------------------------------------------------------
+    # SYNCING
+    #-------------------------------------------------------------------------
+
+    @property
+    def checkpoint(self):
+        row = self.db.execute(
+            "SELECT block_number FROM checkpoints WHERE contract = ?", (self.address,)
+        ).fetchone()
+        return row[0] if row else self.start_block - 1
+
+    def sync(self):
+        """Index all logs up to the latest confirmed block, returns the number of stored events"""
+        target = web3.eth.block_number - self.confirmations
+        stored = 0
+        from_block = self.checkpoint + 1
+
+        while from_block <= target:
+            to_block = min(from_block + self.chunk_size - 1, target)
+            try:
+                logs = web3.eth.get_logs({"address": self.address, "fromBlock": from_block, "toBlock": to_block})
+            except Exception:
+                # the node refused the range (too many results or timeout), retry with a smaller one
+                if self.chunk_size <= self.min_chunk_size:
+                    raise
+                self.chunk_size = max(self.chunk_size // 2, self.min_chunk_size)
+                continue
+
+            with self.db:
+                for log in logs:
+                    self._store(log)
+                self._set_checkpoint(to_block)
+            stored += len(logs)
+
+            from_block = to_block + 1
+            self.chunk_size = min(self.chunk_size * 2, self.max_chunk_size)
+        return stored
+
+    def follow(self, poll_interval=5):
+        """Keep the database in sync with the chain until interrupted"""
+        while True:
+            self.sync()
+            time.sleep(poll_interval)
+
+    def _set_checkpoint(self, block_number):
+        self.db.execute(
+            "INSERT INTO checkpoints (contract, block_number) VALUES (?, ?) "
+            "ON CONFLICT(contract) DO UPDATE SET block_number = excluded.block_number",
+            (self.address, block_number),
+        )
+
+    def _store(self, log):
+        event = decode_log(log, self.topic_map)
+        name = event["name"]
+        args = {item["name"]: item["value"] for item in event["data"]}
+        block_number = log["blockNumber"]
+
+        self.db.execute(
+            "INSERT OR IGNORE INTO events VALUES (?, ?, ?, ?, ?, ?)",
+            (self.address, block_number, log["logIndex"], "0x" + bytes(log["transactionHash"]).hex(), name,
+             json.dumps(args, default=str)),
+        )
+
+        handler = getattr(self, f"_on_{name}", None)
+        if handler is not None:
+            handler(block_number, *args.values())
+
+    #-------------------------------------------------------------------------
+    # EVENT HANDLERS
+    #-------------------------------------------------------------------------
+
+    def _add_balance(self, account, amount):
+        self.db.execute(
+            "INSERT INTO balances VALUES (?, ?, ?) "
+            "ON CONFLICT(contract, account) DO UPDATE SET balance = balance + excluded.balance",
+            (self.address, account, amount),
+        )
+
+    def _on_Transfer(self, block_number, sender, recipient, amount):
+        self._add_balance(sender, -amount)
+        self._add_balance(recipient, amount)
+
+    def _on_MintTokens(self, block_number, receiver, amount):
+        self._add_balance(receiver, amount)
+
+    def _on_BurnTokens(self, block_number, owner, amount):
+        self._add_balance(owner, -amount)
+
+    def _on_NewOwner(self, block_number, owner):
+        self.db.execute("INSERT OR IGNORE INTO owners VALUES (?, ?, ?)", (self.address, owner, block_number))
+
+    def _on_OpeningLottery(self, block_number, lottery_id, pool_id):
+        self.db.execute(
+            "INSERT OR IGNORE INTO lotteries (contract, lottery_id, pool_id, opened_block) VALUES (?, ?, ?, ?)",
+            (self.address, lottery_id, pool_id, block_number),
+        )
+
+    def _on_ClosingLottery(self, block_number, lottery_id, pool_id):
+        self.db.execute(
+            "UPDATE lotteries SET closed_block = ? WHERE contract = ? AND lottery_id = ?",
+            (block_number, self.address, lottery_id),
+        )
+
+    def _on_CompletingLottery(self, block_number, lottery_id, pool_id):
+        self.db.execute(
+            "UPDATE lotteries SET completed_block = ? WHERE contract = ? AND lottery_id = ?",
+            (block_number, self.address, lottery_id),
+        )
+
+    def _on_PurchasingTickets(self, block_number, player, lottery_id, pool_id, amount):
+        self.db.execute(
+            "INSERT INTO tickets VALUES (?, ?, ?, ?) "
+            "ON CONFLICT(contract, lottery_id, player) DO UPDATE SET amount = amount + excluded.amount",
+            (self.address, lottery_id, player, amount),
+        )
+
+    def _on_Winning(self, block_number, winner, lottery_id, prize):
+        self.db.execute(
+            "UPDATE lotteries SET winner = ?, prize = ? WHERE contract = ? AND lottery_id = ?",
+            (winner, prize, self.address, lottery_id),
+        )
+
+    #-------------------------------------------------------------------------
+    # QUERIES
+    #-------------------------------------------------------------------------
+
+    def balance_of(self, account):
+        row = self.db.execute(
+            "SELECT balance FROM balances WHERE contract = ? AND account = ?", (self.address, str(account))
+        ).fetchone()
+        return row[0] if row else 0
+
+    def players(self, lottery_id):
+        """List of (player, tickets) in the order of the first purchase"""
+        return self.db.execute(
+            "SELECT player, amount FROM tickets WHERE contract = ? AND lottery_id = ? ORDER BY rowid",
+            (self.address, lottery_id),
+        ).fetchall()
+
+    def odds(self, lottery_id):
+        """List of (player, tickets, chance of winning from 0 to 1)"""
+        players = self.players(lottery_id)
+        total = sum(amount for _, amount in players)
+        return [(player, amount, amount / total) for player, amount in players]
+
+    def winners(self):
+        """List of (lottery_id, winner, prize) of all completed lotteries"""
+        return self.db.execute(
+            "SELECT lottery_id, winner, prize FROM lotteries "
+            "WHERE contract = ? AND winner IS NOT NULL ORDER BY lottery_id",
+            (self.address,),
+        ).fetchall()
+
+
+def main():
+    indexer = LotteryIndexer(Lottery[-1])
+    stored = indexer.sync()
+    print(f"Indexed {stored} events up to block {indexer.checkpoint}")
+    for lottery_id, winner, prize in indexer.winners():
+        print(f"Lottery {lottery_id}: {winner} won {prize} TLC")
+    indexer.close()
@@ -0,0 +1,259 @@
+#!/usr/bin/python3
+
+import asyncio
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from brownie import Lottery, accounts, chain, web3
+from brownie.exceptions import VirtualMachineError
+from brownie.network.transaction import Status
+from eth_event import decode_logs, get_topic_map
+
+from scripts.log_queries import log_filter
+
+# Lottery.Status values
+PURCHASE_TICKETS = 1
+CLOSED = 2
+COMPLETED = 3
+
+
+class PhaseMetrics:
+    """Delay in seconds between the moment a phase transition became valid and the block that made it"""
+
+    def __init__(self):
+        self.latencies = {}
+        self.retries = {}
+
+    def record(self, phase, latency):
+        self.latencies.setdefault(phase, []).append(latency)
+
+    def record_retry(self, phase):
+        self.retries[phase] = self.retries.get(phase, 0) + 1
+
+    def summary(self):
+        return {
+            phase: {
+                "rounds": len(latencies),
+                "retries": self.retries.get(phase, 0),
+                "mean": statistics.mean(latencies),
+                "median": statistics.median(latencies),
+                "max": max(latencies),
+            }
+            for phase, latencies in sorted(self.latencies.items())
+        }
+
+
+class LotteryKeeper:
+    """
+    Drives the rounds of the lottery pools: starts a round as soon as the previous one is completed
+    and completes it at the first block after the purchase stage
+
+    The purchase stage is closed by time (see Lottery._lotteryStatus), so closePurchaseStage is not sent,
+    completeLottery emits ClosingLottery itself. While a round is in the purchase stage, the standing orders
+    which haven't entered it yet are executed with executeStandingOrders in batches of `orders_batch_size`
+    players. The players are collected from PlacingStandingOrder events starting at `orders_from_block`.
+
+    Every transaction is checked with eth_call first, a reverting call is retried after `retry_delay`.
+    Nonces are assigned locally, so the transactions of different pools are sent without waiting for
+    each other, and a transaction not mined in `confirm_timeout` seconds is replaced with a higher gas price.
+    Brownie is not thread safe, all node requests go through one worker thread.
+    """
+
+    def __init__(self, lottery, account, pool_ids=(0,), poll_interval=1.0, confirm_timeout=30,
+                 gas_bump=1.125, max_gas_price=None, max_retries=5, retry_delay=2.0, orders_batch_size=200,
+                 orders_from_block=0):
+        self.lottery = lottery
+        self.account = account
+        self.pool_ids = list(pool_ids)
+        self.poll_interval = poll_interval
+        self.confirm_timeout = confirm_timeout
+        self.gas_bump = gas_bump
+        self.max_gas_price = max_gas_price
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        self.orders_batch_size = orders_batch_size
+
+        self.metrics = PhaseMetrics()
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._nonce = None
+        # (pool_id, phase) => timestamp since which the transition is valid
+        self._ready_since = {}
+        # pool_id => players with standing orders which may have rounds left, in the order of placing
+        self._subscribers = {}
+        self._orders_from_block = orders_from_block
+
+    async def run(self):
+        """Drive the pools until cancelled"""
+        while True:
+            await self.step()
+            await asyncio.sleep(self.poll_interval)
+
+    async def step(self):
+        """Send the next transaction of every pool which is ready, returns the list of mined transactions"""
+        txs = await asyncio.gather(*(self._drive(pool_id) for pool_id in self.pool_ids))
+        return [tx for pool_txs in txs for tx in pool_txs]
+
+    def close(self):
+        self._executor.shutdown()
+
+    #-------------------------------------------------------------------------
+    # ROUND LIFECYCLE
+    #-------------------------------------------------------------------------
+
+    async def _drive(self, pool_id):
+        lottery_id, status, deadline, now = await self._call(self._read_pool, pool_id)
+
+        if lottery_id == 0 or status == COMPLETED:
+            phase, fn = "start", self.lottery.startLotteryInPool
+            ready_at = self._ready_since.setdefault((pool_id, phase), now)
+        elif status == CLOSED:
+            phase, fn = "complete", self.lottery.completeLotteryInPool
+            ready_at = self._ready_since.setdefault((pool_id, phase), deadline)
+        else:
+            return await self._execute_orders(pool_id)
+
+        tx = await self._send(phase, fn, pool_id)
+        if tx is None:
+            return []
+
+        mined_at = await self._call(lambda: tx.timestamp)
+        del self._ready_since[(pool_id, phase)]
+        self.metrics.record(phase, max(mined_at - ready_at, 0))
+        if phase == "complete":
+            # the next round is valid from the block which completed this one
+            self._ready_since[(pool_id, "start")] = mined_at
+            return [tx]
+        return [tx] + await self._execute_orders(pool_id)
+
+    async def _execute_orders(self, pool_id):
+        """Enter the current round of the pool with the standing orders which haven't entered it yet"""
+        players = await self._call(self._pending_orders, pool_id)
+        txs = []
+        for start in range(0, len(players), self.orders_batch_size):
+            batch = players[start:start + self.orders_batch_size]
+            tx = await self._send("orders", self.lottery.executeStandingOrders, pool_id, batch)
+            if tx is not None:
+                txs.append(tx)
+        return txs
+
+    def _pending_orders(self, pool_id):
+        self._sync_subscribers()
+        lottery_id = self.lottery.getCurrentLotteryIdInPool(pool_id)
+        subscribers = self._subscribers.get(pool_id, {})
+        pending = []
+        for player in list(subscribers):
+            _, rounds_left, last_lottery_id, _ = self.lottery.getStandingOrder(player, pool_id)
+            if rounds_left == 0:
+                # used up or cancelled, a new order brings the player back with its event
+                del subscribers[player]
+            elif last_lottery_id != lottery_id:
+                pending.append(player)
+        return pending
+
+    def _sync_subscribers(self):
+        to_block = web3.eth.block_number
+        if to_block < self._orders_from_block:
+            return
+        logs = web3.eth.get_logs(log_filter(
+            self.lottery, "PlacingStandingOrder", from_block=self._orders_from_block, to_block=to_block
+        ))
+        for event in decode_logs(logs, get_topic_map(self.lottery.abi)):
+            player, pool_id = event["data"][0]["value"], event["data"][1]["value"]
+            if pool_id in self.pool_ids:
+                self._subscribers.setdefault(pool_id, {})[player] = None
+        self._orders_from_block = to_block + 1
+
+    def _read_pool(self, pool_id):
+        purchase_stage = self.lottery.pools(pool_id)[0]
+        lottery_id = self.lottery.getCurrentLotteryIdInPool(pool_id)
+        status = self.lottery.getLotteryStatus(lottery_id)
+        starting_timestamp = self.lottery.allLotteries(lottery_id)[2]
+        # the lottery requires more than purchaseStage seconds to pass
+        return lottery_id, status, starting_timestamp + purchase_stage + 1, chain.time()
+
+    #-------------------------------------------------------------------------
+    # TRANSACTIONS
+    #-------------------------------------------------------------------------
+
+    async def _call(self, fn, *args):
+        return await asyncio.get_running_loop().run_in_executor(self._executor, fn, *args)
+
+    def _next_nonce(self):
+        # runs in the worker thread, so nonces are never given out concurrently
+        if self._nonce is None:
+            self._nonce = web3.eth.get_transaction_count(self.account.address, "pending")
+        nonce = self._nonce
+        self._nonce += 1
+        return nonce
+
+    async def _send(self, phase, fn, *args):
+        """Send the transaction, returns the mined receipt or None if it keeps reverting"""
+        for _ in range(self.max_retries):
+            try:
+                await self._call(fn.call, *args, {'from': self.account})
+            except VirtualMachineError as exc:
+                print(f"{phase} {args}: not ready yet ({exc.revert_msg}), retrying in {self.retry_delay}s")
+                self.metrics.record_retry(phase)
+                await asyncio.sleep(self.retry_delay)
+                continue
+
+            nonce = await self._call(self._next_nonce)
+            gas_price = await self._call(lambda: web3.eth.gas_price)
+            try:
+                tx = await self._call(
+                    fn, *args, {'from': self.account, 'nonce': nonce, 'gas_price': gas_price, 'required_confs': 0}
+                )
+            except (VirtualMachineError, ValueError) as exc:
+                # another keeper won the race after the eth_call (the gas estimation reverts) or the node
+                # rejected the nonce, the nonce wasn't used, take the next one from the node
+                print(f"{phase} {args}: not sent ({exc}), retrying in {self.retry_delay}s")
+                self._nonce = None
+                self.metrics.record_retry(phase)
+                await asyncio.sleep(self.retry_delay)
+                continue
+
+            tx = await self._wait(tx)
+            if tx.status == Status.Confirmed:
+                return tx
+            if tx.status == Status.Dropped:
+                # the nonce was taken by another transaction of the account
+                self._nonce = None
+            # another transaction changed the state between the eth_call and the block
+            self.metrics.record_retry(phase)
+            await asyncio.sleep(self.retry_delay)
+        return None
+
+    async def _wait(self, tx):
+        """Wait until the transaction is mined, replacing it with a higher gas price when it is stuck"""
+        deadline = time.monotonic() + self.confirm_timeout
+        while tx.status == Status.Pending:
+            if time.monotonic() < deadline:
+                await asyncio.sleep(self.poll_interval)
+                continue
+
+            gas_price = int(tx.gas_price * self.gas_bump)
+            if self.max_gas_price is not None and gas_price > self.max_gas_price:
+                # keep waiting with the current price
+                deadline = time.monotonic() + self.confirm_timeout
+                continue
+            print(f"{tx.fn_name}: not mined in {self.confirm_timeout}s, replacing with gas price {gas_price}")
+            try:
+                tx = await self._call(lambda: tx.replace(gas_price=gas_price, silent=True))
+            except ValueError:
+                # mined while the replacement was prepared
+                continue
+            deadline = time.monotonic() + self.confirm_timeout
+        return tx
+
+
+def main():
+    keeper = LotteryKeeper(Lottery[-1], accounts[0])
+    try:
+        asyncio.run(keeper.run())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        keeper.close()
+        for phase, stats in keeper.metrics.summary().items():
+            print(f"{phase}: {stats}")
@@ -0,0 +1,204 @@
+#!/usr/bin/python3
+
+import random
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from brownie import Lottery, accounts, web3
+from eth_account import Account
+
+# number of generated accounts, sent transactions and concurrent senders used by main()
+ACCOUNTS_AMOUNT = 1000
+TRANSACTIONS = 10000
+WORKERS = 32
+MIX = "default"
+
+# operation => share of the traffic
+TRAFFIC_MIXES = {
+    "default": {
+        "deposit": 0.2,
+        "buyTickets": 0.35,
+        "transfer": 0.15,
+        "approve": 0.1,
+        "transferFrom": 0.1,
+        "withdraw": 0.1,
+    },
+    "buyers": {"deposit": 0.3, "buyTickets": 0.7},
+    "transfers": {"deposit": 0.1, "transfer": 0.5, "approve": 0.2, "transferFrom": 0.2},
+}
+
+
+def _percentile(values, percent):
+    values = sorted(values)
+    index = min(int(len(values) * percent / 100), len(values) - 1)
+    return values[index]
+
+
+class LoadReport:
+    """Results of the sent transactions: latency from sending to the receipt, gas used and status"""
+
+    def __init__(self):
+        self.results = {}
+        self.duration = 0
+        self._lock = threading.Lock()
+
+    def record(self, operation, latency, gas_used, succeeded):
+        with self._lock:
+            self.results.setdefault(operation, []).append((latency, gas_used, succeeded))
+
+    @property
+    def transactions(self):
+        return sum(len(results) for results in self.results.values())
+
+    def summary(self):
+        summary = {}
+        for operation, results in sorted(self.results.items()):
+            latencies = [latency for latency, _, _ in results]
+            gas = [gas_used for _, gas_used, succeeded in results if succeeded]
+            # gas of the first and the last tenth of the calls shows the cost growing with the contract state
+            tenth = max(len(gas) // 10, 1)
+            summary[operation] = {
+                "calls": len(results),
+                "tps": len(results) / self.duration if self.duration else 0,
+                "reverts": sum(not succeeded for _, _, succeeded in results) / len(results),
+                "latency_p50": _percentile(latencies, 50),
+                "latency_p90": _percentile(latencies, 90),
+                "latency_p99": _percentile(latencies, 99),
+                "gas_mean": int(statistics.mean(gas)) if gas else 0,
+                "gas_first": int(statistics.mean(gas[:tenth])) if gas else 0,
+                "gas_last": int(statistics.mean(gas[-tenth:])) if gas else 0,
+            }
+        return summary
+
+    def print(self):
+        print(f"{self.transactions} transactions in {self.duration:.1f}s, {self.transactions / self.duration:.1f} tps")
+        for operation, stats in self.summary().items():
+            print(
+                f"{operation:>13}: {stats['calls']:>6} calls, {stats['tps']:7.1f} tps, "
+                f"{stats['reverts']:6.1%} reverted, latency p50/p90/p99 "
+                f"{stats['latency_p50'] * 1000:.0f}/{stats['latency_p90'] * 1000:.0f}/{stats['latency_p99'] * 1000:.0f} ms, "
+                f"gas {stats['gas_mean']} (first {stats['gas_first']}, last {stats['gas_last']})"
+            )
+
+
+class LoadTest:
+    """
+    Sends a traffic mix of the lottery operations from many generated accounts
+
+    Every account is used by one worker only, so nonces are counted locally. Transactions are signed
+    with the generated keys and sent raw, every worker waits for the receipt before sending the next one.
+    """
+
+    def __init__(self, lottery, funders, accounts_amount=1000, funding=2 * 10**17, mix="default",
+                 workers=32, gas_limit=500000, seed=0):
+        self.lottery = lottery
+        self.funders = list(funders)
+        self.accounts_amount = accounts_amount
+        self.funding = funding
+        self.mix = TRAFFIC_MIXES[mix] if isinstance(mix, str) else mix
+        self.workers = workers
+        self.gas_limit = gas_limit
+        self.rng = random.Random(seed)
+
+        self.chain_id = web3.eth.chain_id
+        self.gas_price = web3.eth.gas_price
+        self.accounts = []
+        self.report = LoadReport()
+
+    def create_accounts(self):
+        """Generate and fund the accounts, the funding is spread among the funders"""
+        self.accounts = [Account.create() for _ in range(self.accounts_amount)]
+        last = None
+        for i, account in enumerate(self.accounts):
+            funder = self.funders[i % len(self.funders)]
+            last = funder.transfer(account.address, self.funding, required_confs=0, silent=True)
+        if last is not None:
+            last.wait(1)
+        return self.accounts
+
+    def run(self, transactions):
+        """Send `transactions` transactions and return the report"""
+        if not self.accounts:
+            self.create_accounts()
+
+        # split the accounts and the transactions among the workers
+        workers = min(self.workers, len(self.accounts))
+        groups = [self.accounts[i::workers] for i in range(workers)]
+        counts = [transactions // workers + (i < transactions % workers) for i in range(workers)]
+        seeds = [self.rng.random() for _ in range(workers)]
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for future in [executor.submit(self._worker, *args) for args in zip(groups, counts, seeds)]:
+                future.result()
+        self.report.duration = time.perf_counter() - started
+        return self.report
+
+    def _worker(self, group, count, seed):
+        rng = random.Random(seed)
+        nonces = {account.address: 0 for account in group}
+        # owner => spenders with an allowance, both accounts belong to this worker
+        approvals = {}
+        operations = list(self.mix)
+        weights = list(self.mix.values())
+
+        for _ in range(count):
+            account = rng.choice(group)
+            operation = rng.choices(operations, weights)[0]
+            if operation == "transferFrom" and not approvals:
+                operation = "approve"
+            sender, value, data = self._build(operation, account, group, approvals, rng)
+
+            signed = sender.sign_transaction({
+                "to": self.lottery.address,
+                "value": value,
+                "data": data,
+                "gas": self.gas_limit,
+                "gasPrice": self.gas_price,
+                "nonce": nonces[sender.address],
+                "chainId": self.chain_id,
+            })
+
+            sent = time.perf_counter()
+            tx_hash = web3.eth.send_raw_transaction(signed.raw_transaction)
+            nonces[sender.address] += 1
+            receipt = web3.eth.wait_for_transaction_receipt(tx_hash, poll_latency=0.01)
+            self.report.record(operation, time.perf_counter() - sent, receipt["gasUsed"], receipt["status"] == 1)
+
+    def _build(self, operation, account, group, approvals, rng):
+        """Returns the sender, the value and the calldata of the operation"""
+        lottery = self.lottery
+        if operation == "deposit":
+            # 1 - 5 TLC through the fallback function
+            return account, rng.randint(1, 5) * 10**16, b""
+        if operation == "buyTickets":
+            return account, 0, lottery.buyTickets.encode_input(rng.randint(1, 3))
+        if operation == "transfer":
+            return account, 0, lottery.transfer.encode_input(rng.choice(group).address, rng.randint(1, 2))
+        if operation == "approve":
+            spender = rng.choice(group)
+            approvals.setdefault(account.address, []).append(spender)
+            return account, 0, lottery.approve.encode_input(spender.address, rng.randint(1, 10))
+        if operation == "transferFrom":
+            owner = rng.choice(sorted(approvals))
+            spender = rng.choice(approvals[owner])
+            return spender, 0, lottery.transferFrom.encode_input(owner, rng.choice(group).address, 1)
+        if operation == "withdraw":
+            return account, 0, lottery.withdraw.encode_input(1)
+        raise ValueError(f"Unknown operation {operation}")
+
+
+def main():
+    lottery = Lottery[-1]
+    if lottery.getCurrentLotteryStatus() != "PurchaseTickets":
+        lottery.startLottery({'from': accounts[0]})
+
+    load_test = LoadTest(lottery, accounts, accounts_amount=ACCOUNTS_AMOUNT, mix=MIX, workers=WORKERS)
+    load_test.create_accounts()
+    load_test.run(TRANSACTIONS).print()
+
+    _, _, players = lottery.getTicketOwnersPage(0, 0)
+    _, _, owners = lottery.getOwnersPage(0, 0)
+    print(f"Players in the current lottery: {players}, registered owners: {owners}")
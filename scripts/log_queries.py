@@ -0,0 +1,95 @@
+#!/usr/bin/python3
+
+import time
+
+from brownie import Lottery, accounts, chain, web3
+from eth_event import decode_logs, get_topic_map
+
+# synthetic history built by main(): completed rounds and players per round
+ROUNDS = 100
+PLAYERS = 9
+
+
+def _topic(value):
+    """Indexed topic of an address or an integer"""
+    if isinstance(value, int):
+        return "0x" + format(value, "064x")
+    return "0x" + str(value)[2:].lower().rjust(64, "0")
+
+
+def log_filter(lottery, event, *indexed, from_block=0, to_block="latest"):
+    """
+    eth_getLogs filter of `event` of `lottery`, `indexed` are the values of the indexed arguments in order,
+    None matches any value. The node answers from the bloom filters of the blocks without reading other logs.
+    """
+    topics = [lottery.topics[event]] + [None if value is None else _topic(value) for value in indexed]
+    while topics[-1] is None:
+        topics.pop()
+    return {"address": lottery.address, "fromBlock": from_block, "toBlock": to_block, "topics": topics}
+
+
+def purchases(lottery, player=None, lottery_id=None, pool_id=None, from_block=0, to_block="latest"):
+    """Decoded PurchasingTickets events filtered by the node"""
+    logs = web3.eth.get_logs(log_filter(lottery, "PurchasingTickets", player, lottery_id, pool_id,
+                                        from_block=from_block, to_block=to_block))
+    return decode_logs(logs, get_topic_map(lottery.abi))
+
+
+def scan_purchases(lottery, player=None, lottery_id=None, pool_id=None, from_block=0, to_block="latest"):
+    """The same events found by downloading and decoding every log of the contract, as without indexed topics"""
+    logs = web3.eth.get_logs({"address": lottery.address, "fromBlock": from_block, "toBlock": to_block})
+    expected = {"player": player, "lotteryId": lottery_id, "poolId": pool_id}
+    result = []
+    for event in decode_logs(logs, get_topic_map(lottery.abi)):
+        if event["name"] != "PurchasingTickets":
+            continue
+        args = {item["name"]: item["value"] for item in event["data"]}
+        if all(value is None or args[name] == value for name, value in expected.items()):
+            result.append(event)
+    return result
+
+
+def _measure(query, repeat=5):
+    """Best time of `repeat` runs and the result of the query"""
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = query()
+        duration = time.perf_counter() - started
+        best = duration if best is None else min(best, duration)
+    return best, result
+
+
+def build_history(lottery, owner, players, rounds):
+    """Complete `rounds` rounds of the default pool, every player buys tickets in every round"""
+    for i, player in enumerate(players):
+        player.transfer(lottery, (i + 1) * rounds * 10**16)
+    for _ in range(rounds):
+        lottery.startLottery({'from': owner})
+        for i, player in enumerate(players):
+            lottery.buyTickets(i + 1, {'from': player})
+        chain.sleep(lottery.lotteryPurchaseStage() + 1)
+        lottery.completeLottery({'from': owner})
+
+
+def main():
+    owner, players = accounts[0], accounts[1:PLAYERS + 1]
+    lottery = Lottery.deploy({'from': owner})
+    build_history(lottery, owner, players, ROUNDS)
+
+    total_logs = len(web3.eth.get_logs({"address": lottery.address, "fromBlock": 0, "toBlock": "latest"}))
+    print(f"{ROUNDS} rounds of {PLAYERS} players, {total_logs} logs of the contract")
+
+    queries = [
+        ("purchases of a player in a round", {"player": players[2], "lottery_id": ROUNDS // 2}),
+        ("all purchases of a player", {"player": players[2]}),
+        ("all purchases in a round", {"lottery_id": ROUNDS // 2}),
+    ]
+    for name, args in queries:
+        scan_time, scanned = _measure(lambda: scan_purchases(lottery, **args))
+        filter_time, filtered = _measure(lambda: purchases(lottery, **args))
+        assert scanned == filtered
+        print(
+            f"{name}: {len(filtered)} events, full scan {scan_time * 1000:.1f} ms ({total_logs} logs), "
+            f"topic filter {filter_time * 1000:.1f} ms ({len(filtered)} logs), {scan_time / filter_time:.1f}x faster"
+        )
@@ -0,0 +1,283 @@
+#!/usr/bin/python3
+
+import time
+
+import numpy as np
+from eth_utils import keccak
+
+# economics of contracts/Lottery.sol: 1 TLC = 0.01 ETH, the winner gets the prize pool without the 1 TLC commission
+TOKEN_PRICE = 100
+WEI_PER_TOKEN = 10**18 // TOKEN_PRICE
+COMMISSION = 1
+PURCHASE_STAGE = 3600
+MAX_TICKETS_PER_TIME = 10000
+ZERO_ADDRESS = "0x0000000000000000000000000000000000000000"
+
+# rounds and players of the simulation run by main()
+ROUNDS = 1000000
+PLAYERS = 10
+MAX_TICKETS = 100
+
+
+class Revert(Exception):
+    """A call the contract would revert, the message is the revert string of the contract"""
+
+
+#-------------------------------------------------------------------------
+# VECTORIZED FUNCTIONS
+#-------------------------------------------------------------------------
+
+def deposit_tokens(wei):
+    """TLC minted for the deposits of `wei` (the fallback function), deposits must be below 2**63 wei"""
+    return np.asarray(wei, dtype=np.int64) // WEI_PER_TOKEN
+
+
+def withdraw_wei(tokens):
+    """Ether paid out for withdrawing `tokens` TLC"""
+    return np.asarray(tokens, dtype=np.int64) * WEI_PER_TOKEN
+
+
+def draw_winning_number(difficulty, timestamp, tickets):
+    """The winning ticket exactly as _drawWinningNumber computes it: keccak(difficulty, now) % tickets"""
+    packed = int(difficulty).to_bytes(32, "big") + int(timestamp).to_bytes(32, "big")
+    return int.from_bytes(keccak(packed), "big") % tickets
+
+
+def find_ticket_owners(purchases, winning_tickets):
+    """
+    Index of the purchase holding the winning ticket in every round, the same search as _findTicketOwner
+
+    `purchases` is a (rounds, purchases) matrix of the tickets bought by every purchase in order, zeros are allowed.
+    A purchase owns the tickets from the upper bound of the previous purchase up to its own upper bound.
+    """
+    upper_bounds = np.cumsum(purchases, axis=-1)
+    # the first upper bound above the ticket, upper bounds never decrease
+    return (upper_bounds <= np.asarray(winning_tickets)[..., None]).sum(axis=-1)
+
+
+def chance_of_winning(tickets, total_tickets):
+    """getChanceOfWinning: the chance in percents rounded down"""
+    return np.asarray(tickets, dtype=np.int64) * 100 // np.asarray(total_tickets, dtype=np.int64)
+
+
+def random_purchases(rounds, players, max_tickets, rng):
+    """(rounds, players) matrix of purchases, every player buys from 0 to `max_tickets` tickets once per round"""
+    return rng.integers(0, max_tickets + 1, size=(rounds, players), dtype=np.int64)
+
+
+def simulate_rounds(purchases, rng, ticket_price=1):
+    """
+    Complete a round for every row of `purchases` (see find_ticket_owners)
+
+    keccak(difficulty, now) can't be predicted before the block, so the winning tickets are drawn uniformly by `rng`.
+    Rounds with less than 2 tickets can't be closed and have no winner (-1).
+    Returns a dict of numpy arrays: tickets, completed, winners, prize pools, payouts and commissions in TLC.
+    """
+    purchases = np.asarray(purchases, dtype=np.int64)
+    tickets = purchases.sum(axis=-1)
+    prize_pools = tickets * ticket_price
+    completed = prize_pools > ticket_price
+
+    winning_tickets = rng.integers(0, np.maximum(tickets, 1))
+    winners = np.where(completed, find_ticket_owners(purchases, winning_tickets), -1)
+    return {
+        "tickets": tickets,
+        "completed": completed,
+        "winning_tickets": np.where(completed, winning_tickets, -1),
+        "winners": winners,
+        "prize_pools": np.where(completed, prize_pools, 0),
+        "payouts": np.where(completed, prize_pools - COMMISSION, 0),
+        "commissions": np.where(completed, COMMISSION, 0),
+    }
+
+
+def win_frequencies(tickets, draws, rng):
+    """Share of `draws` rounds won by every player holding `tickets`, to compare with tickets / total"""
+    tickets = np.asarray(tickets, dtype=np.int64)
+    winning_tickets = rng.integers(0, tickets.sum(), size=draws)
+    winners = np.searchsorted(np.cumsum(tickets), winning_tickets, side="right")
+    return np.bincount(winners, minlength=len(tickets)) / draws
+
+
+def project_treasury(results, ticket_price=1):
+    """
+    Cumulative flows of the simulated rounds in wei: ticket sales, prizes paid to the winners and the owner's commission
+
+    Tickets burn TLC and the payout mints the same amount back, so the ether held by the contract doesn't change,
+    the commission is the only revenue of the owner.
+    """
+    return {
+        "sales": np.cumsum(results["tickets"] * ticket_price) * WEI_PER_TOKEN,
+        "payouts": np.cumsum(results["payouts"]) * WEI_PER_TOKEN,
+        "commission": np.cumsum(results["commissions"]) * WEI_PER_TOKEN,
+    }
+
+
+#-------------------------------------------------------------------------
+# STATEFUL MODEL
+#-------------------------------------------------------------------------
+
+class LotteryModel:
+    """
+    The default pool of one Lottery contract, used as an oracle for the contract in differential tests
+
+    Every method applies a call the same way as the contract or raises Revert with the contract's revert string.
+    Accounts are any hashable values, the owner is the account which deployed the contract.
+    """
+
+    def __init__(self, owner, ticket_price=1, purchase_stage=PURCHASE_STAGE):
+        self.owner = owner
+        self.ticket_price = ticket_price
+        self.purchase_stage = purchase_stage
+        self.balances = {}
+        self.total_supply = 0
+        self.ether = 0
+        self.lottery_id = 0
+        self.rounds = {}
+
+    # every round: status, start, ledger of (player, amount) purchases, tickets of every player, winning ticket, winner
+
+    @property
+    def current(self):
+        return self.rounds.get(self.lottery_id)
+
+    def status(self, timestamp):
+        """getCurrentLotteryStatus at `timestamp`"""
+        lottery = self.current
+        if lottery is None:
+            return "NotStarted"
+        if lottery["status"] == "PurchaseTickets" and timestamp - lottery["start"] > self.purchase_stage \
+                and self.prize_pool() > self.ticket_price:
+            return "Closed"
+        return lottery["status"]
+
+    def balance_of(self, account):
+        return self.balances.get(account, 0)
+
+    def prize_pool(self):
+        lottery = self.current
+        return 0 if lottery is None else sum(amount for _, amount in lottery["purchases"]) * self.ticket_price
+
+    def tickets_of(self, account):
+        lottery = self.current
+        return 0 if lottery is None else lottery["tickets"].get(account, 0)
+
+    def chance_of_winning(self, account):
+        tickets = self.tickets_of(account)
+        if tickets == 0:
+            raise Revert("You haven't purchased tickets yet")
+        return int(chance_of_winning(tickets, self.prize_pool() // self.ticket_price))
+
+    def deposit(self, account, wei):
+        tokens = int(deposit_tokens(wei))
+        if tokens == 0:
+            raise Revert("Lottery::deposit: you don't have enough ether to buy at least 1 TLC, 1 TLC = 0.01 ETH")
+        self.ether += wei
+        self._mint(account, tokens)
+
+    def transfer(self, sender, recipient, amount):
+        if self.balance_of(sender) < amount:
+            raise Revert("ERC20: transfer amount exceeds balance")
+        self.balances[sender] -= amount
+        self.balances[recipient] = self.balance_of(recipient) + amount
+
+    def withdraw(self, account, amount):
+        if self.balance_of(account) < amount:
+            raise Revert("Lottery::withdraw: you don't have enough tokens to withdraw")
+        self.ether -= int(withdraw_wei(amount))
+        self._burn(account, amount)
+
+    def start(self, account, timestamp):
+        if account != self.owner:
+            raise Revert("Ownable: caller is not the owner")
+        if self.current is not None and self.current["status"] != "Completed":
+            raise Revert("Lottery::startLottery: wait until this lottery is closed")
+        self.lottery_id += 1
+        self.rounds[self.lottery_id] = {
+            "status": "PurchaseTickets",
+            "start": timestamp,
+            "purchases": [],
+            "tickets": {},
+            "winning_ticket": 0,
+            "winner": ZERO_ADDRESS,
+        }
+
+    def buy_tickets(self, account, amount, timestamp):
+        cost = self._purchase_tickets(account, amount, timestamp)
+        if self.balance_of(account) < cost:
+            raise Revert("Lottery::buyTickets: you don't have enough TLC on your balance")
+        self._commit_purchase(account, amount)
+        self._burn(account, cost)
+
+    def deposit_and_buy_tickets(self, account, amount, wei, timestamp):
+        tokens = int(deposit_tokens(wei))
+        cost = self._purchase_tickets(account, amount, timestamp)
+        if tokens < cost:
+            raise Revert("Lottery::depositAndBuyTickets: you don't have enough ether to buy this amount of tickets")
+        self._commit_purchase(account, amount)
+        self.ether += wei
+        if tokens > cost:
+            self._mint(account, tokens - cost)
+
+    def complete(self, account, timestamp, winning_ticket=None, difficulty=0):
+        """Complete the round, the winning ticket is drawn from `difficulty` and `timestamp` unless it is given"""
+        if account != self.owner:
+            raise Revert("Ownable: caller is not the owner")
+        if self.status(timestamp) != "Closed":
+            raise Revert("Lottery::buyTickets: it is not possible to close lottery right now")
+        lottery = self.current
+        tickets = self.prize_pool() // self.ticket_price
+        if winning_ticket is None:
+            winning_ticket = draw_winning_number(difficulty, timestamp, tickets)
+
+        players = [player for player, _ in lottery["purchases"]]
+        winner = players[int(find_ticket_owners([amount for _, amount in lottery["purchases"]], winning_ticket))]
+        lottery.update(status="Completed", winning_ticket=winning_ticket, winner=winner)
+        self._mint(winner, self.prize_pool() - COMMISSION)
+        self._mint(self.owner, COMMISSION)
+        return winner
+
+    def _purchase_tickets(self, account, amount, timestamp):
+        if self.current is None:
+            raise Revert("Lottery::buyTickets: Lottery hasn't started yet")
+        if self.status(timestamp) != "PurchaseTickets":
+            raise Revert("Lottery::buyTickets: Purchase stage of lottery is closed, wait for next lottery")
+        if amount > MAX_TICKETS_PER_TIME:
+            raise Revert("Lottery::buyTickers: it is not possible to buy more than 10000 tickets per one time")
+        return amount * self.ticket_price
+
+    def _commit_purchase(self, account, amount):
+        lottery = self.current
+        lottery["purchases"].append((account, amount))
+        lottery["tickets"][account] = lottery["tickets"].get(account, 0) + amount
+
+    def _mint(self, account, tokens):
+        self.total_supply += tokens
+        self.balances[account] = self.balance_of(account) + tokens
+
+    def _burn(self, account, tokens):
+        self.total_supply -= tokens
+        self.balances[account] -= tokens
+
+
+def main():
+    rng = np.random.default_rng(0)
+
+    started = time.perf_counter()
+    purchases = random_purchases(ROUNDS, PLAYERS, MAX_TICKETS, rng)
+    results = simulate_rounds(purchases, rng)
+    duration = time.perf_counter() - started
+    print(f"{ROUNDS} rounds of {PLAYERS} players simulated in {duration:.2f}s, {results['completed'].sum()} completed")
+
+    # the share of the won rounds must match the share of the tickets for every player
+    tickets = purchases[0]
+    frequencies = win_frequencies(tickets, ROUNDS, rng)
+    expected = tickets / tickets.sum()
+    print(f"max deviation of the win frequency from the odds: {np.abs(frequencies - expected).max():.5f}")
+    print(f"getChanceOfWinning: {chance_of_winning(tickets, tickets.sum()).tolist()}")
+
+    treasury = project_treasury(results)
+    print(
+        f"ticket sales {treasury['sales'][-1] / 10**18:.2f} ETH, prizes {treasury['payouts'][-1] / 10**18:.2f} ETH, "
+        f"owner's commission {treasury['commission'][-1] / 10**18:.2f} ETH"
+    )
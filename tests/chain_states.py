@@ -0,0 +1,71 @@
+#!/usr/bin/python3
+
+from brownie import chain
+
+# number of players in the open round and number of completed rounds in the history state
+OPEN_ROUND_PLAYERS = 2
+HISTORY_ROUNDS = 10
+
+
+class ChainStates:
+    """
+    Canonical lottery states used by the tests, every state is a separate Lottery deployment
+
+    All states are built once per session (once per worker with xdist, every worker has its own chain).
+    The isolate fixture of conftest takes a chain snapshot before every test and reverts to it afterwards,
+    the chain is never reset, so no test pays for the setup again. The open round stays open only until
+    `open_closes_at`, the open_lottery fixture checks it is still running.
+
+    The states are:
+    fresh      - just deployed
+    open       - the purchase stage is running, accounts[1..OPEN_ROUND_PLAYERS] deposited 1 ETH
+                 and bought 10 tickets each
+    closed     - the same round after the purchase stage and closePurchaseStage
+    completed  - the same round after completeLottery
+    history    - HISTORY_ROUNDS completed rounds of accounts[1] and accounts[2] (2 ETH deposit, 10 tickets
+                 each per round), no round is running
+    """
+
+    def __init__(self, Lottery, accounts):
+        self.Lottery = Lottery
+        self.accounts = accounts
+        self.owner = accounts[0]
+        self.players = accounts[1:OPEN_ROUND_PLAYERS + 1]
+
+    def build(self):
+        # the states which need chain.sleep go first, so the open round is not past its purchase stage
+        self.history = self._deploy()
+        for player in self.accounts[1:3]:
+            player.transfer(self.history, 2 * 10**18)
+        for _ in range(HISTORY_ROUNDS):
+            self._open_round(self.history, self.accounts[1:3], deposit=False)
+            chain.sleep(3601)  # 1 hour and 1 second (more than 1 hour)
+            self.history.completeLottery({'from': self.owner})
+
+        self.closed = self._deploy()
+        self.completed = self._deploy()
+        for lottery in (self.closed, self.completed):
+            self._open_round(lottery, self.players)
+        chain.sleep(3601)  # 1 hour and 1 second (more than 1 hour)
+        for lottery in (self.closed, self.completed):
+            lottery.closePurchaseStage({'from': self.owner})
+        self.completed.completeLottery({'from': self.owner})
+
+        self.open = self._deploy()
+        start = self._open_round(self.open, self.players)
+        # the round is closed by time once more than lotteryPurchaseStage seconds have passed
+        self.open_closes_at = start.timestamp + self.open.lotteryPurchaseStage()
+
+        self.fresh = self._deploy()
+        return self
+
+    def _deploy(self):
+        return self.Lottery.deploy({'from': self.owner})
+
+    def _open_round(self, lottery, players, deposit=True):
+        tx = lottery.startLottery({'from': self.owner})
+        for player in players:
+            if deposit:
+                player.transfer(lottery, 10**18)
+            lottery.buyTickets(10, {'from': player})
+        return tx
@@ -1,14 +1,104 @@
 #!/usr/bin/python3
 
 import pytest
+from brownie import chain, web3
+
+from chain_states import ChainStates
+from gas_benchmark import GasBenchmark
+
+_gas_benchmark = GasBenchmark()
+
+
+def pytest_addoption(parser):
+    parser.addoption("--gas-benchmark", action="store_true", help="Run the gas benchmark suite (local ganache only)")
+    parser.addoption("--gas-output", default="reports/gas-benchmark.json", help="JSON file for gas benchmark results")
+    parser.addoption("--gas-baseline", default=None, help="Fail if gas regresses compared to this benchmark JSON file")
+    parser.addoption("--gas-threshold", type=float, default=5.0, help="Allowed gas regression in percents")
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "benchmark: gas benchmark, runs only with --gas-benchmark")
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--gas-benchmark"):
+        return
+    skip = pytest.mark.skip(reason="use --gas-benchmark to run")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip)
+
+
+def pytest_sessionfinish(session, exitstatus):
+    config = session.config
+    if not _gas_benchmark.calls:
+        return
+
+    _gas_benchmark.dump(config.getoption("--gas-output"), meta={"client": web3.clientVersion})
+
+    baseline = config.getoption("--gas-baseline")
+    if baseline is None:
+        return
+    regressions = _gas_benchmark.compare(baseline, config.getoption("--gas-threshold"))
+    for name, baseline_mean, current_mean in regressions:
+        print(f"\ngas regression in {name}: {baseline_mean} -> {current_mean}")
+    if regressions:
+        session.exitstatus = 1
+
 
 @pytest.fixture(scope="function", autouse=True)
-def isolate(fn_isolation):
+def isolate(chain_states):
     # выполнять откат цепи после завершения каждого теста, чтобы обеспечить надлежащую изоляцию
-    # https://eth-brownie.readthedocs.io/en/v1.10.3/tests-pytest-intro.html#isolation-fixtures
-    pass
+    # fn_isolation не используется: его module_isolation сбрасывает цепь и удаляет состояния chain_states
+    chain.snapshot()
+    yield
+    chain.revert()
+
+
+@pytest.fixture(scope="session")
+def chain_states(Lottery, accounts):
+    return ChainStates(Lottery, accounts).build()
+
+
+@pytest.fixture(scope="module")
+def lottery(chain_states):
+    return chain_states.fresh
+
+
+@pytest.fixture(scope="module")
+def open_lottery(chain_states):
+    assert chain.time() <= chain_states.open_closes_at, "the purchase stage of the open round is over"
+    return chain_states.open
+
+
+@pytest.fixture(scope="module")
+def closed_lottery(chain_states):
+    return chain_states.closed
+
+
+@pytest.fixture(scope="module")
+def completed_lottery(chain_states):
+    return chain_states.completed
+
+
+@pytest.fixture(scope="module")
+def historical_lottery(chain_states):
+    return chain_states.history
+
+
+@pytest.fixture(scope="session")
+def gas_benchmark():
+    client = web3.clientVersion.lower()
+    if "ganache" not in client and "testrpc" not in client:
+        pytest.skip("gas benchmarks run against local ganache only")
+    return _gas_benchmark
+
+
+@pytest.fixture(scope="module")
+def lens(LotteryLens, lottery, accounts):
+    return LotteryLens.deploy(lottery, {'from': accounts[0]})
 
 
 @pytest.fixture(scope="module")
-def lottery(Lottery, accounts):
-    return Lottery.deploy({'from': accounts[0]})
\ No newline at end of file
+def factory(LotteryFactory, lottery, accounts):
+    return LotteryFactory.deploy(lottery, {'from': accounts[0]})
@@ -0,0 +1,102 @@
+#!/usr/bin/python3
+
+import json
+import statistics
+from pathlib import Path
+
+
+class GasBenchmark:
+    """Collects gas used per contract call and compares it with a saved baseline"""
+
+    def __init__(self):
+        self.calls = {}
+
+    def record(self, name, tx):
+        self.record_gas(name, tx.gas_used)
+        return tx
+
+    def record_gas(self, name, gas_used):
+        self.calls.setdefault(name, []).append(gas_used)
+
+    def summary(self):
+        return {
+            name: {
+                "calls": len(gas),
+                "min": min(gas),
+                "max": max(gas),
+                "mean": int(statistics.mean(gas)),
+                "median": int(statistics.median(gas)),
+            }
+            for name, gas in sorted(self.calls.items())
+        }
+
+    def dump(self, path, meta=None):
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("w") as fp:
+            json.dump({"meta": meta or {}, "functions": self.summary()}, fp, indent=2, sort_keys=True)
+
+    def compare(self, baseline_path, threshold):
+        """
+        Compare the mean gas of every call with the baseline file
+        Returns a list of (name, baseline_mean, current_mean) that regressed more than `threshold` percents
+        """
+        with Path(baseline_path).open() as fp:
+            baseline = json.load(fp)["functions"]
+
+        regressions = []
+        for name, stats in self.summary().items():
+            if name not in baseline:
+                continue
+            baseline_mean = baseline[name]["mean"]
+            if stats["mean"] > baseline_mean * (1 + threshold / 100):
+                regressions.append((name, baseline_mean, stats["mean"]))
+        return regressions
+
+
+class WorstCaseGas:
+    """
+    Keeps the maximum gas of every call with the conditions that caused it, and the gas of every call
+    against the size of the contract history, to find calls whose cost keeps growing
+    """
+
+    def __init__(self, block_gas_limit):
+        self.block_gas_limit = block_gas_limit
+        self.worst = {}
+        self.samples = {}
+
+    def record(self, name, gas_used, history, conditions=None):
+        """`history` is a dict of sizes which may grow, like {"players": 10, "owners": 25}"""
+        self.samples.setdefault(name, []).append((history, gas_used))
+        if gas_used > self.worst.get(name, (0, None))[0]:
+            self.worst[name] = (gas_used, dict(history, **(conditions or {})))
+
+    def near_block_limit(self, share=0.5):
+        """Calls which used more than `share` of the block gas limit"""
+        return {name: worst for name, worst in self.worst.items() if worst[0] > self.block_gas_limit * share}
+
+    def growing(self, min_growth=5000, min_correlation=0.9):
+        """
+        Calls whose gas grows with some history size: strong correlation and at least `min_growth` gas
+        between the smallest and the largest history, returns {name: (size name, gas per item)}
+        """
+        growing = {}
+        for name, samples in self.samples.items():
+            for size in samples[0][0]:
+                xs = [history[size] for history, _ in samples]
+                ys = [gas for _, gas in samples]
+                if len(set(xs)) < 3 or len(set(ys)) < 2:
+                    continue
+                slope, correlation = _linear_fit(xs, ys)
+                if correlation >= min_correlation and slope * (max(xs) - min(xs)) >= min_growth:
+                    growing[name] = (size, slope)
+        return growing
+
+
+def _linear_fit(xs, ys):
+    mean_x = statistics.mean(xs)
+    mean_y = statistics.mean(ys)
+    cov = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys))
+    var_x = sum((x - mean_x) ** 2 for x in xs)
+    var_y = sum((y - mean_y) ** 2 for y in ys)
+    return cov / var_x, cov / (var_x * var_y) ** 0.5
@@ -0,0 +1,75 @@
+#!/usr/bin/python3
+import brownie
+
+
+def test_batch_transfer_balances(lottery, accounts):
+    accounts[0].transfer(lottery, 10**18)
+    sender_balance = lottery.balanceOf(accounts[0])
+
+    lottery.batchTransfer(accounts[1:4], [10, 20, 30], {'from': accounts[0]})
+
+    assert lottery.balanceOf(accounts[0]) == sender_balance - 60
+    assert [lottery.balanceOf(account) for account in accounts[1:4]] == [10, 20, 30]
+
+
+def test_batch_transfer_to_same_recipient(lottery, accounts):
+    accounts[0].transfer(lottery, 10**18)
+
+    lottery.batchTransfer([accounts[1], accounts[1]], [10, 20], {'from': accounts[0]})
+
+    assert lottery.balanceOf(accounts[1]) == 30
+
+
+def test_batch_transfer_to_self(lottery, accounts):
+    accounts[0].transfer(lottery, 10**18)
+    sender_balance = lottery.balanceOf(accounts[0])
+
+    lottery.batchTransfer([accounts[0], accounts[1]], [10, 20], {'from': accounts[0]})
+
+    assert lottery.balanceOf(accounts[0]) == sender_balance - 20
+    assert lottery.balanceOf(accounts[1]) == 20
+
+
+def test_batch_transfer_insufficient_balance(lottery, accounts):
+    accounts[0].transfer(lottery, 10**18)
+    balance = lottery.balanceOf(accounts[0])
+
+    with brownie.reverts():
+        lottery.batchTransfer(accounts[1:3], [balance, 1], {'from': accounts[0]})
+
+
+def test_batch_transfer_different_lengths(lottery, accounts):
+    accounts[0].transfer(lottery, 10**18)
+
+    with brownie.reverts():
+        lottery.batchTransfer(accounts[1:3], [1], {'from': accounts[0]})
+
+
+def test_batch_transfer_events_fire(lottery, accounts):
+    accounts[0].transfer(lottery, 10**18)
+
+    tx = lottery.batchTransfer(accounts[1:3], [10, 20], {'from': accounts[0]})
+
+    assert len(tx.events) == 2
+    assert tx.events["Transfer"][0].values() == [accounts[0], accounts[1], 10]
+    assert tx.events["Transfer"][1].values() == [accounts[0], accounts[2], 20]
+
+
+def test_batch_transfer_from(lottery, accounts):
+    accounts[0].transfer(lottery, 10**18)
+    sender_balance = lottery.balanceOf(accounts[0])
+
+    lottery.approve(accounts[1], 50, {'from': accounts[0]})
+    lottery.batchTransferFrom(accounts[0], accounts[2:4], [10, 20], {'from': accounts[1]})
+
+    assert lottery.balanceOf(accounts[0]) == sender_balance - 30
+    assert [lottery.balanceOf(account) for account in accounts[2:4]] == [10, 20]
+    assert lottery.allowance(accounts[0], accounts[1]) == 20
+
+
+def test_batch_transfer_from_insufficient_approval(lottery, accounts):
+    accounts[0].transfer(lottery, 10**18)
+
+    lottery.approve(accounts[1], 29, {'from': accounts[0]})
+    with brownie.reverts():
+        lottery.batchTransferFrom(accounts[0], accounts[2:4], [10, 20], {'from': accounts[1]})
@@ -43,32 +43,37 @@ def test_valid_buying_tickets(lottery, accounts):
     assert(lottery.getCurrentTotalPurchasedTickets() == total_tickets_before_buying + desired_tickets_number)
 
 
-def test_buy_tickets_after_lottery_was_closed(lottery, accounts, chain):
-    accounts[1].transfer(lottery, 10**18)
-    accounts[2].transfer(lottery, 10**18)
+def test_buy_tickets_after_lottery_was_closed(closed_lottery, accounts):
+    assert (closed_lottery.getCurrentLotteryStatus() == "Closed")
 
-    lottery.startLottery({'from': accounts[0]})
+    with brownie.reverts():
+        closed_lottery.buyTickets(1, {'from': accounts[1]})
 
-    lottery.buyTickets(10, {'from': accounts[1]})
-    lottery.buyTickets(10, {'from': accounts[2]})
 
-    chain.sleep(3601)  # 1 hour and 1 second (more than 1 hour)
-    lottery.closePurchaseStage({'from': accounts[0]})
+def test_buy_more_than_10000_tickets(lottery, accounts):
+    lottery.startLottery({'from': accounts[0]})
 
-    assert (lottery.getCurrentLotteryStatus() == "Closed")
+    desired_tokens_number = 10001
+    accounts[1].transfer(lottery, 60 * 10**18)
+    accounts[2].transfer(lottery, 50 * 10**18)
+    lottery.transfer(accounts[1], 5000, {'from': accounts[2]})
 
     with brownie.reverts():
-        lottery.buyTickets(1, {'from': accounts[1]})
+        lottery.buyTickets(desired_tokens_number, {'from': accounts[1]})
 
 
-def test_buy_more_than_200_tickets(lottery, accounts):
+def test_buying_gas_does_not_depend_on_tickets_amount(lottery, accounts):
     lottery.startLottery({'from': accounts[0]})
+    for player in accounts[1:4]:
+        player.transfer(lottery, 2 * 10**18)
 
-    desired_tokens_number = 201
-    accounts[1].transfer(lottery, desired_tokens_number * 10**16)
+    # the first purchase of the round initializes the prize pool and the lists, the compared purchases
+    # are both the first purchases of new players and leave a non-zero balance
+    lottery.buyTickets(1, {'from': accounts[1]})
+    tx_one_ticket = lottery.buyTickets(1, {'from': accounts[2]})
+    tx_many_tickets = lottery.buyTickets(100, {'from': accounts[3]})
 
-    with brownie.reverts():
-        lottery.buyTickets(desired_tokens_number, {'from': accounts[1]})
+    assert abs(tx_many_tickets.gas_used - tx_one_ticket.gas_used) < 1000
 
 
 def test_buy_tickets_event_fires(lottery, accounts):
@@ -80,4 +85,30 @@ def test_buy_tickets_event_fires(lottery, accounts):
 
     assert len(tx.events) == 2
     assert tx.events["BurnTokens"].values() == [accounts[1], desired_tickets_number]
-    assert tx.events["PurchasingTickets"].values() == [accounts[1], desired_tickets_number]
+    assert tx.events["PurchasingTickets"].values() == [accounts[1], 1, 0, desired_tickets_number]
+
+
+def test_buy_tickets_after_purchase_stage_without_closing(open_lottery, accounts, chain):
+    lottery = open_lottery
+
+    chain.sleep(3601)  # 1 hour and 1 second (more than 1 hour)
+    chain.mine()
+
+    assert lottery.getCurrentLotteryStatus() == "Closed"
+    assert lottery.getLotteryStatus(1) == 2  # Status.Closed
+
+    with brownie.reverts():
+        lottery.buyTickets(1, {'from': accounts[1]})
+
+
+def test_buy_tickets_after_purchase_stage_with_one_ticket(lottery, accounts, chain):
+    accounts[1].transfer(lottery, 10**18)
+    accounts[2].transfer(lottery, 10**18)
+
+    lottery.startLottery({'from': accounts[0]})
+    lottery.buyTickets(1, {'from': accounts[1]})
+
+    chain.sleep(3601)  # 1 hour and 1 second (more than 1 hour)
+    lottery.buyTickets(1, {'from': accounts[2]})
+
+    assert lottery.getCurrentLotteryStatus() == "Closed"
@@ -0,0 +1,24 @@
+#!/usr/bin/python3
+from chain_states import HISTORY_ROUNDS, OPEN_ROUND_PLAYERS
+
+
+def test_canonical_states(lottery, open_lottery, closed_lottery, completed_lottery, historical_lottery):
+    assert lottery.getCurrentLotteryStatus() == "NotStarted"
+    assert open_lottery.getCurrentLotteryStatus() == "PurchaseTickets"
+    assert closed_lottery.getCurrentLotteryStatus() == "Closed"
+    assert completed_lottery.getCurrentLotteryStatus() == "Completed"
+    assert historical_lottery.getCurrentLotteryStatus() == "Completed"
+
+    assert len(open_lottery.getAllTicketOwners()) == OPEN_ROUND_PLAYERS
+    assert open_lottery.getCurrentTotalPurchasedTickets() == 10 * OPEN_ROUND_PLAYERS
+    assert historical_lottery.getCurrentLotteryId() == HISTORY_ROUNDS
+
+
+def test_state_is_changed_by_test(open_lottery, accounts):
+    open_lottery.buyTickets(10, {'from': accounts[1]})
+
+    assert open_lottery.getAmountOfTickets(accounts[1]) == 20
+
+
+def test_state_is_restored_after_test(open_lottery, accounts):
+    assert open_lottery.getAmountOfTickets(accounts[1]) == 10
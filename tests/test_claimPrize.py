@@ -0,0 +1,75 @@
+#!/usr/bin/python3
+import brownie
+
+
+def test_draw_lottery_does_not_pay_out(closed_lottery, accounts):
+    lottery = closed_lottery
+    balances_before = [lottery.balanceOf(account) for account in accounts[:3]]
+
+    lottery.drawLottery({'from': accounts[0]})
+
+    assert lottery.getCurrentLotteryStatus() == "Completed"
+    assert not lottery.isPrizeClaimed(1)
+    assert [lottery.balanceOf(account) for account in accounts[:3]] == balances_before
+
+
+def test_claim_prize_by_anyone(closed_lottery, accounts):
+    lottery = closed_lottery
+    lottery.drawLottery({'from': accounts[0]})
+
+    winner = lottery.getWinnerOfLotteryId(1)
+    winner_balance = lottery.balanceOf(winner)
+    owner_balance = lottery.balanceOf(accounts[0])
+
+    tx = lottery.claimPrize(1, {'from': accounts[3]})
+
+    assert winner in accounts[1:3]
+    assert lottery.isPrizeClaimed(1)
+    assert lottery.getWinnerOfLotteryId(1) == winner
+    assert lottery.balanceOf(winner) == winner_balance + 20 - 1  # 1 token commission
+    assert lottery.balanceOf(accounts[0]) == owner_balance + 1
+    assert tx.events["Winning"].values() == [winner, 1, 20]
+
+
+def test_claim_prize_twice(closed_lottery, accounts):
+    lottery = closed_lottery
+    lottery.drawLottery({'from': accounts[0]})
+    lottery.claimPrize(1, {'from': accounts[1]})
+
+    with brownie.reverts():
+        lottery.claimPrize(1, {'from': accounts[1]})
+
+
+def test_claim_prize_paid_by_complete_lottery(closed_lottery, accounts):
+    lottery = closed_lottery
+    lottery.completeLottery({'from': accounts[0]})
+
+    assert lottery.isPrizeClaimed(1)
+    with brownie.reverts():
+        lottery.claimPrize(1, {'from': accounts[1]})
+
+
+def test_claim_prize_before_drawing(closed_lottery, accounts):
+    lottery = closed_lottery
+
+    with brownie.reverts():
+        lottery.claimPrize(1, {'from': accounts[1]})
+
+
+def test_draw_by_non_contract_owner(closed_lottery, accounts):
+    lottery = closed_lottery
+
+    with brownie.reverts():
+        lottery.drawLottery({'from': accounts[1]})
+
+
+def test_start_next_lottery_before_claiming(closed_lottery, accounts):
+    lottery = closed_lottery
+    lottery.drawLottery({'from': accounts[0]})
+
+    lottery.startLottery({'from': accounts[0]})
+    lottery.claimPrize(1, {'from': accounts[1]})
+
+    assert lottery.getCurrentLotteryId() == 2
+    assert lottery.getCurrentLotteryStatus() == "PurchaseTickets"
+    assert lottery.isPrizeClaimed(1)
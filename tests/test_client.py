@@ -0,0 +1,61 @@
+#!/usr/bin/python3
+import pytest
+from brownie import web3
+
+from lottery_client import LotteryClient
+
+
+@pytest.fixture
+def client_of():
+    clients = []
+
+    def client_of(lottery, **kwargs):
+        clients.append(LotteryClient(lottery.address, web3.provider.endpoint_uri, **kwargs))
+        return clients[-1]
+
+    yield client_of
+    for client in clients:
+        client.close()
+
+
+def test_completed_rounds_are_cached(historical_lottery, accounts, client_of):
+    lottery = historical_lottery
+    client = client_of(lottery)
+    lottery_ids = list(range(1, 11))
+
+    winners = client.winners(lottery_ids)
+    tickets = client.tickets_of(accounts[1], lottery_ids)
+
+    assert winners == [lottery.getWinnerOfLotteryId(lottery_id) for lottery_id in lottery_ids]
+    assert tickets == [10] * 10
+    assert client.total_tickets(3) == 20
+    assert client.players(3) == [accounts[1], accounts[2]]
+    assert client.rpc.batches == 4
+
+    requests = client.rpc.requests
+    assert client.winners(lottery_ids) == winners
+    assert client.tickets_of(accounts[1], lottery_ids) == tickets
+    assert client.rpc.requests == requests
+
+
+def test_running_round_is_not_cached(open_lottery, accounts, client_of):
+    lottery = open_lottery
+    client = client_of(lottery)
+
+    assert client.tickets(accounts[1], 1) == 10
+    lottery.buyTickets(5, {'from': accounts[1]})
+
+    assert client.tickets(accounts[1], 1) == 15
+    assert client.total_tickets(1) == 25
+    assert client.current_lottery_id() == 1
+
+
+def test_disk_cache_survives_restart(historical_lottery, client_of, tmp_path):
+    path = tmp_path / "client.sqlite"
+    winners = client_of(historical_lottery, disk_cache=path).winners([1, 2, 3])
+
+    client = client_of(historical_lottery, disk_cache=path, cache_size=2)
+
+    assert client.winners([1, 2, 3]) == winners
+    assert client.rpc.requests == 0
+    assert len(client.cache) == 2
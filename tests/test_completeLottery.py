@@ -9,36 +9,17 @@ def test_lottery_was_not_closed_yet(lottery, accounts):
         lottery.completeLottery({'from': accounts[0]})
 
 
-def test_complete_by_non_contract_owner(lottery, accounts, chain):
-    lottery.startLottery({'from': accounts[0]})
-
-    accounts[1].transfer(lottery, 10**18)
-    accounts[2].transfer(lottery, 10**18)
-
-    lottery.buyTickets(10, {'from': accounts[1]})
-    lottery.buyTickets(10, {'from': accounts[2]})
-
-    chain.sleep(3601)  # 1 hour and 1 second (more than 1 hour)
-    lottery.closePurchaseStage({'from': accounts[0]})
-
+def test_complete_by_non_contract_owner(closed_lottery, accounts):
     with brownie.reverts():
-        lottery.completeLottery({'from': accounts[1]})
+        closed_lottery.completeLottery({'from': accounts[1]})
 
 
-def test_winner_balance_increases(lottery, accounts, chain):
-    lottery.startLottery({'from': accounts[0]})
-
-    accounts[1].transfer(lottery, 10**18)
-    accounts[2].transfer(lottery, 10**18)
-
-    lottery.buyTickets(10, {'from': accounts[1]})
-    lottery.buyTickets(10, {'from': accounts[2]})
+def test_winner_balance_increases(closed_lottery, accounts):
+    lottery = closed_lottery
     prize_pool = lottery.getCurrentTotalPurchasedTickets()
 
     balance_of_winner_before_lottery_was_completed = lottery.balanceOf(accounts[1])  # or lottery.balanceOf(accounts[2]), it's equal
 
-    chain.sleep(3601)  # 1 hour and 1 second (more than 1 hour)
-    lottery.closePurchaseStage({'from': accounts[0]})
     lottery.completeLottery({'from': accounts[0]})
 
     winner = lottery.getWinnerOfLottery()
@@ -46,19 +27,10 @@ def test_winner_balance_increases(lottery, accounts, chain):
     assert lottery.balanceOf(winner) == balance_of_winner_before_lottery_was_completed + prize_pool - 1  # 1 token commission
 
 
-def test_loser_balance_not_increases(lottery, accounts, chain):
-    lottery.startLottery({'from': accounts[0]})
-
-    accounts[1].transfer(lottery, 10**18)
-    accounts[2].transfer(lottery, 10**18)
-
-    lottery.buyTickets(10, {'from': accounts[1]})
-    lottery.buyTickets(10, {'from': accounts[2]})
-
+def test_loser_balance_not_increases(closed_lottery, accounts):
+    lottery = closed_lottery
     balance_of_loser_before_lottery_was_completed = lottery.balanceOf(accounts[1])  # or lottery.balanceOf(accounts[2]), it's equal
 
-    chain.sleep(3601)  # 1 hour and 1 second (more than 1 hour)
-    lottery.closePurchaseStage({'from': accounts[0]})
     lottery.completeLottery({'from': accounts[0]})
 
     winner = lottery.getWinnerOfLottery()
@@ -70,53 +42,81 @@ def test_loser_balance_not_increases(lottery, accounts, chain):
     assert lottery.balanceOf(loser) == balance_of_loser_before_lottery_was_completed
 
 
-def test_1_token_commission_to_contract_owner(lottery, accounts, chain):
+def test_1_token_commission_to_contract_owner(closed_lottery, accounts):
+    lottery = closed_lottery
     contract_owner = accounts[0]
-    lottery.startLottery({'from': contract_owner})
-
-    accounts[1].transfer(lottery, 10**18)
-    accounts[2].transfer(lottery, 10**18)
 
     balance_of_contract_owner_before_lottery_was_completed = lottery.balanceOf(contract_owner)
 
-    lottery.buyTickets(10, {'from': accounts[1]})
-    lottery.buyTickets(10, {'from': accounts[2]})
-
-    chain.sleep(3601)  # 1 hour and 1 second (more than 1 hour)
-    lottery.closePurchaseStage({'from': contract_owner})
     lottery.completeLottery({'from': contract_owner})
 
     assert lottery.balanceOf(contract_owner) == balance_of_contract_owner_before_lottery_was_completed + 1
 
 
-def test_complete_status(lottery, accounts, chain):
+def test_complete_status(completed_lottery):
+    assert completed_lottery.getCurrentLotteryStatus() == "Completed"
+
+
+def test_complete_lottery_event_fires(closed_lottery, accounts):
+    lottery_id = 0
+    tx = closed_lottery.completeLottery({'from': accounts[0]})
+
+    assert tx.events["CompletingLottery"].values() == [lottery_id + 1, 0]
+
+
+def test_winner_found_among_many_purchases(lottery, accounts, chain):
     lottery.startLottery({'from': accounts[0]})
 
+    players = accounts[1:6]
+    for player in players:
+        player.transfer(lottery, 10**18)
+    for i, player in enumerate(players):
+        lottery.buyTickets(i + 1, {'from': player})
+        lottery.buyTickets(10 * (i + 1), {'from': player})
+
+    balances_before = {player: lottery.balanceOf(player) for player in players}
+    prize_pool = lottery.getCurrentTotalPurchasedTickets()
+
+    chain.sleep(3601)  # 1 hour and 1 second (more than 1 hour)
+    lottery.closePurchaseStage({'from': accounts[0]})
+    lottery.completeLottery({'from': accounts[0]})
+
+    winner = lottery.getWinnerOfLottery()
+
+    assert winner in players
+    assert lottery.balanceOf(winner) == balances_before[winner] + prize_pool - 1  # 1 token commission
+
+
+def test_complete_lottery_without_closing_purchase_stage(lottery, accounts, chain):
     accounts[1].transfer(lottery, 10**18)
     accounts[2].transfer(lottery, 10**18)
 
+    lottery.startLottery({'from': accounts[0]})
     lottery.buyTickets(10, {'from': accounts[1]})
     lottery.buyTickets(10, {'from': accounts[2]})
 
+    with brownie.reverts():
+        lottery.completeLottery({'from': accounts[0]})
+
     chain.sleep(3601)  # 1 hour and 1 second (more than 1 hour)
-    lottery.closePurchaseStage({'from': accounts[0]})
-    lottery.completeLottery({'from': accounts[0]})
+    tx = lottery.completeLottery({'from': accounts[0]})
 
+    assert tx.events["ClosingLottery"].values() == [1, 0]
+    assert tx.events["CompletingLottery"].values() == [1, 0]
     assert lottery.getCurrentLotteryStatus() == "Completed"
+    assert lottery.getWinnerOfLottery() in [accounts[1], accounts[2]]
 
 
-def test_complete_lottery_event_fires(lottery, accounts, chain):
-    lottery_id = 0
-    lottery.startLottery({'from': accounts[0]})
-
+def test_close_purchase_stage_after_lottery_was_completed(lottery, accounts, chain):
     accounts[1].transfer(lottery, 10**18)
     accounts[2].transfer(lottery, 10**18)
 
+    lottery.startLottery({'from': accounts[0]})
     lottery.buyTickets(10, {'from': accounts[1]})
     lottery.buyTickets(10, {'from': accounts[2]})
 
     chain.sleep(3601)  # 1 hour and 1 second (more than 1 hour)
-    lottery.closePurchaseStage({'from': accounts[0]})
-    tx = lottery.completeLottery({'from': accounts[0]})
+    lottery.completeLottery({'from': accounts[0]})
 
-    assert tx.events["CompletingLottery"].values() == [lottery_id + 1]
\ No newline at end of file
+    with brownie.reverts():
+        lottery.closePurchaseStage({'from': accounts[0]})
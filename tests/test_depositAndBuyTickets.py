@@ -0,0 +1,51 @@
+#!/usr/bin/python3
+import brownie
+
+
+def test_deposit_and_buy_tickets(lottery, accounts):
+    lottery.startLottery({'from': accounts[0]})
+    total_supply = lottery.totalSupply()
+
+    lottery.depositAndBuyTickets(30, {'from': accounts[1], 'value': 10**18})
+
+    assert lottery.getAmountOfTickets(accounts[1]) == 30
+    assert lottery.getCurrentTotalPurchasedTickets() == 30
+    assert lottery.balanceOf(accounts[1]) == 70  # change is credited in TLC
+    assert lottery.totalSupply() == total_supply + 70
+    assert lottery.isOwner(accounts[1])
+
+
+def test_deposit_exact_amount_for_tickets(lottery, accounts):
+    lottery.startLottery({'from': accounts[0]})
+
+    tx = lottery.depositAndBuyTickets(5, {'from': accounts[1], 'value': 5 * 10**16})
+
+    assert lottery.getAmountOfTickets(accounts[1]) == 5
+    assert lottery.balanceOf(accounts[1]) == 0
+    assert not lottery.isOwner(accounts[1])
+    assert "MintTokens" not in tx.events
+    assert "BurnTokens" not in tx.events
+
+
+def test_not_enough_ether_for_tickets(lottery, accounts):
+    lottery.startLottery({'from': accounts[0]})
+
+    with brownie.reverts():
+        lottery.depositAndBuyTickets(5, {'from': accounts[1], 'value': 4 * 10**16})
+
+
+def test_deposit_and_buy_when_lottery_has_not_started(lottery, accounts):
+    with brownie.reverts():
+        lottery.depositAndBuyTickets(5, {'from': accounts[1], 'value': 10**18})
+
+
+def test_deposit_and_buy_tickets_events_fire(lottery, accounts):
+    lottery.startLottery({'from': accounts[0]})
+
+    tx = lottery.depositAndBuyTickets(30, {'from': accounts[1], 'value': 10**18})
+
+    assert len(tx.events) == 4
+    assert tx.events["PurchasingTickets"].values() == [accounts[1], 1, 0, 30]
+    assert tx.events["NewOwner"].values() == [accounts[1]]
+    assert tx.events["MintTokens"].values() == [accounts[1], 70]
+    assert tx.events["Deposit"].values() == [accounts[1], 10**18]
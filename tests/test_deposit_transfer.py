@@ -119,5 +119,46 @@ def test_transfer_event_fires(lottery, accounts):
     amount = lottery.balanceOf(accounts[0])
     tx = lottery.transfer(accounts[1], amount, {'from': accounts[0]})
 
-    assert len(tx.events) == 2
-    assert tx.events["Transfer"].values() == [accounts[0], accounts[1], amount]
\ No newline at end of file
+    assert len(tx.events) == 1
+    assert tx.events["Transfer"].values() == [accounts[0], accounts[1], amount]
+
+
+def test_transfer_does_not_register_recipient(lottery, accounts):
+    accounts[0].transfer(lottery, 10**18)
+
+    lottery.transfer(accounts[1], 10, {'from': accounts[0]})
+
+    assert not lottery.isOwner(accounts[1])
+
+
+def test_transfer_from_recipient_without_deposit(lottery, accounts):
+    accounts[0].transfer(lottery, 10**18)
+    lottery.transfer(accounts[1], 10, {'from': accounts[0]})
+
+    lottery.transfer(accounts[2], 4, {'from': accounts[1]})
+
+    assert lottery.balanceOf(accounts[1]) == 6
+    assert lottery.balanceOf(accounts[2]) == 4
+
+
+def test_register_owner(lottery, accounts):
+    accounts[0].transfer(lottery, 10**18)
+    lottery.transfer(accounts[1], 10, {'from': accounts[0]})
+
+    tx = lottery.registerOwner(accounts[1], {'from': accounts[2]})
+
+    assert lottery.isOwner(accounts[1])
+    assert lottery.owners(1) == accounts[1]
+    assert tx.events["NewOwner"].values() == [accounts[1]]
+
+
+def test_register_owner_twice(lottery, accounts):
+    accounts[1].transfer(lottery, 10**18)
+
+    with brownie.reverts():
+        lottery.registerOwner(accounts[1], {'from': accounts[1]})
+
+
+def test_register_owner_without_tokens(lottery, accounts):
+    with brownie.reverts():
+        lottery.registerOwner(accounts[1], {'from': accounts[1]})
\ No newline at end of file
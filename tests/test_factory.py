@@ -0,0 +1,74 @@
+#!/usr/bin/python3
+import brownie
+from brownie import Lottery
+
+
+def _create_lottery(factory, account):
+    tx = factory.createLottery({'from': account})
+    return Lottery.at(tx.return_value)
+
+
+def test_create_lottery(factory, accounts):
+    tx = factory.createLottery({'from': accounts[1]})
+    clone = Lottery.at(tx.return_value)
+
+    assert factory.getLotteriesCount() == 1
+    assert factory.lotteries(0) == clone
+    assert tx.events["LotteryCreated"].values() == [clone, accounts[1]]
+    assert clone.owner() == accounts[1]
+    assert clone.isOwner(accounts[1])
+    assert clone.name() == "TrueLotteryCoin"
+    assert clone.symbol() == "TLC"
+    assert clone.decimals() == 18
+    assert clone.getPoolsCount() == 1
+
+
+def test_create_many_lotteries(factory, accounts):
+    tx = factory.createLotteries(3, {'from': accounts[1]})
+
+    assert len(tx.return_value) == 3
+    assert len(set(tx.return_value)) == 3
+    assert factory.getLotteriesCount() == 3
+    for address in tx.return_value:
+        assert Lottery.at(address).owner() == accounts[1]
+
+
+def test_clone_is_cheaper_than_full_deploy(lottery, factory, accounts):
+    tx = factory.createLottery({'from': accounts[1]})
+
+    assert tx.gas_used * 2 < lottery.tx.gas_used
+
+
+def test_initialize_twice(lottery, factory, accounts):
+    clone = _create_lottery(factory, accounts[1])
+
+    with brownie.reverts("Lottery::initialize: lottery is already initialized"):
+        clone.initialize(accounts[2], {'from': accounts[2]})
+
+    # the implementation is initialized by its constructor
+    with brownie.reverts("Lottery::initialize: lottery is already initialized"):
+        lottery.initialize(accounts[2], {'from': accounts[2]})
+
+
+def test_clones_are_independent(lottery, factory, accounts, chain):
+    clone = _create_lottery(factory, accounts[1])
+    accounts[2].transfer(clone, 10**18)
+    accounts[3].transfer(clone, 10**18)
+
+    with brownie.reverts():
+        clone.startLottery({'from': accounts[0]})
+    clone.startLottery({'from': accounts[1]})
+    clone.buyTickets(10, {'from': accounts[2]})
+    clone.buyTickets(10, {'from': accounts[3]})
+
+    assert clone.balance() == 2 * 10**18
+    assert clone.totalSupply() == 180
+    assert lottery.totalSupply() == 0
+    assert lottery.getCurrentLotteryId() == 0
+
+    chain.sleep(3601)  # 1 hour and 1 second (more than 1 hour)
+    clone.closePurchaseStage({'from': accounts[1]})
+    clone.completeLottery({'from': accounts[1]})
+
+    assert clone.getWinnerOfLottery() in [accounts[2], accounts[3]]
+    assert clone.balanceOf(accounts[1]) == 1  # commission
@@ -0,0 +1,86 @@
+#!/usr/bin/python3
+import pytest
+
+pytestmark = pytest.mark.benchmark
+
+TICKET_SIZES = [1, 5, 20, 50]
+ROUNDS = 2
+
+
+def _player_cost(index):
+    """Ether spent by the player `index` on its deposits in all rounds, see _play_round"""
+    return (TICKET_SIZES[index % len(TICKET_SIZES)] + 10) * ROUNDS * 10**16
+
+
+def _make_players(accounts, number):
+    players = list(accounts[1:number + 1])
+    while len(players) < number:
+        players.append(accounts.add())
+
+    # the dev network gives each of the 10 accounts only 100 ETH, so every generated player gets exactly
+    # what it spends, from the funder with the most ether left after its own deposits
+    funders = list(accounts[:10])
+    available = [funder.balance() for funder in funders]
+    for i in range(min(number, 9)):
+        available[i + 1] -= _player_cost(i)
+
+    for i, player in enumerate(players[9:], 9):
+        amount = _player_cost(i)
+        j = max(range(len(funders)), key=available.__getitem__)
+        assert available[j] >= amount, f"the dev accounts can't fund {number} players"
+        funders[j].transfer(player, amount)
+        available[j] -= amount
+    return players
+
+
+def _play_round(lottery, accounts, chain, players, gas_benchmark):
+    owner = accounts[0]
+    gas_benchmark.record("startLottery", lottery.startLottery({'from': owner}))
+
+    for i, player in enumerate(players):
+        tickets = TICKET_SIZES[i % len(TICKET_SIZES)]
+        gas_benchmark.record("fallback", player.transfer(lottery, (tickets + 10) * 10**16))
+        gas_benchmark.record("buyTickets", lottery.buyTickets(tickets, {'from': player}))
+
+    for sender, recipient in zip(players, players[1:] + players[:1]):
+        gas_benchmark.record("transfer", lottery.transfer(recipient, 1, {'from': sender}))
+
+        gas_benchmark.record("approve", lottery.approve(recipient, 2, {'from': sender}))
+        gas_benchmark.record("transferFrom", lottery.transferFrom(sender, recipient, 1, {'from': recipient}))
+        gas_benchmark.record("transferFrom:spend_allowance", lottery.transferFrom(sender, recipient, 1, {'from': recipient}))
+
+    chain.sleep(3601)  # 1 hour and 1 second (more than 1 hour)
+    gas_benchmark.record("closePurchaseStage", lottery.closePurchaseStage({'from': owner}))
+    gas_benchmark.record("completeLottery", lottery.completeLottery({'from': owner}))
+
+    for player in players[::2]:
+        gas_benchmark.record("withdraw", lottery.withdraw(5, {'from': player}))
+
+
+@pytest.mark.parametrize("players_number", [10, 100, 1000])
+def test_lottery_lifecycle_gas(lottery, accounts, chain, gas_benchmark, players_number):
+    players = _make_players(accounts, players_number)
+
+    for _ in range(ROUNDS):
+        _play_round(lottery, accounts, chain, players, gas_benchmark)
+
+    assert lottery.getCurrentLotteryStatus() == "Completed"
+
+
+@pytest.mark.parametrize("recipients_number", [10, 100])
+def test_batch_transfer_gas(lottery, accounts, gas_benchmark, recipients_number):
+    sender = accounts[0]
+    sender.transfer(lottery, 10 * 10**18)
+    recipients = [accounts.add() for _ in range(recipients_number)]
+    amounts = [i + 1 for i in range(recipients_number)]
+
+    looped_gas = sum(
+        lottery.transfer(recipient, amount, {'from': sender}).gas_used
+        for recipient, amount in zip(recipients, amounts)
+    )
+    gas_benchmark.record_gas(f"transfer:looped_{recipients_number}", looped_gas)
+
+    tx = lottery.batchTransfer(recipients, amounts, {'from': sender})
+    gas_benchmark.record(f"batchTransfer:{recipients_number}", tx)
+
+    assert tx.gas_used < looped_gas
@@ -0,0 +1,141 @@
+#!/usr/bin/python3
+import warnings
+
+import pytest
+from brownie import chain, web3
+from brownie.test import strategy
+
+from gas_benchmark import WorstCaseGas
+
+pytestmark = pytest.mark.benchmark
+
+# generated accounts in addition to accounts[1:10]
+EXTRA_ACCOUNTS = 20
+# page size of the paginated views, large enough to read the whole list
+VIEW_PAGE = 1000
+# calls which change state must cost the same however long the history is
+STATE_FUNCTIONS = {
+    "fallback",
+    "buyTickets",
+    "transfer",
+    "approve",
+    "transferFrom",
+    "withdraw",
+    "startLottery",
+    "closePurchaseStage",
+    "completeLottery",
+}
+
+
+class GasFuzzer:
+    """Random interleaving of the player and the owner calls, gas of every call goes to the tracker"""
+
+    st_player = strategy("uint256", max_value=EXTRA_ACCOUNTS + 8)
+    st_other = strategy("uint256", max_value=EXTRA_ACCOUNTS + 8)
+    st_tickets = strategy("uint256", min_value=1, max_value=100)
+    st_tokens = strategy("uint256", min_value=1, max_value=50)
+    st_ether = strategy("uint256", min_value=10**16, max_value=10**18)
+    st_sleep = strategy("uint256", min_value=60, max_value=4000)
+
+    def __init__(cls, accounts, lottery, tracker):
+        cls.owner = accounts[0]
+        cls.players = list(accounts[1:10]) + [accounts.add() for _ in range(EXTRA_ACCOUNTS)]
+        for i, player in enumerate(cls.players[9:]):
+            accounts[i % 10].transfer(player, 5 * 10**18)
+        cls.lottery = lottery
+        cls.tracker = tracker
+
+    def _history(self):
+        return {
+            "players": self.lottery.getTicketOwnersPage(0, 0)[2],
+            "owners": self.lottery.getOwnersPage(0, 0)[2],
+            "rounds": self.lottery.getCurrentLotteryId(),
+        }
+
+    def _record(self, name, tx, **conditions):
+        self.tracker.record(name, tx.gas_used, self._history(), conditions)
+
+    def _status(self):
+        return self.lottery.getCurrentLotteryStatus()
+
+    def rule_deposit(self, st_player, st_ether):
+        player = self.players[st_player]
+        self._record("fallback", player.transfer(self.lottery, st_ether), value=st_ether)
+
+    def rule_buy_tickets(self, st_player, st_tickets):
+        player = self.players[st_player]
+        amount = min(st_tickets, self.lottery.balanceOf(player))
+        if self._status() == "PurchaseTickets" and amount > 0:
+            self._record("buyTickets", self.lottery.buyTickets(amount, {'from': player}), amount=amount)
+
+    def rule_transfer(self, st_player, st_other, st_tokens):
+        sender, recipient = self.players[st_player], self.players[st_other]
+        if self.lottery.balanceOf(sender) >= st_tokens:
+            tx = self.lottery.transfer(recipient, st_tokens, {'from': sender})
+            self._record("transfer", tx, amount=st_tokens)
+
+    def rule_approve(self, st_player, st_other, st_tokens):
+        owner, spender = self.players[st_player], self.players[st_other]
+        self._record("approve", self.lottery.approve(spender, st_tokens, {'from': owner}), amount=st_tokens)
+
+    def rule_transfer_from(self, st_player, st_other, st_tokens):
+        owner, spender = self.players[st_player], self.players[st_other]
+        amount = min(st_tokens, self.lottery.allowance(owner, spender), self.lottery.balanceOf(owner))
+        if amount > 0:
+            tx = self.lottery.transferFrom(owner, spender, amount, {'from': spender})
+            self._record("transferFrom", tx, amount=amount)
+
+    def rule_withdraw(self, st_player, st_tokens):
+        player = self.players[st_player]
+        if self.lottery.balanceOf(player) >= st_tokens:
+            self._record("withdraw", self.lottery.withdraw(st_tokens, {'from': player}), amount=st_tokens)
+
+    def rule_start(self):
+        if self._status() in ("NotStarted", "Completed"):
+            self._record("startLottery", self.lottery.startLottery({'from': self.owner}))
+
+    def rule_sleep(self, st_sleep):
+        chain.sleep(st_sleep)
+
+    def rule_close(self):
+        lottery_id = self.lottery.getCurrentLotteryId()
+        # closing is optional, it only stores the status derived from time
+        if self._status() == "Closed" and self.lottery.allLotteries(lottery_id)[0] == 1:
+            self._record("closePurchaseStage", self.lottery.closePurchaseStage({'from': self.owner}))
+
+    def rule_complete(self):
+        if self._status() == "Closed":
+            tickets = self.lottery.getCurrentTotalPurchasedTickets()
+            self._record("completeLottery", self.lottery.completeLottery({'from': self.owner}), tickets=tickets)
+
+    def invariant_view_gas(self):
+        history = self._history()
+        views = [
+            ("getAllTicketOwners", self.lottery.getAllTicketOwners, ()),
+            ("getTicketOwnersPage", self.lottery.getTicketOwnersPage, (0, VIEW_PAGE)),
+            ("getOwnersPage", self.lottery.getOwnersPage, (0, VIEW_PAGE)),
+            ("getAmountOfTickets", self.lottery.getAmountOfTickets, (self.players[0],)),
+            ("getCurrentLotteryStatus", self.lottery.getCurrentLotteryStatus, ()),
+        ]
+        if history["rounds"]:
+            views.append(("getWinnerOfLottery", self.lottery.getWinnerOfLottery, ()))
+        for name, view, args in views:
+            self.tracker.record(name, view.estimate_gas(*args), history)
+
+
+def test_worst_case_gas(state_machine, accounts, lottery):
+    tracker = WorstCaseGas(web3.eth.get_block("latest").gasLimit)
+
+    state_machine(
+        GasFuzzer, accounts, lottery, tracker, settings={"max_examples": 20, "stateful_step_count": 50}
+    )
+
+    for name, (gas_used, conditions) in sorted(tracker.worst.items()):
+        print(f"{name}: max {gas_used} gas at {conditions}")
+    growing = tracker.growing()
+    for name, (size, slope) in sorted(growing.items()):
+        # the views returning whole lists are expected here, they are read off-chain only
+        warnings.warn(f"{name}: gas grows by {slope:.0f} per item of {size}")
+
+    assert not tracker.near_block_limit()
+    assert not STATE_FUNCTIONS & set(growing)
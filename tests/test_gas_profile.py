@@ -0,0 +1,34 @@
+#!/usr/bin/python3
+from scripts.gas_profile import GasProfile, intrinsic_gas, profile
+
+
+def test_profile_buy_tickets(open_lottery, accounts):
+    accounts[3].transfer(open_lottery, 3 * 10**18)
+    tx = open_lottery.buyTickets(200, {'from': accounts[3]})
+
+    result = GasProfile(tx)
+
+    assert result.by_function["Lottery._purchaseTickets"] > 0
+    assert any(op == "SSTORE" for _, op in result.storage_ops)
+    assert any(op == "SLOAD" for _, op in result.storage_ops)
+    assert any(line.startswith("contracts/Lottery.sol:") for line in result.by_line)
+    # nothing is refunded by buyTickets
+    assert 0 < result.total - result.stacks["intrinsic"] <= tx.gas_used
+
+
+def test_profile_collapsed_stacks(closed_lottery, accounts, tmp_path):
+    tx = closed_lottery.completeLottery({'from': accounts[0]})
+
+    result = profile(tx.txid, tmp_path / "completeLottery.folded")
+    lines = (tmp_path / "completeLottery.folded").read_text().splitlines()
+
+    assert lines == result.collapsed()
+    assert sum(int(line.rsplit(" ", 1)[1]) for line in lines) == result.total
+    assert any(line.startswith("Lottery.completeLottery;") for line in lines)
+    assert any(";SSTORE " in line for line in lines)
+
+
+def test_intrinsic_gas():
+    assert intrinsic_gas("0x") == 21000
+    assert intrinsic_gas("0x00ff0000") == 21000 + 3 * 4 + 16
+    assert intrinsic_gas(bytes(32)) == 21000 + 32 * 4
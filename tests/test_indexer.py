@@ -0,0 +1,73 @@
+#!/usr/bin/python3
+from scripts.indexer import LotteryIndexer
+
+
+def _play_lottery(lottery, accounts, chain):
+    lottery.startLottery({'from': accounts[0]})
+
+    lottery.buyTickets(10, {'from': accounts[1]})
+    lottery.buyTickets(30, {'from': accounts[2]})
+    lottery.buyTickets(10, {'from': accounts[1]})
+
+    chain.sleep(3601)  # 1 hour and 1 second (more than 1 hour)
+    lottery.closePurchaseStage({'from': accounts[0]})
+    lottery.completeLottery({'from': accounts[0]})
+
+
+def test_indexed_balances_and_rounds(lottery, accounts, chain, tmp_path):
+    accounts[1].transfer(lottery, 10**18)
+    accounts[2].transfer(lottery, 10**18)
+    lottery.transfer(accounts[3], 5, {'from': accounts[1]})
+    _play_lottery(lottery, accounts, chain)
+
+    indexer = LotteryIndexer(lottery, db_path=tmp_path / "index.sqlite", chunk_size=2)
+    indexer.sync()
+
+    for account in accounts[:4]:
+        assert indexer.balance_of(account) == lottery.balanceOf(account)
+    assert indexer.players(1) == [(accounts[1], 20), (accounts[2], 30)]
+    assert indexer.odds(1) == [(accounts[1], 20, 0.4), (accounts[2], 30, 0.6)]
+    assert indexer.winners() == [(1, lottery.getWinnerOfLotteryId(1), 50)]
+
+
+def test_resume_from_checkpoint(lottery, accounts, chain, tmp_path):
+    db_path = tmp_path / "index.sqlite"
+    accounts[1].transfer(lottery, 10**18)
+    accounts[2].transfer(lottery, 10**18)
+    _play_lottery(lottery, accounts, chain)
+
+    indexer = LotteryIndexer(lottery, db_path=db_path)
+    first_sync = indexer.sync()
+    indexer.close()
+
+    _play_lottery(lottery, accounts, chain)
+
+    indexer = LotteryIndexer(lottery, db_path=db_path)
+    second_sync = indexer.sync()
+
+    assert indexer.checkpoint == chain.height
+    assert second_sync < first_sync
+    assert indexer.sync() == 0
+    assert [row[0] for row in indexer.winners()] == [1, 2]
+    assert indexer.balance_of(accounts[1]) == lottery.balanceOf(accounts[1])
+
+
+def test_tickets_of_concurrent_pools(lottery, accounts, chain, tmp_path):
+    pool_id = lottery.createPool(600, 5, {'from': accounts[0]}).return_value
+    accounts[1].transfer(lottery, 10**18)
+    accounts[2].transfer(lottery, 10**18)
+
+    lottery.startLottery({'from': accounts[0]})
+    lottery.startLotteryInPool(pool_id, {'from': accounts[0]})
+    lottery.buyTicketsInPool(pool_id, 2, {'from': accounts[2]})
+    lottery.buyTickets(10, {'from': accounts[1]})
+    lottery.buyTicketsInPool(pool_id, 3, {'from': accounts[1]})
+    chain.sleep(601)
+    lottery.completeLotteryInPool(pool_id, {'from': accounts[0]})
+
+    indexer = LotteryIndexer(lottery, db_path=tmp_path / "index.sqlite")
+    indexer.sync()
+
+    assert indexer.players(1) == [(accounts[1], 10)]
+    assert indexer.players(2) == [(accounts[2], 2), (accounts[1], 3)]
+    assert indexer.winners() == [(2, lottery.getWinnerOfLotteryId(2), 25)]
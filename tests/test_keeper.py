@@ -0,0 +1,132 @@
+#!/usr/bin/python3
+import asyncio
+
+import pytest
+
+from scripts.keeper import LotteryKeeper
+
+
+@pytest.fixture
+def keeper(lottery, accounts):
+    keeper = LotteryKeeper(lottery, accounts[0], poll_interval=0.01, retry_delay=0)
+    yield keeper
+    keeper.close()
+
+
+def test_keeper_starts_lottery(lottery, keeper):
+    txs = asyncio.run(keeper.step())
+
+    assert [tx.fn_name for tx in txs] == ["startLotteryInPool"]
+    assert lottery.getCurrentLotteryStatus() == "PurchaseTickets"
+    assert keeper.metrics.summary()["start"]["rounds"] == 1
+
+
+def test_keeper_waits_for_purchase_stage(lottery, keeper, accounts, chain):
+    accounts[1].transfer(lottery, 10**18)
+    accounts[2].transfer(lottery, 10**18)
+    asyncio.run(keeper.step())
+    lottery.buyTickets(10, {'from': accounts[1]})
+    lottery.buyTickets(10, {'from': accounts[2]})
+
+    assert asyncio.run(keeper.step()) == []
+
+    chain.sleep(3601)  # 1 hour and 1 second (more than 1 hour)
+    txs = asyncio.run(keeper.step())
+
+    assert [tx.fn_name for tx in txs] == ["completeLotteryInPool"]
+    assert lottery.getCurrentLotteryStatus() == "Completed"
+    assert keeper.metrics.summary()["complete"]["rounds"] == 1
+
+    # the next round starts at the next step
+    txs = asyncio.run(keeper.step())
+
+    assert [tx.fn_name for tx in txs] == ["startLotteryInPool"]
+    assert lottery.getCurrentLotteryId() == 2
+
+
+def test_keeper_waits_for_second_ticket(lottery, keeper, accounts, chain):
+    accounts[1].transfer(lottery, 10**18)
+    asyncio.run(keeper.step())
+    lottery.buyTickets(1, {'from': accounts[1]})
+
+    chain.sleep(3601)  # 1 hour and 1 second (more than 1 hour)
+
+    assert asyncio.run(keeper.step()) == []
+    assert lottery.getCurrentLotteryStatus() == "PurchaseTickets"
+
+
+def test_keeper_pipelines_pools(lottery, accounts):
+    pool_id = lottery.createPool(600, 5, {'from': accounts[0]}).return_value
+    keeper = LotteryKeeper(lottery, accounts[0], pool_ids=[0, pool_id], poll_interval=0.01, retry_delay=0)
+
+    txs = asyncio.run(keeper.step())
+    keeper.close()
+
+    nonces = sorted(tx.nonce for tx in txs)
+    assert nonces[1] == nonces[0] + 1
+    assert lottery.getCurrentLotteryIdInPool(0) != 0
+    assert lottery.getCurrentLotteryIdInPool(pool_id) != 0
+
+
+def test_keeper_retries_reverting_call(lottery, accounts):
+    # not the owner of the contract, every call reverts
+    keeper = LotteryKeeper(lottery, accounts[1], poll_interval=0.01, max_retries=3, retry_delay=0)
+
+    assert asyncio.run(keeper.step()) == []
+    keeper.close()
+
+    assert keeper.metrics.retries == {"start": 3}
+    assert lottery.getCurrentLotteryId() == 0
+
+
+def test_keeper_executes_standing_orders(open_lottery, accounts, chain):
+    lottery = open_lottery
+    keeper = LotteryKeeper(lottery, accounts[0], poll_interval=0.01, retry_delay=0)
+    lottery.placeStandingOrder(5, 2, {'from': accounts[1]})
+
+    chain.sleep(3601)  # 1 hour and 1 second (more than 1 hour)
+    asyncio.run(keeper.step())
+    txs = asyncio.run(keeper.step())
+
+    assert [tx.fn_name for tx in txs] == ["startLotteryInPool", "executeStandingOrders"]
+    assert lottery.getAmountOfTickets(accounts[1]) == 5
+    assert lottery.getStandingOrder(accounts[1], 0) == (5, 0, 2, 0)
+
+    # the order is used up and isn't sent again
+    assert asyncio.run(keeper.step()) == []
+    keeper.close()
+
+
+class _LosingRace:
+    """The lottery with startLotteryInPool failing once after its eth_call succeeded"""
+
+    def __init__(self, lottery):
+        self._lottery = lottery
+        self.failures = 1
+
+    def __getattr__(self, name):
+        return getattr(self._lottery, name)
+
+    @property
+    def startLotteryInPool(self):
+        fn = self._lottery.startLotteryInPool
+
+        def send(*args):
+            if self.failures:
+                self.failures -= 1
+                raise ValueError("nonce too low")
+            return fn(*args)
+
+        send.call = fn.call
+        return send
+
+
+def test_keeper_survives_failed_send(lottery, accounts):
+    keeper = LotteryKeeper(_LosingRace(lottery), accounts[0], poll_interval=0.01, retry_delay=0)
+
+    txs = asyncio.run(keeper.step())
+    keeper.close()
+
+    assert [tx.fn_name for tx in txs] == ["startLotteryInPool"]
+    assert keeper.metrics.retries == {"start": 1}
+    assert lottery.getCurrentLotteryId() == 1
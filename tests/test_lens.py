@@ -0,0 +1,108 @@
+#!/usr/bin/python3
+import brownie
+
+
+def _play_lottery(lottery, accounts, chain):
+    lottery.startLottery({'from': accounts[0]})
+
+    lottery.buyTickets(10, {'from': accounts[1]})
+    lottery.buyTickets(20, {'from': accounts[2]})
+
+    chain.sleep(3601)  # 1 hour and 1 second (more than 1 hour)
+    lottery.closePurchaseStage({'from': accounts[0]})
+    lottery.completeLottery({'from': accounts[0]})
+
+
+def test_current_lottery_snapshot(lottery, lens, accounts):
+    accounts[1].transfer(lottery, 10**18)
+    accounts[2].transfer(lottery, 10**18)
+
+    lottery.startLottery({'from': accounts[0]})
+    lottery.buyTickets(10, {'from': accounts[1]})
+    lottery.buyTickets(20, {'from': accounts[2]})
+
+    snapshot = lens.getCurrentLotterySnapshot(0, 10)
+
+    assert snapshot["lotteryId"] == lottery.getCurrentLotteryId()
+    assert snapshot["lotteryStatus"] == lottery.getLotteryStatus(1)
+    assert snapshot["startingTimestamp"] == lottery.allLotteries(1)[2]
+    assert snapshot["prizePoolInTokens"] == 30
+    assert snapshot["totalPlayers"] == 2
+    assert snapshot["players"] == [accounts[1], accounts[2]]
+    assert snapshot["ticketAmounts"] == [10, 20]
+
+
+def test_completed_lottery_snapshot(lottery, lens, accounts, chain):
+    accounts[1].transfer(lottery, 10**18)
+    accounts[2].transfer(lottery, 10**18)
+    _play_lottery(lottery, accounts, chain)
+
+    snapshot = lens.getLotterySnapshot(1, 1, 10)
+
+    assert snapshot["winner"] == lottery.getWinnerOfLotteryId(1)
+    assert snapshot["closingTimestamp"] == lottery.allLotteries(1)[4]
+    assert snapshot["totalPlayers"] == 2
+    assert snapshot["players"] == [accounts[2]]
+    assert snapshot["ticketAmounts"] == [20]
+
+
+def test_lottery_snapshots_range(lottery, lens, accounts, chain):
+    accounts[1].transfer(lottery, 10**18)
+    accounts[2].transfer(lottery, 10**18)
+    for _ in range(3):
+        _play_lottery(lottery, accounts, chain)
+
+    snapshots = lens.getLotterySnapshots(1, 3, 1)
+
+    assert [snapshot["lotteryId"] for snapshot in snapshots] == [1, 2, 3]
+    assert [snapshot["winner"] for snapshot in snapshots] == [lottery.getWinnerOfLotteryId(i) for i in range(1, 4)]
+    assert all(snapshot["players"] == [accounts[1]] for snapshot in snapshots)
+
+
+def test_lottery_snapshots_invalid_range(lens):
+    with brownie.reverts():
+        lens.getLotterySnapshots(2, 1, 10)
+
+
+def test_chances_of_winning_in_basis_points(lottery, lens, accounts):
+    accounts[1].transfer(lottery, 10**18)
+    accounts[2].transfer(lottery, 3 * 10**18)
+    lottery.startLottery({'from': accounts[0]})
+    lottery.buyTickets(1, {'from': accounts[1]})
+    lottery.buyTickets(299, {'from': accounts[2]})
+
+    tickets, chances, total = lens.getCurrentChancesOfWinning([accounts[1], accounts[2], accounts[3]])
+
+    assert tickets == [1, 299, 0]
+    assert chances == [33, 9966, 0]
+    assert total == 300
+    # the same round in percents
+    assert lottery.getChanceOfWinning(accounts[1]) == 0
+    with brownie.reverts():
+        lottery.getChanceOfWinning(accounts[3])
+
+
+def test_chances_of_winning_in_pool(lottery, lens, accounts, chain):
+    pool_id = lottery.createPool(600, 5, {'from': accounts[0]}).return_value
+    accounts[1].transfer(lottery, 10**18)
+    accounts[2].transfer(lottery, 10**18)
+    lottery.startLotteryInPool(pool_id, {'from': accounts[0]})
+    lottery.buyTicketsInPool(pool_id, 1, {'from': accounts[1]})
+    lottery.buyTicketsInPool(pool_id, 3, {'from': accounts[2]})
+    chain.sleep(601)
+    lottery.completeLotteryInPool(pool_id, {'from': accounts[0]})
+
+    assert lens.getChancesOfWinning([accounts[2], accounts[1]], 1) == ([3, 1], [7500, 2500], 4)
+
+
+def test_chances_of_winning_of_many_players(lottery, lens, accounts):
+    accounts[1].transfer(lottery, 10**18)
+    lottery.startLottery({'from': accounts[0]})
+    lottery.buyTickets(10, {'from': accounts[1]})
+    players = [accounts[1]] + [f"0x{i:040x}" for i in range(1, 500)]
+
+    tickets, chances, total = lens.getChancesOfWinning(players, 1)
+
+    assert len(tickets) == len(chances) == 500
+    assert tickets[0] == 10 and chances[0] == 10000
+    assert sum(tickets[1:]) == sum(chances[1:]) == 0
@@ -0,0 +1,31 @@
+#!/usr/bin/python3
+from scripts.loadtest import LoadTest, TRAFFIC_MIXES
+
+
+def test_load_test_report(lottery, accounts):
+    lottery.startLottery({'from': accounts[0]})
+    load_test = LoadTest(lottery, accounts[1:3], accounts_amount=8, workers=4)
+
+    created = load_test.create_accounts()
+    report = load_test.run(60)
+    summary = report.summary()
+
+    assert len(created) == 8
+    assert report.transactions == 60
+    assert set(summary) <= set(TRAFFIC_MIXES["default"])
+    assert summary["deposit"]["reverts"] == 0
+    for stats in summary.values():
+        assert stats["latency_p50"] <= stats["latency_p90"] <= stats["latency_p99"]
+        assert 0 <= stats["reverts"] <= 1
+
+
+def test_load_test_buyers_mix(lottery, accounts):
+    lottery.startLottery({'from': accounts[0]})
+    load_test = LoadTest(lottery, accounts[1:2], accounts_amount=4, mix="buyers", workers=2)
+
+    report = load_test.run(20)
+
+    assert set(report.summary()) <= {"deposit", "buyTickets"}
+    assert lottery.getCurrentTotalPurchasedTickets() == sum(
+        lottery.getAmountOfTickets(account.address) for account in load_test.accounts
+    )
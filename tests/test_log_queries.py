@@ -0,0 +1,31 @@
+#!/usr/bin/python3
+from brownie import web3
+from eth_event import decode_logs, get_topic_map
+
+from scripts.log_queries import build_history, log_filter, purchases, scan_purchases
+
+
+def test_topic_filters_match_full_scan(lottery, accounts):
+    build_history(lottery, accounts[0], accounts[1:4], 3)
+
+    by_player_and_round = purchases(lottery, player=accounts[2], lottery_id=2)
+    by_round = purchases(lottery, lottery_id=2)
+    by_player = purchases(lottery, player=accounts[2])
+
+    assert [event["data"][3]["value"] for event in by_player_and_round] == [2]
+    assert len(by_round) == 3
+    assert len(by_player) == 3
+    assert by_player_and_round == scan_purchases(lottery, player=accounts[2], lottery_id=2)
+    assert by_round == scan_purchases(lottery, lottery_id=2)
+    assert purchases(lottery, pool_id=1) == []
+
+
+def test_winning_filtered_by_round(historical_lottery):
+    lottery = historical_lottery
+
+    logs = web3.eth.get_logs(log_filter(lottery, "Winning", None, 3))
+    events = decode_logs(logs, get_topic_map(lottery.abi))
+
+    assert len(events) == 1
+    assert events[0]["data"][0]["value"] == lottery.getWinnerOfLotteryId(3)
+    assert events[0]["data"][2]["value"] == 20
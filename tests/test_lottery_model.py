@@ -0,0 +1,160 @@
+#!/usr/bin/python3
+import brownie
+import pytest
+from brownie import chain
+from brownie.test import strategy
+
+# the model needs numpy, which isn't a dependency of brownie
+np = pytest.importorskip("numpy")
+
+from scripts.lottery_model import (  # noqa: E402
+    LotteryModel,
+    Revert,
+    chance_of_winning,
+    deposit_tokens,
+    draw_winning_number,
+    find_ticket_owners,
+    simulate_rounds,
+    win_frequencies,
+)
+
+
+def test_find_ticket_owners():
+    purchases = np.array([[3, 0, 2, 5], [1, 1, 1, 1]])
+
+    assert find_ticket_owners(purchases, [0, 3]).tolist() == [0, 3]
+    assert find_ticket_owners(purchases, [2, 0]).tolist() == [0, 0]
+    # a purchase of 0 tickets never wins
+    assert find_ticket_owners(purchases, [3, 1]).tolist() == [2, 1]
+    assert find_ticket_owners(purchases, [9, 2]).tolist() == [3, 2]
+
+
+def test_simulate_rounds():
+    rng = np.random.default_rng(0)
+    purchases = np.array([[1, 0], [2, 3], [0, 0]])
+
+    results = simulate_rounds(purchases, rng)
+
+    assert results["completed"].tolist() == [False, True, False]
+    assert results["winners"][0] == results["winners"][2] == -1
+    assert results["payouts"].tolist() == [0, 4, 0]
+    assert results["commissions"].sum() == 1
+
+
+def test_win_frequencies_match_odds():
+    tickets = np.array([1, 10, 30, 59])
+
+    frequencies = win_frequencies(tickets, 200000, np.random.default_rng(0))
+
+    assert np.allclose(frequencies, tickets / tickets.sum(), atol=0.005)
+    assert chance_of_winning(tickets, tickets.sum()).tolist() == [1, 10, 30, 59]
+
+
+def test_draw_winning_number():
+    assert draw_winning_number(0, 0, 1) == 0
+    assert 0 <= draw_winning_number(131072, 1600000000, 7) < 7
+    assert deposit_tokens([10**16 - 1, 10**18, 15 * 10**15]).tolist() == [0, 100, 1]
+
+
+class DifferentialLottery:
+    """Random calls applied to the contract and to the model, the results and the state must match"""
+
+    st_player = strategy("uint256", max_value=3)
+    st_other = strategy("uint256", max_value=3)
+    st_wei = strategy("uint256", min_value=10**15, max_value=10**18)
+    st_tickets = strategy("uint256", min_value=0, max_value=60)
+    st_tokens = strategy("uint256", max_value=60)
+
+    def __init__(cls, accounts, lottery):
+        cls.owner = accounts[0]
+        cls.players = list(accounts[1:5])
+        cls.lottery = lottery
+
+    def setup(self):
+        self.model = LotteryModel(self.owner.address)
+
+    def _apply(self, call, apply_model):
+        try:
+            expected = apply_model()
+        except Revert as revert:
+            with brownie.reverts(str(revert)):
+                call()
+            return None
+        call()
+        return expected
+
+    def rule_deposit(self, st_player, st_wei):
+        player = self.players[st_player]
+        self._apply(
+            lambda: player.transfer(self.lottery, st_wei),
+            lambda: self.model.deposit(player.address, st_wei),
+        )
+
+    def rule_buy_tickets(self, st_player, st_tickets):
+        player = self.players[st_player]
+        self._apply(
+            lambda: self.lottery.buyTickets(st_tickets, {'from': player}),
+            lambda: self.model.buy_tickets(player.address, st_tickets, chain.time()),
+        )
+
+    def rule_deposit_and_buy_tickets(self, st_player, st_tickets, st_wei):
+        player = self.players[st_player]
+        self._apply(
+            lambda: self.lottery.depositAndBuyTickets(st_tickets, {'from': player, 'value': st_wei}),
+            lambda: self.model.deposit_and_buy_tickets(player.address, st_tickets, st_wei, chain.time()),
+        )
+
+    def rule_transfer(self, st_player, st_other, st_tokens):
+        sender, recipient = self.players[st_player], self.players[st_other]
+        self._apply(
+            lambda: self.lottery.transfer(recipient, st_tokens, {'from': sender}),
+            lambda: self.model.transfer(sender.address, recipient.address, st_tokens),
+        )
+
+    def rule_withdraw(self, st_player, st_tokens):
+        player = self.players[st_player]
+        self._apply(
+            lambda: self.lottery.withdraw(st_tokens, {'from': player}),
+            lambda: self.model.withdraw(player.address, st_tokens),
+        )
+
+    def rule_start(self):
+        self._apply(
+            lambda: self.lottery.startLottery({'from': self.owner}),
+            lambda: self.model.start(self.owner.address, chain.time()),
+        )
+        if self.model.current is not None:
+            self.model.current["start"] = self.lottery.allLotteries(self.model.lottery_id)[2]
+
+    def rule_sleep(self):
+        chain.sleep(3601)  # 1 hour and 1 second (more than 1 hour)
+        chain.mine()
+
+    def rule_complete(self):
+        if self.model.status(chain.time()) != "Closed":
+            with brownie.reverts("Lottery::buyTickets: it is not possible to close lottery right now"):
+                self.lottery.completeLottery({'from': self.owner})
+            return
+        self.lottery.completeLottery({'from': self.owner})
+        # the block difficulty isn't known before the block, the winning ticket is taken from the contract
+        winning_ticket = self.lottery.allLotteries(self.model.lottery_id)[6]
+        winner = self.model.complete(self.owner.address, chain.time(), winning_ticket=winning_ticket)
+
+        assert self.lottery.getWinnerOfLottery() == winner
+
+    def invariant_state(self):
+        assert self.lottery.totalSupply() == self.model.total_supply
+        assert self.lottery.balance() == self.model.ether
+        # views run against the last mined block
+        assert self.lottery.getCurrentLotteryStatus() == self.model.status(chain[-1].timestamp)
+        assert self.lottery.getCurrentTotalPurchasedTickets() == self.model.prize_pool()
+        for player in [self.owner] + self.players:
+            assert self.lottery.balanceOf(player) == self.model.balance_of(player.address)
+            tickets = self.model.tickets_of(player.address)
+            assert self.lottery.getAmountOfTickets(player) == tickets
+            if tickets and self.model.prize_pool():
+                assert self.lottery.getChanceOfWinning(player) == self.model.chance_of_winning(player.address)
+
+
+def test_differential(state_machine, accounts, lottery):
+    state_machine(DifferentialLottery, accounts, lottery, settings={"max_examples": 30, "stateful_step_count": 30})
@@ -0,0 +1,48 @@
+#!/usr/bin/python3
+
+
+def test_ticket_owners_pages(lottery, accounts):
+    lottery.startLottery({'from': accounts[0]})
+
+    players = accounts[1:6]
+    for i, player in enumerate(players):
+        player.transfer(lottery, 10**18)
+        lottery.buyTickets(i + 1, {'from': player})
+
+    first_page = lottery.getTicketOwnersPage(0, 3)
+    second_page = lottery.getTicketOwnersPage(3, 3)
+
+    assert first_page == (players[:3], [1, 2, 3], 5)
+    assert second_page == (players[3:], [4, 5], 5)
+
+
+def test_ticket_owners_page_in_lottery_id(lottery, accounts):
+    lottery.startLottery({'from': accounts[0]})
+
+    accounts[1].transfer(lottery, 10**18)
+    lottery.buyTickets(7, {'from': accounts[1]})
+    lottery.buyTickets(3, {'from': accounts[1]})
+
+    assert lottery.getTicketOwnersPageInLotteryId(1, 0, 10) == ([accounts[1]], [10], 1)
+    assert lottery.getTicketOwnersPageInLotteryId(2, 0, 10) == ([], [], 0)
+
+
+def test_page_out_of_range(lottery, accounts):
+    lottery.startLottery({'from': accounts[0]})
+
+    accounts[1].transfer(lottery, 10**18)
+    lottery.buyTickets(1, {'from': accounts[1]})
+
+    assert lottery.getTicketOwnersPage(1, 10) == ([], [], 1)
+    assert lottery.getTicketOwnersPage(0, 0) == ([], [], 1)
+
+
+def test_owners_pages(lottery, accounts):
+    for player in accounts[1:4]:
+        player.transfer(lottery, 10**18)
+
+    accounts_page, balances_page, total = lottery.getOwnersPage(1, 2)
+
+    assert total == 4  # contract owner is registered on deploy
+    assert accounts_page == accounts[1:3]
+    assert balances_page == [100, 100]
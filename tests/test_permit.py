@@ -0,0 +1,109 @@
+#!/usr/bin/python3
+import brownie
+import pytest
+from brownie import Lottery, chain
+from eth_account import Account
+from eth_account.messages import encode_typed_data
+
+
+@pytest.fixture
+def holder(lottery, accounts):
+    # brownie doesn't know the keys of the ganache accounts, the signer is a generated account
+    holder = accounts.add()
+    accounts[0].transfer(holder, 10**18)
+    holder.transfer(lottery, 5 * 10**17)
+    return holder
+
+
+def _permit_message(lottery, owner, spender, value, nonce, deadline):
+    return {
+        "types": {
+            "EIP712Domain": [
+                {"name": "name", "type": "string"},
+                {"name": "version", "type": "string"},
+                {"name": "chainId", "type": "uint256"},
+                {"name": "verifyingContract", "type": "address"},
+            ],
+            "Permit": [
+                {"name": "owner", "type": "address"},
+                {"name": "spender", "type": "address"},
+                {"name": "value", "type": "uint256"},
+                {"name": "nonce", "type": "uint256"},
+                {"name": "deadline", "type": "uint256"},
+            ],
+        },
+        "primaryType": "Permit",
+        "domain": {"name": "TrueLotteryCoin", "version": "1", "chainId": chain.id, "verifyingContract": lottery.address},
+        "message": {"owner": str(owner), "spender": str(spender), "value": value, "nonce": nonce, "deadline": deadline},
+    }
+
+
+def _sign(lottery, signer, owner, spender, value, nonce=None, deadline=None):
+    nonce = lottery.nonces(owner) if nonce is None else nonce
+    deadline = chain.time() + 3600 if deadline is None else deadline
+    message = _permit_message(lottery, owner, spender, value, nonce, deadline)
+    signed = Account.sign_typed_data(signer.private_key, full_message=message)
+    return owner, spender, value, deadline, signed.v, signed.r.to_bytes(32, "big"), signed.s.to_bytes(32, "big")
+
+
+def test_domain_separator(lottery, accounts):
+    message = _permit_message(lottery, accounts[1], accounts[2], 1, 0, 0)
+
+    assert lottery.DOMAIN_SEPARATOR() == "0x" + encode_typed_data(full_message=message).header.hex()
+
+
+def test_permit_and_transfer_from(lottery, holder, accounts):
+    tx = lottery.permit(*_sign(lottery, holder, holder, accounts[2], 30), {'from': accounts[2]})
+
+    assert tx.events["Approval"].values() == [holder, accounts[2], 30]
+    assert lottery.allowance(holder, accounts[2]) == 30
+    assert lottery.nonces(holder) == 1
+
+    lottery.transferFrom(holder, accounts[3], 30, {'from': accounts[2]})
+
+    assert lottery.balanceOf(accounts[3]) == 30
+    assert lottery.allowance(holder, accounts[2]) == 0
+
+
+def test_permit_replay(lottery, holder, accounts):
+    args = _sign(lottery, holder, holder, accounts[2], 30)
+    lottery.permit(*args, {'from': accounts[2]})
+
+    with brownie.reverts("Lottery::permit: invalid signature"):
+        lottery.permit(*args, {'from': accounts[2]})
+
+
+def test_permit_expired(lottery, holder, accounts):
+    args = _sign(lottery, holder, holder, accounts[2], 30, deadline=chain.time() - 1)
+
+    with brownie.reverts("Lottery::permit: signature expired"):
+        lottery.permit(*args, {'from': accounts[2]})
+
+
+def test_permit_signed_by_another_account(lottery, holder, accounts):
+    other = accounts.add()
+
+    with brownie.reverts("Lottery::permit: invalid signature"):
+        lottery.permit(*_sign(lottery, other, holder, accounts[2], 30), {'from': accounts[2]})
+
+    # the signature is bound to the value and to the contract
+    owner, spender, _, deadline, v, r, s = _sign(lottery, holder, holder, accounts[2], 30)
+    with brownie.reverts("Lottery::permit: invalid signature"):
+        lottery.permit(owner, spender, 31, deadline, v, r, s, {'from': accounts[2]})
+
+
+def test_permit_of_clone(lottery, factory, holder, accounts):
+    clone = Lottery.at(factory.createLottery({'from': accounts[1]}).return_value)
+
+    assert clone.DOMAIN_SEPARATOR() != lottery.DOMAIN_SEPARATOR()
+    with brownie.reverts("Lottery::permit: invalid signature"):
+        clone.permit(*_sign(lottery, holder, holder, accounts[2], 30), {'from': accounts[2]})
+
+
+def test_permit_gas(lottery, holder, accounts):
+    # the second approval of every kind writes to non-zero slots only, as most approvals do
+    holder_approvals = [lottery.approve(accounts[3], value, {'from': holder}) for value in (10, 20)]
+    permits = [lottery.permit(*_sign(lottery, holder, holder, accounts[2], value), {'from': accounts[2]}) for value in (10, 20)]
+
+    # nonce update, ecrecover and the signature in calldata
+    assert permits[1].gas_used - holder_approvals[1].gas_used < 20000
@@ -0,0 +1,99 @@
+#!/usr/bin/python3
+from pathlib import Path
+
+from chain_states import HISTORY_ROUNDS
+from scripts.gas_profile import GasProfile
+
+# source lines of Lottery.sol which read or write PlayerStats
+STATS_LINES = [
+    i + 1 for i, line in enumerate(Path("contracts/Lottery.sol").read_text().splitlines())
+    if "stats." in line or "playerStats[" in line
+]
+
+
+def _stats_gas(tx):
+    """Gas spent by the transaction on the PlayerStats lines"""
+    gas = 0
+    for line, line_gas in GasProfile(tx).by_line.items():
+        filename, number = line.rsplit(":", 1)
+        if Path(filename).name == "Lottery.sol" and int(number) in STATS_LINES:
+            gas += line_gas
+    return gas
+
+
+def test_stats_of_new_player(lottery, accounts):
+    assert lottery.getPlayerStats(accounts[1]) == (0, 0, 0, 0, 0)
+
+
+def test_stats_count_rounds_once(open_lottery, accounts):
+    lottery = open_lottery
+    lottery.buyTickets(5, {'from': accounts[1]})
+    lottery.depositAndBuyTickets(3, {'from': accounts[1], 'value': 10**17})
+
+    assert lottery.getPlayerStats(accounts[1]) == (18, 1, 0, 0, 1)
+
+
+def test_stats_of_winner(closed_lottery, accounts):
+    lottery = closed_lottery
+    lottery.completeLottery({'from': accounts[0]})
+    winner = lottery.getWinnerOfLottery()
+    loser = accounts[1] if winner == accounts[2] else accounts[2]
+
+    assert lottery.getPlayerStats(winner) == (10, 1, 1, 20 - 1, 1)  # 1 token commission
+    assert lottery.getPlayerStats(loser) == (10, 1, 0, 0, 1)
+
+
+def test_stats_of_claimed_prize(closed_lottery, accounts):
+    lottery = closed_lottery
+    lottery.drawLottery({'from': accounts[0]})
+    winner = lottery.getWinnerOfLotteryId(1)
+
+    assert lottery.getPlayerStats(winner)[2] == 0
+
+    lottery.claimPrize(1, {'from': accounts[3]})
+
+    assert lottery.getPlayerStats(winner)[2:4] == (1, 20 - 1)
+
+
+def test_lifetime_stats(historical_lottery, accounts):
+    lottery = historical_lottery
+    stats = [lottery.getPlayerStats(player) for player in accounts[1:3]]
+
+    for total_tickets, rounds_played, _, _, last_lottery_id in stats:
+        assert total_tickets == 10 * HISTORY_ROUNDS
+        assert rounds_played == HISTORY_ROUNDS
+        assert last_lottery_id == HISTORY_ROUNDS
+    assert sum(wins for _, _, wins, _, _ in stats) == HISTORY_ROUNDS
+    for player, (_, _, wins, total_winnings, _) in zip(accounts[1:3], stats):
+        assert total_winnings == wins * (20 - 1)
+        assert wins == sum(
+            lottery.getWinnerOfLotteryId(lottery_id) == player for lottery_id in range(1, HISTORY_ROUNDS + 1)
+        )
+
+
+def test_stats_across_pools(lottery, accounts):
+    pool_id = lottery.createPool(600, 5, {'from': accounts[0]}).return_value
+    accounts[1].transfer(lottery, 10**18)
+    lottery.startLottery({'from': accounts[0]})
+    lottery.startLotteryInPool(pool_id, {'from': accounts[0]})
+
+    lottery.buyTicketsInPool(pool_id, 2, {'from': accounts[1]})
+    lottery.buyTickets(4, {'from': accounts[1]})
+    lottery.buyTicketsInPool(pool_id, 1, {'from': accounts[1]})
+
+    assert lottery.getPlayerStats(accounts[1]) == (7, 2, 0, 0, 1)
+
+
+def test_stats_update_gas(open_lottery, accounts):
+    lottery = open_lottery
+    accounts[3].transfer(lottery, 10**18)
+
+    # accounts[3] has never bought tickets, accounts[1] buys again in the same round
+    first = lottery.buyTickets(5, {'from': accounts[3]})
+    repeat = lottery.buyTickets(5, {'from': accounts[1]})
+
+    # the first purchase ever fills the zero slot, later ones rewrite it
+    assert _stats_gas(first) < 25000
+    assert _stats_gas(repeat) < 7000
+    # buyTickets without the statistics costs at least 5 times more than the update
+    assert _stats_gas(repeat) * 5 < repeat.gas_used - _stats_gas(repeat)
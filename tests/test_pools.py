@@ -0,0 +1,132 @@
+#!/usr/bin/python3
+import brownie
+
+
+def _create_pool(lottery, accounts, purchase_stage=600, ticket_price=5):
+    tx = lottery.createPool(purchase_stage, ticket_price, {'from': accounts[0]})
+    return tx.return_value
+
+
+def test_default_pool(lottery):
+    assert lottery.getPoolsCount() == 1
+    assert lottery.pools(0) == (3600, 1, 0, 0)
+
+
+def test_create_pool(lottery, accounts):
+    tx = lottery.createPool(600, 5, {'from': accounts[0]})
+
+    assert tx.return_value == 1
+    assert lottery.getPoolsCount() == 2
+    assert lottery.pools(1) == (600, 5, 0, 0)
+    assert tx.events["CreatingPool"].values() == [1, 600, 5]
+
+
+def test_create_pool_from_non_contract_owner(lottery, accounts):
+    with brownie.reverts():
+        lottery.createPool(600, 5, {'from': accounts[1]})
+
+
+def test_create_pool_with_zero_price(lottery, accounts):
+    with brownie.reverts("Lottery::createPool: ticket price must be positive"):
+        lottery.createPool(600, 0, {'from': accounts[0]})
+
+
+def test_start_lottery_in_not_existing_pool(lottery, accounts):
+    with brownie.reverts("Lottery: pool doesn't exist"):
+        lottery.startLotteryInPool(1, {'from': accounts[0]})
+
+
+def test_concurrent_lotteries(lottery, accounts):
+    pool_id = _create_pool(lottery, accounts)
+
+    lottery.startLottery({'from': accounts[0]})
+    lottery.startLotteryInPool(pool_id, {'from': accounts[0]})
+
+    assert lottery.getCurrentLotteryId() == 1
+    assert lottery.getCurrentLotteryIdInPool(pool_id) == 2
+    assert lottery.getPoolOfLotteryId(1) == 0
+    assert lottery.getPoolOfLotteryId(2) == pool_id
+    assert lottery.getCurrentLotteryStatusInPool(pool_id) == "PurchaseTickets"
+
+
+def test_buy_tickets_in_pool(lottery, accounts):
+    pool_id = _create_pool(lottery, accounts)
+    accounts[1].transfer(lottery, 10**18)
+
+    lottery.startLottery({'from': accounts[0]})
+    lottery.startLotteryInPool(pool_id, {'from': accounts[0]})
+
+    lottery.buyTicketsInPool(pool_id, 10, {'from': accounts[1]})
+    lottery.buyTickets(3, {'from': accounts[1]})
+
+    assert lottery.balanceOf(accounts[1]) == 100 - 10 * 5 - 3
+    assert lottery.getAmountOfTicketsInPool(accounts[1], pool_id) == 10
+    assert lottery.getAmountOfTicketsInLotteryId(accounts[1], 2) == 10
+    assert lottery.getTotalPurchasedTicketsInLotteryId(2) == 10
+    assert lottery.getAmountOfTickets(accounts[1]) == 3
+    assert lottery.getCurrentTotalPurchasedTickets() == 3
+
+
+def test_buy_tickets_in_pool_without_enough_tokens(lottery, accounts):
+    pool_id = _create_pool(lottery, accounts)
+    accounts[1].transfer(lottery, 10**18)
+    lottery.startLotteryInPool(pool_id, {'from': accounts[0]})
+
+    with brownie.reverts("Lottery::buyTickets: you don't have enough TLC on your balance"):
+        lottery.buyTicketsInPool(pool_id, 21, {'from': accounts[1]})
+
+
+def test_deposit_and_buy_tickets_in_pool(lottery, accounts):
+    pool_id = _create_pool(lottery, accounts)
+    lottery.startLotteryInPool(pool_id, {'from': accounts[0]})
+
+    lottery.depositAndBuyTicketsInPool(pool_id, 4, {'from': accounts[1], 'value': 10**18 // 4})
+
+    assert lottery.getAmountOfTicketsInPool(accounts[1], pool_id) == 4
+    assert lottery.balanceOf(accounts[1]) == 25 - 4 * 5
+
+
+def test_pools_complete_independently(lottery, accounts, chain):
+    pool_id = _create_pool(lottery, accounts, purchase_stage=600)
+    accounts[1].transfer(lottery, 10**18)
+    accounts[2].transfer(lottery, 10**18)
+
+    lottery.startLottery({'from': accounts[0]})
+    lottery.startLotteryInPool(pool_id, {'from': accounts[0]})
+    lottery.buyTickets(10, {'from': accounts[1]})
+    lottery.buyTickets(10, {'from': accounts[2]})
+    lottery.buyTicketsInPool(pool_id, 4, {'from': accounts[1]})
+    lottery.buyTicketsInPool(pool_id, 6, {'from': accounts[2]})
+
+    chain.sleep(601)
+
+    # the default pool has a purchase stage of 1 hour
+    with brownie.reverts():
+        lottery.closePurchaseStage({'from': accounts[0]})
+
+    lottery.closePurchaseStageInPool(pool_id, {'from': accounts[0]})
+    tx = lottery.completeLotteryInPool(pool_id, {'from': accounts[0]})
+
+    winner = lottery.getWinnerOfLotteryInPool(pool_id)
+    assert winner in [accounts[1], accounts[2]]
+    assert tx.events["Winning"].values() == [winner, 2, 50]
+    assert lottery.getCurrentLotteryStatus() == "PurchaseTickets"
+
+    # next round of the pool is started while the default pool is still running
+    lottery.startLotteryInPool(pool_id, {'from': accounts[0]})
+
+    assert lottery.getCurrentLotteryIdInPool(pool_id) == 3
+    assert lottery.getWinnerOfLotteryInPool(pool_id) == winner
+    assert lottery.getWinnerOfLottery() == "0x0000000000000000000000000000000000000000"
+
+
+def test_close_pool_with_one_ticket(lottery, accounts, chain):
+    pool_id = _create_pool(lottery, accounts)
+    accounts[1].transfer(lottery, 10**18)
+    lottery.startLotteryInPool(pool_id, {'from': accounts[0]})
+    lottery.buyTicketsInPool(pool_id, 1, {'from': accounts[1]})
+
+    chain.sleep(601)
+
+    with brownie.reverts():
+        lottery.closePurchaseStageInPool(pool_id, {'from': accounts[0]})
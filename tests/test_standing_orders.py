@@ -0,0 +1,121 @@
+#!/usr/bin/python3
+import brownie
+
+
+def _next_round(lottery, accounts, chain):
+    chain.sleep(3601)  # 1 hour and 1 second (more than 1 hour)
+    lottery.completeLottery({'from': accounts[0]})
+    lottery.startLottery({'from': accounts[0]})
+
+
+def test_order_enters_current_round(open_lottery, accounts):
+    lottery = open_lottery
+    balance = lottery.balanceOf(accounts[1])
+
+    tx = lottery.placeStandingOrder(5, 3, {'from': accounts[1]})
+
+    assert tx.events["PlacingStandingOrder"].values() == [accounts[1], 0, 5, 3]
+    assert lottery.balanceOf(accounts[1]) == balance - 15
+    assert lottery.getAmountOfTickets(accounts[1]) == 15
+    assert lottery.getCurrentTotalPurchasedTickets() == 25
+    assert lottery.getStandingOrder(accounts[1], 0) == (5, 2, 1, 10)
+
+
+def test_order_without_tokens(open_lottery, accounts):
+    with brownie.reverts("Lottery::placeStandingOrder: you don't have enough TLC on your balance"):
+        open_lottery.placeStandingOrder(10, 10, {'from': accounts[1]})
+
+
+def test_order_executed_by_anyone(open_lottery, accounts, chain):
+    lottery = open_lottery
+    lottery.placeStandingOrder(5, 3, {'from': accounts[1]})
+    _next_round(lottery, accounts, chain)
+
+    assert lottery.getAmountOfTickets(accounts[1]) == 0
+
+    tx = lottery.executeStandingOrders(0, [accounts[1], accounts[2]], {'from': accounts[5]})
+
+    assert tx.return_value == 1
+    assert lottery.getAmountOfTickets(accounts[1]) == 5
+    assert lottery.getAllTicketOwners() == [accounts[1]]
+    assert lottery.executeStandingOrders(0, [accounts[1]], {'from': accounts[5]}).return_value == 0
+    assert lottery.getAmountOfTickets(accounts[1]) == 5
+
+
+def test_order_applied_on_interaction(open_lottery, accounts, chain):
+    lottery = open_lottery
+    lottery.placeStandingOrder(5, 3, {'from': accounts[1]})
+    lottery.placeStandingOrder(2, 3, {'from': accounts[2]})
+    _next_round(lottery, accounts, chain)
+
+    lottery.buyTickets(1, {'from': accounts[1]})
+    accounts[2].transfer(lottery, 10**16)
+
+    assert lottery.getAmountOfTickets(accounts[1]) == 6
+    assert lottery.getAmountOfTickets(accounts[2]) == 2
+    assert lottery.getAllTicketOwners() == [accounts[1], accounts[2]]
+
+
+def test_orders_settle_round(open_lottery, accounts, chain):
+    lottery = open_lottery
+    lottery.placeStandingOrder(5, 2, {'from': accounts[1]})
+    lottery.placeStandingOrder(5, 2, {'from': accounts[2]})
+    _next_round(lottery, accounts, chain)
+    lottery.executeStandingOrders(0, [accounts[1], accounts[2]], {'from': accounts[5]})
+
+    chain.sleep(3601)  # 1 hour and 1 second (more than 1 hour)
+    lottery.completeLottery({'from': accounts[0]})
+
+    assert lottery.getWinnerOfLottery() in [accounts[1], accounts[2]]
+    assert lottery.getTotalPurchasedTicketsInLotteryId(2) == 10
+    assert lottery.getStandingOrder(accounts[1], 0) == (5, 0, 2, 0)
+
+    # the order is used up
+    lottery.startLottery({'from': accounts[0]})
+    assert lottery.executeStandingOrders(0, [accounts[1], accounts[2]], {'from': accounts[5]}).return_value == 0
+
+
+def test_execute_outside_purchase_stage(closed_lottery, accounts):
+    with brownie.reverts("Lottery::executeStandingOrders: lottery is not in the purchase stage"):
+        closed_lottery.executeStandingOrders(0, [accounts[1]], {'from': accounts[5]})
+
+
+def test_cancel_order(open_lottery, accounts):
+    lottery = open_lottery
+    balance = lottery.balanceOf(accounts[1])
+    lottery.placeStandingOrder(5, 3, {'from': accounts[1]})
+
+    tx = lottery.cancelStandingOrder({'from': accounts[1]})
+
+    assert tx.events["CancelingStandingOrder"].values() == [accounts[1], 0, 10]
+    assert lottery.balanceOf(accounts[1]) == balance - 5
+    assert lottery.getStandingOrder(accounts[1], 0)[1:] == (0, 1, 0)
+
+    with brownie.reverts("Lottery::cancelStandingOrder: there is no active standing order"):
+        lottery.cancelStandingOrder({'from': accounts[1]})
+
+
+def test_replaced_order_does_not_enter_round_twice(open_lottery, accounts):
+    lottery = open_lottery
+    lottery.placeStandingOrder(5, 3, {'from': accounts[1]})
+    balance = lottery.balanceOf(accounts[1])
+
+    lottery.placeStandingOrder(2, 2, {'from': accounts[1]})
+
+    assert lottery.getAmountOfTickets(accounts[1]) == 15
+    assert lottery.balanceOf(accounts[1]) == balance + 10 - 4
+    assert lottery.getStandingOrder(accounts[1], 0) == (2, 2, 1, 4)
+
+
+def test_order_in_pool(lottery, accounts, chain):
+    pool_id = lottery.createPool(600, 5, {'from': accounts[0]}).return_value
+    accounts[1].transfer(lottery, 10**18)
+    lottery.placeStandingOrderInPool(pool_id, 2, 4, {'from': accounts[1]})
+
+    assert lottery.balanceOf(accounts[1]) == 100 - 2 * 4 * 5
+
+    lottery.startLotteryInPool(pool_id, {'from': accounts[0]})
+    lottery.buyTicketsInPool(pool_id, 1, {'from': accounts[1]})
+
+    assert lottery.getAmountOfTicketsInPool(accounts[1], pool_id) == 3
+    assert lottery.getStandingOrder(accounts[1], pool_id) == (2, 3, 1, 30)
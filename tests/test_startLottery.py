@@ -11,12 +11,13 @@ def test_valid_start_first_lottery(lottery, accounts, chain):
 
     lottery.startLottery({'from': accounts[0]})
 
-    assert lottery.allLotteries(lottery_id + 1)[0] == lottery_id + 1  # increment lottery_id
+    assert lottery.getCurrentLotteryId() == lottery_id + 1  # increment lottery_id
     assert lottery.getCurrentLotteryStatus() == status
+    assert lottery.allLotteries(lottery_id + 1)[0] == 1  # Status.PurchaseTickets
+    assert lottery.allLotteries(lottery_id + 1)[1] == winner
     assert lottery.allLotteries(lottery_id + 1)[2] in range(start_time, start_time + 2)  # operations from above will take no more than a second
-    assert lottery.allLotteries(lottery_id + 1)[3] == close_time
-    assert lottery.allLotteries(lottery_id + 1)[4] == init_prize_pool
-    assert lottery.allLotteries(lottery_id + 1)[5] == winner
+    assert lottery.allLotteries(lottery_id + 1)[4] == close_time
+    assert lottery.allLotteries(lottery_id + 1)[5] == init_prize_pool
 
 
 def test_start_lottery_from_non_contract_owner(lottery, accounts):
@@ -31,42 +32,17 @@ def test_two_starts_lottery(lottery, accounts):
         lottery.startLottery({'from': accounts[0]})
 
 
-def test_start_lottery_after_it_was_closed_but_not_completed(lottery, accounts, chain):
-    accounts[1].transfer(lottery, 10**18)
-    accounts[2].transfer(lottery, 10**18)
-
-    lottery.startLottery({'from': accounts[0]})
-
-    lottery.buyTickets(10, {'from': accounts[1]})
-    lottery.buyTickets(10, {'from': accounts[2]})
-
-    chain.sleep(3601)  # 1 hour and 1 second (more than 1 hour)
-    lottery.closePurchaseStage({'from': accounts[0]})
-
-    assert (lottery.getCurrentLotteryStatus() == "Closed")
+def test_start_lottery_after_it_was_closed_but_not_completed(closed_lottery, accounts):
+    assert (closed_lottery.getCurrentLotteryStatus() == "Closed")
 
     with brownie.reverts():
-        lottery.startLottery({'from': accounts[0]})
-
+        closed_lottery.startLottery({'from': accounts[0]})
 
-def test_valid_start_next_lottery_after_it_was_completed(lottery, accounts, chain):
-    accounts[1].transfer(lottery, 10**18)
-    accounts[2].transfer(lottery, 10**18)
-
-    lottery.startLottery({'from': accounts[0]})
 
+def test_valid_start_next_lottery_after_it_was_completed(completed_lottery, accounts, chain):
+    lottery = completed_lottery
     lottery_id = 1
 
-    lottery.buyTickets(10, {'from': accounts[1]})
-    lottery.buyTickets(10, {'from': accounts[2]})
-
-    chain.sleep(3601)  # 1 hour and 1 second (more than 1 hour)
-    lottery.closePurchaseStage({'from': accounts[0]})
-
-    assert (lottery.getCurrentLotteryStatus() == "Closed")
-
-    lottery.completeLottery({'from': accounts[0]})
-
     status = "PurchaseTickets"
     start_time = chain.time()
     close_time = 0
@@ -75,12 +51,13 @@ def test_valid_start_next_lottery_after_it_was_completed(lottery, accounts, chai
 
     lottery.startLottery({'from': accounts[0]})
 
-    assert lottery.allLotteries(lottery_id + 1)[0] == lottery_id + 1  # increment lottery_id
+    assert lottery.getCurrentLotteryId() == lottery_id + 1  # increment lottery_id
     assert lottery.getCurrentLotteryStatus() == status
+    assert lottery.allLotteries(lottery_id + 1)[0] == 1  # Status.PurchaseTickets
+    assert lottery.allLotteries(lottery_id + 1)[1] == winner
     assert lottery.allLotteries(lottery_id + 1)[2] in range(start_time, start_time + 2)  # operations from above will take no more than a second
-    assert lottery.allLotteries(lottery_id + 1)[3] == close_time
-    assert lottery.allLotteries(lottery_id + 1)[4] == init_prize_pool
-    assert lottery.allLotteries(lottery_id + 1)[5] == winner
+    assert lottery.allLotteries(lottery_id + 1)[4] == close_time
+    assert lottery.allLotteries(lottery_id + 1)[5] == init_prize_pool
 
 
 def test_start_lottery_event_fires(lottery, accounts):
@@ -88,4 +65,13 @@ def test_start_lottery_event_fires(lottery, accounts):
     tx = lottery.startLottery({'from': accounts[0]})
 
     assert len(tx.events) == 1
-    assert tx.events["OpeningLottery"].values() == [lottery_id + 1]
+    assert tx.events["OpeningLottery"].values() == [lottery_id + 1, 0]
+
+
+def test_start_lottery_after_many_rounds(historical_lottery, accounts):
+    lottery_id = historical_lottery.getCurrentLotteryId()
+
+    historical_lottery.startLottery({'from': accounts[0]})
+
+    assert historical_lottery.getCurrentLotteryId() == lottery_id + 1
+    assert historical_lottery.getWinnerOfLottery() == historical_lottery.getWinnerOfLotteryId(lottery_id)
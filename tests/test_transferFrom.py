@@ -212,5 +212,5 @@ def test_transfer_event_fires(lottery, accounts):
     assert tx.events["Approval"].values() == [accounts[0], accounts[1], amount]
 
     tx = lottery.transferFrom(accounts[0], accounts[2], amount, {'from': accounts[1]})
-    assert len(tx.events) == 3
+    assert len(tx.events) == 2
     assert tx.events["Transfer"].values() == [accounts[0], accounts[2], amount]
\ No newline at end of file